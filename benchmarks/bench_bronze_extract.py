@@ -0,0 +1,96 @@
+"""
+Benchmark: silver extract, SELECT * vs column projection
+--------------------------------------------------------
+Loads a synthetic crm_sales_details bronze table (raw_row JSON, row_hash,
+mapped columns) into a temporary SQLite file and compares the old
+SELECT * extract with the projected read used by the silver pipelines.
+Reports wall time and the bytes of result values transferred.
+
+Pass --bronze to measure against the live bronze_db table instead.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m benchmarks.bench_bronze_extract --rows 500000
+    python -m benchmarks.bench_bronze_extract --bronze
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+from benchmarks.bench_raw_row import make_sales_frame
+from src.bronze.helper import add_raw_row, add_row_hash
+from src.silver.bronze_reader import read_bronze_table
+from src.silver.crm.crm_sales import schema_sales
+
+TABLE = "crm_sales_details"
+SOURCE_TO_BRONZE = {
+    "sls_ord_num": "sales_ord_num",
+    "sls_prd_key": "sales_prd_key",
+    "sls_cust_id": "sales_cust_id",
+    "sls_order_dt": "sales_order_date_raw",
+    "sls_ship_dt": "sales_ship_date_raw",
+    "sls_due_dt": "sales_due_date_raw",
+    "sls_sales": "sales_sales",
+    "sls_quantity": "sales_quantity",
+    "sls_price": "sales_price",
+}
+
+
+def result_bytes(df: pd.DataFrame) -> int:
+    """Bytes of the fetched values as sent in a text result set (NULL = 4)."""
+    total = 0
+    for column in df.columns:
+        values = df[column]
+        lengths = values.astype(str).str.len()
+        total += int(lengths.where(values.notna(), 4).sum())
+    return total
+
+
+def build_sqlite_bronze(rows: int, path: str):
+    df = add_row_hash(add_raw_row(make_sales_frame(rows)))
+    bronze = df.rename(columns=SOURCE_TO_BRONZE)
+    bronze["loaded_at"] = pd.Timestamp.now()
+    engine = create_engine(f"sqlite:///{path}")
+    bronze.to_sql(TABLE, engine, index=False, chunksize=50_000)
+    return engine
+
+
+def measure(label: str, read) -> tuple[float, int]:
+    start = time.perf_counter()
+    df = read()
+    seconds = time.perf_counter() - start
+    size = result_bytes(df)
+    print(f"  {label:<10}: {seconds:7.2f}s | {size / 1e6:9.1f} MB | {df.shape[1]} columns")
+    return seconds, size
+
+
+def run(rows: int, use_bronze: bool) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        if use_bronze:
+            from src.core.database import get_engine
+            engine = get_engine("bronze")
+            print(f"Table: bronze_db.{TABLE}")
+        else:
+            engine = build_sqlite_bronze(rows, os.path.join(tmp, "bronze.db"))
+            print(f"Table: {TABLE} (SQLite, {rows:,} rows)")
+
+        star_secs, star_bytes = measure("SELECT *", lambda: read_bronze_table(TABLE, engine=engine))
+        proj_secs, proj_bytes = measure(
+            "projected", lambda: read_bronze_table(TABLE, list(schema_sales), engine=engine)
+        )
+        engine.dispose()
+
+    print(f"  bytes saved : {1 - proj_bytes / star_bytes:.0%}")
+    print(f"  speedup     : {star_secs / proj_secs:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--bronze", action="store_true", help="read the live bronze_db table")
+    args = parser.parse_args()
+    run(args.rows, args.bronze)
@@ -0,0 +1,76 @@
+"""
+Benchmark: keep-latest deduplication
+------------------------------------
+Compares the legacy sort-based deduplicate_latest_by_date (copy, sort by
+key + date, drop_duplicates, then ~index.isin for the deleted rows)
+against the hash-based src.silver.dedup.keep_latest, on a synthetic
+customer frame with heavy duplication, and checks both keep the same
+(cst_id, cst_create_date_raw) pairs.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m benchmarks.bench_dedup --rows 5000000 --customers 500000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.silver.dedup import keep_latest
+
+
+def make_customer_frame(rows: int, customers: int, seed: int = 42) -> pd.DataFrame:
+    """cust_info-shaped frame: ~rows/customers versions of each cst_id."""
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(11000, 11000 + customers, rows)
+    dates = pd.Timestamp("2015-01-01") + pd.to_timedelta(rng.integers(0, 3650, rows), unit="D")
+    df = pd.DataFrame({
+        "cst_id": pd.Series(ids).astype(str).astype("string"),
+        "cst_key": ("AW" + pd.Series(ids).astype(str)).astype("string"),
+        "cst_firstname": rng.choice(["Jon", "Eugene", "Ruben", "Christy"], rows),
+        "cst_lastname": rng.choice(["Yang", "Huang", "Torres", "Zhu"], rows),
+        "cst_create_date_raw": dates,
+    })
+    df.loc[rng.random(rows) < 0.01, "cst_create_date_raw"] = pd.NaT
+    return df
+
+
+def legacy_dedup(df: pd.DataFrame, primary_key: str, date_col: str):
+    df = df.copy()
+    df_sorted = df.sort_values(by=[primary_key, date_col], ascending=[True, False])
+    kept_rows = df_sorted.drop_duplicates(subset=primary_key, keep="first")
+    deleted_rows = df_sorted[~df_sorted.index.isin(kept_rows.index)]
+    return kept_rows, deleted_rows
+
+
+def kept_pairs(df: pd.DataFrame) -> pd.DataFrame:
+    return df[["cst_id", "cst_create_date_raw"]].sort_values("cst_id").reset_index(drop=True)
+
+
+def run(rows: int, customers: int) -> None:
+    df = make_customer_frame(rows, customers)
+    print(f"Rows: {rows:,} | Customers: {customers:,} (~{rows / customers:.0f} versions each)")
+
+    start = time.perf_counter()
+    old_kept, old_deleted = legacy_dedup(df, "cst_id", "cst_create_date_raw")
+    old_secs = time.perf_counter() - start
+    print(f"  sort + drop_duplicates : {old_secs:7.2f}s")
+
+    start = time.perf_counter()
+    new_kept, new_deleted = keep_latest(df, ["cst_id"], "cst_create_date_raw")
+    new_secs = time.perf_counter() - start
+    print(f"  keep_latest (idxmax)   : {new_secs:7.2f}s")
+
+    assert len(new_deleted) == len(old_deleted)
+    assert kept_pairs(new_kept).equals(kept_pairs(old_kept)), "kept rows differ"
+    print(f"  speedup                : {old_secs / new_secs:.1f}x "
+          f"({len(new_kept):,} kept, {len(new_deleted):,} deleted, same result)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--customers", type=int, default=500_000)
+    args = parser.parse_args()
+    run(args.rows, args.customers)
@@ -0,0 +1,122 @@
+"""
+Benchmark: silver dtype backends
+--------------------------------
+Loads the raw CRM/ERP CSVs (repeated --repeat times) into a temporary
+SQLite bronze, then runs each silver table's extract + transform chain
+under the 'numpy' and 'pyarrow' dtype backends and reports wall time and
+the frame's memory (deep) per table, checking that both backends produce
+the same values.
+
+The pyarrow rows are skipped when pyarrow is not installed.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m benchmarks.bench_dtype_backend --repeat 50
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+from src.core.config import load_pipeline_config
+from src.core.paths import get_raw_data_path
+from src.silver.bronze_reader import _pyarrow_available, read_bronze_table, use_dtype_backend
+from src.silver.categorical import encode_categoricals
+from src.silver.crm import crm_customers, crm_products, crm_sales
+from src.silver.erp import erp_customers
+
+
+def customers(df: pd.DataFrame) -> pd.DataFrame:
+    df = crm_customers.normalize_data(crm_customers.enforce_schema(df, crm_customers.schema_customer))
+    encode_categoricals(df, "crm_customers_info")
+    return crm_customers.standardize_data(df)
+
+
+def products(df: pd.DataFrame) -> pd.DataFrame:
+    df = crm_products.normalize_data(crm_products.enforce_schema(df, crm_products.schema_products))
+    encode_categoricals(df, "crm_prd_info")
+    return crm_products.transform_crm_products(crm_products.standardize_data(df))
+
+
+def sales(df: pd.DataFrame) -> pd.DataFrame:
+    return crm_sales.transform_sales(df)[0]
+
+
+def erp_customers_chain(df: pd.DataFrame) -> pd.DataFrame:
+    df = erp_customers.enforce_schema(df, erp_customers.schema_customer)
+    df = erp_customers.standardize_customer_id(df)
+    encode_categoricals(df, "erp_cust_az12")
+    return erp_customers.apply_value_replacements(df, erp_customers.customer_replacemts)
+
+
+def locations(df: pd.DataFrame) -> pd.DataFrame:
+    df = erp_customers.enforce_schema(df, erp_customers.schema_location)
+    encode_categoricals(df, "erp_location_a101")
+    df = erp_customers.apply_value_replacements(df, erp_customers.location_replacements)
+    return erp_customers.transform_erp_cid_column(df)
+
+
+CHAINS: dict[str, tuple[list[str], Callable[[pd.DataFrame], pd.DataFrame]]] = {
+    "crm_customers_info": (list(crm_customers.schema_customer), customers),
+    "crm_prd_info": (list(crm_products.schema_products), products),
+    "crm_sales_details": (list(crm_sales.schema_sales), sales),
+    "erp_cust_az12": (list(erp_customers.schema_customer), erp_customers_chain),
+    "erp_location_a101": (list(erp_customers.schema_location), locations),
+}
+
+
+def build_sqlite_bronze(repeat: int, path: str):
+    """Bronze tables with the mapped columns of each raw source file."""
+    engine = create_engine(f"sqlite:///{path}")
+    for target in load_pipeline_config()["bronze"]["targets"]:
+        if target["name"] not in CHAINS:
+            continue
+        csv = get_raw_data_path(target["source"]) / target["file_name"]
+        raw = pd.read_csv(csv, dtype=str, keep_default_na=False)
+        raw.columns = raw.columns.str.lower()
+        bronze = pd.DataFrame({col: raw[src.lower()] for col, src in target["columns"].items()})
+        pd.concat([bronze] * repeat, ignore_index=True).to_sql(
+            target["name"], engine, index=False, chunksize=50_000
+        )
+    return engine
+
+
+def measure(table: str, engine, backend: str) -> tuple[float, float, pd.DataFrame]:
+    columns, chain = CHAINS[table]
+    with use_dtype_backend(backend):
+        start = time.perf_counter()
+        df = chain(read_bronze_table(table, columns, engine=engine))
+        seconds = time.perf_counter() - start
+    return seconds, df.memory_usage(deep=True, index=False).sum() / 1e6, df
+
+
+def same_values(left: pd.DataFrame, right: pd.DataFrame) -> bool:
+    as_objects = lambda df: df.astype(object).where(df.notna(), None).reset_index(drop=True)
+    return as_objects(left).equals(as_objects(right))
+
+
+def run(repeat: int) -> None:
+    backends = ["numpy"] + (["pyarrow"] if _pyarrow_available() else [])
+    if len(backends) == 1:
+        print("pyarrow is not installed; reporting the numpy backend only")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_sqlite_bronze(repeat, os.path.join(tmp, "bronze.db"))
+        for table in CHAINS:
+            results = {backend: measure(table, engine, backend) for backend in backends}
+            rows = len(results["numpy"][2])
+            line = " | ".join(f"{b}: {s:6.2f}s {mb:8.1f} MB" for b, (s, mb, _) in results.items())
+            print(f"  {table:<18} ({rows:>9,} rows) {line}")
+            if "pyarrow" in results:
+                assert same_values(results["numpy"][2], results["pyarrow"][2]), f"{table} differs"
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    run(args.repeat)
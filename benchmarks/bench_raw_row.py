@@ -0,0 +1,70 @@
+"""
+Benchmark: raw_row JSON builder
+-------------------------------
+Compares the legacy row-wise raw_row builder (DataFrame.apply + json.dumps
+per row) against the column-wise builder in src.bronze.helper, on a
+synthetic sales_details-shaped frame, and checks both produce identical text.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m benchmarks.bench_raw_row --rows 1000000
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.bronze.helper import build_raw_row
+
+
+def legacy_raw_row(df: pd.DataFrame) -> pd.Series:
+    """Row-wise builder used by the bronze loaders before vectorization."""
+    df_temp = df.where(pd.notnull(df), np.nan)
+    return df_temp.apply(lambda r: json.dumps(r.to_dict(), default=str), axis=1)
+
+
+def make_sales_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Synthetic frame with the same columns/value shapes as sales_details.csv."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2010-12-29", periods=1500).strftime("%Y%m%d").to_numpy()
+    df = pd.DataFrame({
+        "sls_ord_num": "SO" + pd.Series(rng.integers(43697, 75123, rows)).astype(str),
+        "sls_prd_key": rng.choice(["BK-R93R-62", "BK-M82S-44", "HL-U509-R", "FR-R92B-58"], rows),
+        "sls_cust_id": pd.Series(rng.integers(11000, 29483, rows)).astype(str),
+        "sls_order_dt": rng.choice(dates, rows),
+        "sls_ship_dt": rng.choice(dates, rows),
+        "sls_due_dt": rng.choice(dates, rows),
+        "sls_sales": pd.Series(rng.integers(2, 3578, rows)).astype(str),
+        "sls_quantity": "1",
+        "sls_price": pd.Series(rng.integers(2, 3578, rows)).astype(str),
+    }).astype(str)
+    # sprinkle missing values like the real feed
+    df.loc[rng.random(rows) < 0.01, "sls_price"] = np.nan
+    return df
+
+
+def run(rows: int) -> None:
+    df = make_sales_frame(rows)
+    print(f"Rows: {rows:,} | Columns: {df.shape[1]}")
+
+    start = time.perf_counter()
+    new = build_raw_row(df)
+    new_secs = time.perf_counter() - start
+    print(f"  column-wise : {new_secs:8.2f}s ({rows / new_secs:,.0f} rows/s)")
+
+    start = time.perf_counter()
+    old = legacy_raw_row(df)
+    old_secs = time.perf_counter() - start
+    print(f"  row-wise    : {old_secs:8.2f}s ({rows / old_secs:,.0f} rows/s)")
+
+    identical = bool((old.to_numpy() == new).all())
+    print(f"  identical   : {identical}")
+    print(f"  speedup     : {old_secs / new_secs:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    run(parser.parse_args().rows)
@@ -11,7 +11,9 @@ CREATE TABLE IF NOT EXISTS crm_customers_info (
   cst_marital_status VARCHAR(50) NULL,
   cst_gndr VARCHAR(50) NULL,            -- keep original field name from file
   cst_create_date_raw VARCHAR(100) NULL,-- raw date string if present
-  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  row_hash BIGINT NULL,                -- source row identity (append mode)
+  INDEX ix_crm_customers_info_row_hash (row_hash)
 );
 
 CREATE TABLE IF NOT EXISTS crm_prd_info (
@@ -24,7 +26,9 @@ CREATE TABLE IF NOT EXISTS crm_prd_info (
   prd_line VARCHAR(100) NULL,
   prd_start_date_raw VARCHAR(100) NULL,
   prd_end_date_raw VARCHAR(100) NULL,
-  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  row_hash BIGINT NULL,                -- source row identity (append mode)
+  INDEX ix_crm_prd_info_row_hash (row_hash)
 );
 
 CREATE TABLE IF NOT EXISTS crm_sales_details (
@@ -39,7 +43,9 @@ CREATE TABLE IF NOT EXISTS crm_sales_details (
   sales_sales DECIMAL(12,2) NULL,
   sales_quantity INT NULL,
   sales_price DECIMAL(12,2) NULL,
-  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  row_hash BIGINT NULL,                -- source row identity (append mode)
+  INDEX ix_crm_sales_details_row_hash (row_hash)
 );
 
 CREATE TABLE IF NOT EXISTS erp_cust_az12 (
@@ -48,14 +54,19 @@ CREATE TABLE IF NOT EXISTS erp_cust_az12 (
   cid VARCHAR(100) NULL,
   birth_date_raw VARCHAR(100) NULL,
   gender_raw VARCHAR(50) NULL,
-  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  row_hash BIGINT NULL,                -- source row identity (append mode)
+  INDEX ix_erp_cust_az12_row_hash (row_hash)
 );
 
 CREATE TABLE IF NOT EXISTS erp_location_a101 (
+  ingest_id BIGINT AUTO_INCREMENT PRIMARY KEY,
   raw_row JSON NOT NULL,
   cid VARCHAR(100) NULL,
   country_name VARCHAR(255) NULL,
-  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  row_hash BIGINT NULL,                -- source row identity (append mode)
+  INDEX ix_erp_location_a101_row_hash (row_hash)
 );
 
 CREATE TABLE IF NOT EXISTS erp_px_cat_g1v2 (
@@ -65,5 +76,7 @@ CREATE TABLE IF NOT EXISTS erp_px_cat_g1v2 (
   cat VARCHAR(100) NULL,
   subcat VARCHAR(100) NULL,
   maintenance_raw VARCHAR(100) NULL,
-  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  row_hash BIGINT NULL,                -- source row identity (append mode)
+  INDEX ix_erp_px_cat_g1v2_row_hash (row_hash)
 );
@@ -0,0 +1,153 @@
+"""
+Bronze Bulk Loader
+------------------
+Optional MySQL bulk-load path for bronze tables.
+
+The prepared frame is staged to a local temp file and pushed with
+LOAD DATA LOCAL INFILE, which is far cheaper than INSERT statements.
+If the server (or client) refuses LOCAL INFILE, the frame is written
+with batched inserts instead. The rows LOAD DATA reports as loaded are
+checked against the frame after every load (no COUNT(*) round trips).
+
+Usage:
+    from src.bronze.bulk_load import load_data_infile
+"""
+import json
+import os
+import tempfile
+
+import pandas as pd
+from sqlalchemy import text, types as sqltypes
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from src.core.logger import setup_logger
+from src.core.writer import write_dataframe
+
+logger = setup_logger(__name__.split(".")[-1])
+
+# MySQL error codes meaning "LOCAL INFILE is not permitted here"
+#   1148 ER_NOT_ALLOWED_COMMAND       (server local_infile=OFF, pre-8.0.19)
+#   3948 ER_CLIENT_LOCAL_FILES_DISABLED (server local_infile=OFF, 8.0.19+)
+#   2068 CR_LOAD_DATA_LOCAL_INFILE_REJECTED (client refused the file request)
+LOCAL_INFILE_DISABLED_CODES = {1148, 3948, 2068}
+
+def _mysql_error_code(error: DBAPIError) -> int | None:
+    """Return the MySQL error number behind a SQLAlchemy DBAPIError, if any."""
+    args = getattr(error.orig, "args", ())
+    return args[0] if args and isinstance(args[0], int) else None
+
+
+def _encode_infile_column(series: pd.Series) -> pd.Series:
+    """
+    Encode one column for LOAD DATA with ESCAPED BY '':
+    - non-null values are enclosed in double quotes, embedded quotes doubled
+    - NULLs are written as the bare word NULL
+    """
+    missing = series.isna()
+    encoded = '"' + series.astype(str).str.replace('"', '""', regex=False) + '"'
+    return encoded.mask(missing, "NULL")
+
+
+def write_infile(df: pd.DataFrame, path: str) -> None:
+    """Stage a frame as a headerless, fully-enclosed CSV for LOAD DATA."""
+    if df.empty:
+        open(path, "w", encoding="utf-8").close()
+        return
+
+    columns = [_encode_infile_column(df[c]) for c in df.columns]
+    lines = columns[0]
+    for column in columns[1:]:
+        lines = lines + "," + column
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("\n".join(lines.tolist()))
+        f.write("\n")
+
+
+def _is_json_type(sql_type) -> bool:
+    json_cls = sql_type if isinstance(sql_type, type) else type(sql_type)
+    return issubclass(json_cls, sqltypes.JSON)
+
+
+def _bind_json_columns(df: pd.DataFrame, dtype: dict | None) -> pd.DataFrame:
+    """
+    Serialize JSON-typed columns the way SQLAlchemy's JSON type does on the
+    INSERT path (json.dumps of the bound value), so both write paths store
+    identical values.
+    """
+    json_columns = [c for c, t in (dtype or {}).items() if c in df.columns and _is_json_type(t)]
+    if not json_columns:
+        return df
+    return df.assign(**{c: df[c].map(json.dumps, na_action="ignore") for c in json_columns})
+
+
+def load_data_infile(
+    df: pd.DataFrame,
+    table_name: str,
+    engine: Engine,
+    dtype: dict | None = None,
+    if_exists: str = "replace",
+) -> int:
+    """
+    Bulk-load a prepared bronze frame into MySQL.
+
+    Args:
+        df: Frame whose columns match the target table.
+        table_name: Target table in the engine's database.
+        engine: SQLAlchemy engine (created with local_infile enabled).
+        dtype: Optional {column: SQLAlchemy type} used when (re)creating the table.
+        if_exists: 'replace' recreates the table, 'append' keeps existing rows.
+
+    Returns:
+        Number of rows loaded.
+
+    Raises:
+        RuntimeError: if LOAD DATA reports a row count other than len(df)
+            (e.g. rows skipped on conversion errors).
+    """
+    # Let pandas own the DDL so both write paths produce the same table shape.
+    df.head(0).to_sql(
+        name=table_name,
+        con=engine,
+        if_exists=if_exists,
+        index=False,
+        dtype=dtype,  # type: ignore[arg-type]
+    )
+    loaded = 0
+    if not df.empty:
+        fd, infile_path = tempfile.mkstemp(prefix=f"{table_name}_", suffix=".csv")
+        os.close(fd)
+        try:
+            write_infile(_bind_json_columns(df, dtype), infile_path)
+            column_list = ", ".join(f"`{c}`" for c in df.columns)
+            statement = text(
+                f"LOAD DATA LOCAL INFILE :path INTO TABLE {table_name} "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                "LINES TERMINATED BY '\\n' "
+                f"({column_list})"
+            )
+            try:
+                with engine.begin() as conn:
+                    result = conn.execute(statement, {"path": infile_path.replace("\\", "/")})
+                # affected rows of LOAD DATA = rows inserted by this statement
+                loaded = int(result.rowcount)
+                logger.info(f"[BULK] LOAD DATA wrote {loaded} rows to '{table_name}'")
+            except DBAPIError as e:
+                if _mysql_error_code(e) not in LOCAL_INFILE_DISABLED_CODES:
+                    raise
+                logger.warning(
+                    f"[BULK] LOCAL INFILE not allowed for '{table_name}' "
+                    f"({e.orig}); falling back to batched inserts"
+                )
+                loaded = write_dataframe(df, table_name, engine, dtype=dtype, if_exists="append")["rows"]
+        finally:
+            os.remove(infile_path)
+
+    if loaded != len(df):
+        raise RuntimeError(
+            f"[BULK] Row count mismatch for '{table_name}': "
+            f"expected {len(df)} new rows, found {loaded}"
+        )
+    return loaded
@@ -1,8 +1,14 @@
+import io
 import os
+import csv
 import json
+import uuid
+from json.encoder import encode_basestring_ascii
 import pandas as pd
+from typing import Iterator
 import numpy as np
 from src.core.logger import setup_logger
+from src.core.paths import get_raw_archive_path
 
 logger = setup_logger(__name__.split(".")[-1])
 
@@ -22,14 +28,278 @@ def read_bronze_csv(csv_path: str) -> pd.DataFrame:
     return df
 
 
+def read_bronze_header(csv_path: str) -> list[str]:
+    """Normalized column names of a bronze CSV, without reading its rows."""
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"CSV not found at: {csv_path}")
+    columns = pd.read_csv(csv_path, dtype=str, nrows=0).columns
+    return list(columns.str.strip().str.lower())
+
+
+def read_bronze_csv_chunks(csv_path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Streaming variant of read_bronze_csv:
+    - yields fixed-size chunks of at most chunk_size rows
+    - reads all columns as string
+    - normalizes headers on every chunk
+    Only one chunk is held in memory at a time.
+    """
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"CSV not found at: {csv_path}")
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    total_rows = 0
+    with pd.read_csv(csv_path, dtype=str, chunksize=chunk_size) as reader:
+        for chunk_no, df in enumerate(reader):
+            df.columns = df.columns.str.strip().str.lower()
+            total_rows += len(df)
+            logger.debug(f"Chunk {chunk_no} from {csv_path} | Rows: {len(df)}")
+            yield df
+    logger.info(f"Streamed Bronze CSV from: {csv_path} | Rows: {total_rows}")
+
+
+def _encode_json_value(value) -> str:
+    """JSON-encode a single cell exactly like json.dumps(..., default=str)."""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    return json.dumps(value, default=str)
+
+
+def _encode_json_column(values: pd.Series) -> np.ndarray:
+    """
+    JSON-encode a whole column at once.
+    Each distinct value is encoded a single time and broadcast back to the
+    rows through its factorized code; missing cells encode as NaN.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    encoded = np.array(
+        [_encode_json_value(v) for v in uniques] + ["NaN"],
+        dtype=object,
+    )
+    return encoded[codes]
+
+
+def build_raw_row(df: pd.DataFrame) -> np.ndarray:
+    """
+    Column-wise raw_row builder.
+    Produces the same text as json.dumps(row.to_dict(), default=str) per row,
+    but serializes column arrays in bulk instead of one Series per row.
+    """
+    if len(df.columns) == 0:
+        return np.full(len(df), "{}", dtype=object)
+
+    raw = None
+    for position, column in enumerate(df.columns):
+        key = ("{" if position == 0 else ", ") + _encode_json_value(str(column)) + ": "
+        encoded = _encode_json_column(df[column])
+        raw = key + encoded if raw is None else raw + (key + encoded)
+    return raw + "}"
+
+
 def add_raw_row(df: pd.DataFrame) -> pd.DataFrame:
     """
     Adds raw_row JSON column for Bronze layer
     """
-    df_temp = df.where(pd.notnull(df), np.nan)
-    df["raw_row"] = df_temp.apply(
-        lambda r: json.dumps(r.to_dict(), default=str),
-        axis=1
-    )
+    df["raw_row"] = build_raw_row(df)
     logger.debug("Added 'raw_row' column to DataFrame")
     return df
+
+
+class OccurrenceCounter:
+    """
+    Running row counts per raw_row hash across the chunks of one file.
+
+    Keys and counts live in two sorted uint64 arrays: a chunk is looked up
+    with one searchsorted and merged with one np.insert, so there is no
+    per-value Python work however many distinct rows the file holds.
+    """
+
+    def __init__(self) -> None:
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def prior(self, values: np.ndarray) -> np.ndarray:
+        """
+        Rows already counted for each of values, then add values to the
+        counts (so the next chunk continues where this one ends).
+        """
+        uniques, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+        pos = np.searchsorted(self.keys, uniques)
+        found = pos < len(self.keys)
+        found[found] = self.keys[pos[found]] == uniques[found]
+
+        seen = np.zeros(len(uniques), dtype=np.uint64)
+        seen[found] = self.counts[pos[found]]
+        self.counts[pos[found]] += counts[found].astype(np.uint64)
+        new = ~found
+        if new.any():
+            self.keys = np.insert(self.keys, pos[new], uniques[new])
+            self.counts = np.insert(self.counts, pos[new], counts[new].astype(np.uint64))
+        return seen[inverse]
+
+
+def add_row_hash(df: pd.DataFrame, occurrences: OccurrenceCounter | None = None) -> pd.DataFrame:
+    """
+    Adds a row_hash BIGINT identifying each source row.
+
+    The hash covers the row's raw_row text (or, for frames without one as
+    in pointer mode, its source columns) plus its occurrence number, so
+    repeated identical rows keep distinct hashes and a re-read of the same
+    file reproduces the same values. Pass one OccurrenceCounter across the
+    chunks of a file to keep occurrence numbers running between chunks.
+    """
+    if "raw_row" in df.columns:
+        base = pd.util.hash_pandas_object(df["raw_row"], index=False)
+    else:
+        base = pd.util.hash_pandas_object(df, index=False)
+    occurrence = base.groupby(base, sort=False).cumcount().to_numpy(dtype=np.uint64)
+    if occurrences is not None:
+        occurrence = occurrence + occurrences.prior(base.to_numpy())
+
+    keyed = pd.DataFrame({"raw": base.to_numpy(), "occurrence": occurrence})
+    # stored signed so it fits BIGINT on MySQL and INTEGER on SQLite
+    df["row_hash"] = pd.util.hash_pandas_object(keyed, index=False).to_numpy().view(np.int64)
+    return df
+
+
+def _encode_csv_records(df: pd.DataFrame) -> tuple[bytes, np.ndarray]:
+    """
+    The rows of df as UTF-8 CSV records (minimal quoting, missing cells as
+    empty fields), and the byte length of each record.
+    """
+    rows = df.astype(object).where(df.notna(), None).to_numpy().tolist()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(rows)
+    data = buffer.getvalue().encode("utf-8")
+    ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n")) + 1
+    if len(ends) == len(rows):
+        return data, np.diff(ends, prepend=0)
+
+    # quoted values span lines: measure the records one at a time
+    lengths = np.empty(len(rows), dtype=np.int64)
+    for i, row in enumerate(rows):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(row)
+        lengths[i] = len(buffer.getvalue().encode("utf-8"))
+    return data, lengths
+
+
+class RawRowArchive:
+    """
+    Append-only CSV copy of the rows a pointer-mode target wrote to bronze.
+
+    Only inserted rows are archived (skipped append rows are already
+    archived), after a header line written once per load (and again if
+    the columns change), so the archive grows with the data actually
+    loaded, like the table itself. Pointers carry the byte offset and length of the record and
+    of its header, so lookup_raw_row() reads two short byte ranges.
+
+    A 'replace' load starts a fresh generation and, once the load has
+    succeeded, removes the older ones (no bronze row points at them any
+    more); an 'append' load extends the current generation. Use it as a
+    context manager around the load.
+    """
+
+    def __init__(self, file_ref: str, fresh: bool) -> None:
+        self.file_ref = file_ref
+        self.fresh = fresh
+        directory = get_raw_archive_path(file_ref, "-").parent
+        directory.mkdir(parents=True, exist_ok=True)
+        current = sorted(directory.glob("*.csv"), key=lambda path: path.stat().st_mtime_ns)
+        self.generation = uuid.uuid4().hex if fresh or not current else current[-1].stem
+        self.path = get_raw_archive_path(file_ref, self.generation)
+        self._header: tuple[list[str], int, int] | None = None
+        self._file = None
+
+    def __enter__(self) -> "RawRowArchive":
+        self._file = open(self.path, "ab")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._file.close()
+        if exc_type is None and self.fresh:
+            for path in self.path.parent.glob("*.csv"):
+                if path != self.path:
+                    path.unlink()
+            logger.info(f"[ARCHIVE] {self.file_ref}: generation {self.generation} replaces older ones")
+
+    def add(self, df: pd.DataFrame) -> np.ndarray:
+        """Archive the rows of df (source columns only) and return their pointers."""
+        columns = list(df.columns)
+        if self._header is None or self._header[0] != columns:
+            header, _ = _encode_csv_records(pd.DataFrame([columns]))
+            self._header = (columns, self._file.tell(), len(header))
+            self._file.write(header)
+        data, lengths = _encode_csv_records(df)
+        offsets = self._file.tell() + np.cumsum(lengths) - lengths
+        self._file.write(data)
+        _, header_offset, header_length = self._header
+        return encode_raw_row_pointers(
+            self.file_ref, self.generation, header_offset, header_length, offsets, lengths
+        )
+
+
+def encode_raw_row_pointers(
+    file_ref: str,
+    generation: str,
+    header_offset: int,
+    header_length: int,
+    offsets: np.ndarray,
+    lengths: np.ndarray,
+) -> np.ndarray:
+    """
+    Compact raw_row values: a JSON pointer to the archived row instead of a copy.
+
+    Each pointer is {"file": <source/file_name>, "gen": <archive generation>,
+    "header": [offset, length], "row": [offset, length]} in bytes of the
+    archive file; lookup_raw_row() turns it back into the original raw_row JSON.
+    """
+    prefix = (
+        '{"file": ' + _encode_json_value(file_ref)
+        + ', "gen": ' + _encode_json_value(generation)
+        + f', "header": [{int(header_offset)}, {int(header_length)}], "row": ['
+    )
+    return (
+        prefix + np.asarray(offsets).astype(str).astype(object)
+        + ", " + np.asarray(lengths).astype(str).astype(object) + "]}"
+    )
+
+
+def _parse_pointer(pointer) -> dict:
+    value = pointer
+    # values read back from a JSON column may be JSON-encoded more than once
+    while isinstance(value, str):
+        value = json.loads(value)
+    if not isinstance(value, dict) or not {"file", "gen", "header", "row"} <= value.keys():
+        raise ValueError(f"Not a raw_row pointer: {pointer!r}")
+    return value
+
+
+def lookup_raw_row(pointer) -> str:
+    """
+    Reconstruct the inline raw_row JSON for a pointer-mode bronze row.
+
+    Reads the row's record and header from the raw_row archive (see
+    RawRowArchive) by byte range and parses them like the source CSV.
+    """
+    ref = _parse_pointer(pointer)
+    path = get_raw_archive_path(ref["file"], ref["gen"])
+    if not path.exists():
+        raise ValueError(f"Archive generation {ref['gen']} of {ref['file']} is missing; cannot reconstruct the row")
+
+    with open(path, "rb") as f:
+        (header_offset, header_length), (offset, length) = ref["header"], ref["row"]
+        f.seek(header_offset)
+        header = f.read(header_length)
+        f.seek(offset)
+        record = f.read(length)
+    # a single-column row holding NULL is an empty line
+    df = pd.read_csv(io.BytesIO(header + record), dtype=str, skip_blank_lines=False)
+    df.columns = df.columns.str.strip().str.lower()
+    return build_raw_row(df)[0]
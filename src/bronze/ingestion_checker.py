@@ -1,5 +1,9 @@
 import os
+import mmap
+import hashlib
 import logging
+import sqlite3
+import threading
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -9,6 +13,16 @@ PROJECT_ROOT = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "..")
 )
 
+# Indexed ledger: one row per (source, file_name, bronze_table), keys are
+# stored lower-cased/stripped so lookups never normalize at read time.
+LEDGER_DB = os.path.join(
+    PROJECT_ROOT,
+    "data",
+    "processed",
+    "ingestion_ledger.db"
+)
+
+# Legacy CSV ledger; imported into LEDGER_DB the first time the DB is created.
 PROCESSED_FILE = os.path.join(
     PROJECT_ROOT,
     "data",
@@ -16,42 +30,223 @@ PROCESSED_FILE = os.path.join(
     "processed_files.csv"
 )
 
-def is_file_processed(source, file_name, bronze_table):
+# Bronze loaders may run on a thread pool; every ledger read/append goes
+# through this lock so a concurrent append is never observed half-written
+# and the in-memory ledger is loaded only once. Files are never hashed
+# while it is held, so one loader's hash does not stall the others.
+_LEDGER_LOCK = threading.Lock()
+
+#! In-memory view of the ledger, loaded once per process (per ledger path):
+#! normalized key -> (file_size, file_mtime_ns, content_hash), None when unknown
+_ledger: dict[tuple[str, str, str], tuple[int | None, int | None, str | None]] | None = None
+_ledger_path: str | None = None
+
+# (path, size, mtime_ns) -> content hash, so a file is hashed at most once per run
+_hash_cache: dict[tuple[str, int, int], str] = {}
+
+HASH_DIGEST_SIZE = 16
+HASH_READ_SIZE = 8 * 1024 * 1024
+
+FINGERPRINT_COLUMNS = {
+    "file_size": "INTEGER",
+    "file_mtime_ns": "INTEGER",
+    "content_hash": "TEXT",
+}
+
+
+def _normalize_key(source, file_name, bronze_table) -> tuple[str, str, str]:
+    return (
+        str(source).lower().strip(),
+        str(file_name).lower().strip(),
+        str(bronze_table).lower().strip(),
+    )
+
+
+def compute_file_hash(file_path) -> str:
     """
-    Check whether a (source, file, table) combination
-    has already been ingested into bronze.
+    BLAKE2b digest of a file's bytes.
+
+    The file is memory-mapped and fed to the hash in fixed-size slices, so
+    large CSVs are hashed without being copied into Python memory.
     """
-    if not os.path.exists(PROCESSED_FILE):
-        return False
+    h = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return h.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for offset in range(0, len(view), HASH_READ_SIZE):
+                    h.update(view[offset:offset + HASH_READ_SIZE])
+            finally:
+                view.release()
+    return h.hexdigest()
+
+
+def file_fingerprint(file_path) -> tuple[int, int, str]:
+    """Return (size, mtime_ns, content_hash) for a file, hashing at most once per version."""
+    st = os.stat(file_path)
+    cache_key = (os.path.abspath(file_path), st.st_size, st.st_mtime_ns)
+    digest = _hash_cache.get(cache_key)
+    if digest is None:
+        digest = compute_file_hash(file_path)
+        _hash_cache[cache_key] = digest
+    return st.st_size, st.st_mtime_ns, digest
+
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(LEDGER_DB), exist_ok=True)
+    return sqlite3.connect(LEDGER_DB, timeout=30)
 
-    if os.path.getsize(PROCESSED_FILE) == 0:
-        return False
 
+def _read_legacy_csv() -> list[tuple[str, str, str]]:
+    if not os.path.exists(PROCESSED_FILE) or os.path.getsize(PROCESSED_FILE) == 0:
+        return []
     try:
-        df = pd.read_csv(PROCESSED_FILE)
-    
+        df = pd.read_csv(PROCESSED_FILE, dtype=str)
     except pd.errors.EmptyDataError:
+        return []
+
+    df = df.dropna(subset=["source", "file_name", "bronze_table"])
+    return [
+        _normalize_key(s, f, t)
+        for s, f, t in zip(df["source"], df["file_name"], df["bronze_table"])
+    ]
+
+
+def _init_ledger(conn: sqlite3.Connection) -> None:
+    """Create the ledger table and migrate processed_files.csv into it once."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'processed_files'"
+    ).fetchone()
+    if exists:
+        # ledgers created before fingerprints were tracked get the new columns
+        present = {r[1] for r in conn.execute("PRAGMA table_info(processed_files)")}
+        with conn:
+            for col, col_type in FINGERPRINT_COLUMNS.items():
+                if col not in present:
+                    conn.execute(f"ALTER TABLE processed_files ADD COLUMN {col} {col_type}")
+        return
+
+    with conn:
+        conn.execute(
+            """
+            CREATE TABLE processed_files (
+                source        TEXT NOT NULL,
+                file_name     TEXT NOT NULL,
+                bronze_table  TEXT NOT NULL,
+                processed_at  TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                file_size     INTEGER,
+                file_mtime_ns INTEGER,
+                content_hash  TEXT,
+                PRIMARY KEY (source, file_name, bronze_table)
+            )
+            """
+        )
+        legacy = _read_legacy_csv()
+        conn.executemany(
+            "INSERT OR IGNORE INTO processed_files (source, file_name, bronze_table) "
+            "VALUES (?, ?, ?)",
+            legacy,
+        )
+    if legacy:
+        logger.info(f"Migrated {len(legacy)} ledger rows from {os.path.basename(PROCESSED_FILE)}")
+
+
+def _load_ledger() -> dict:
+    """Return the cached ledger, (re)loading it when the ledger path changed."""
+    global _ledger, _ledger_path
+
+    if _ledger is None or _ledger_path != LEDGER_DB:
+        conn = _connect()
+        try:
+            _init_ledger(conn)
+            rows = conn.execute(
+                "SELECT source, file_name, bronze_table, file_size, file_mtime_ns, content_hash "
+                "FROM processed_files"
+            ).fetchall()
+        finally:
+            conn.close()
+        _ledger = {tuple(r[:3]): tuple(r[3:]) for r in rows}
+        _ledger_path = LEDGER_DB
+    return _ledger
+
+
+def _record(key: tuple[str, str, str], fingerprint: tuple) -> None:
+    """Upsert one ledger row in its own transaction and mirror it in memory."""
+    ledger = _load_ledger()
+    conn = _connect()
+    try:
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO processed_files
+                    (source, file_name, bronze_table, file_size, file_mtime_ns, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, file_name, bronze_table) DO UPDATE SET
+                    processed_at  = CURRENT_TIMESTAMP,
+                    file_size     = excluded.file_size,
+                    file_mtime_ns = excluded.file_mtime_ns,
+                    content_hash  = excluded.content_hash
+                """,
+                (*key, *fingerprint),
+            )
+    finally:
+        conn.close()
+    ledger[key] = tuple(fingerprint)
+
+
+def is_file_processed(source, file_name, bronze_table, file_path=None):
+    """
+    Check whether a (source, file, table) combination
+    has already been ingested into bronze.
+
+    When file_path is given, the file only counts as processed if its bytes
+    are unchanged: matching size and mtime skip hashing, otherwise the content
+    hash decides. Entries without a fingerprint (migrated from the CSV
+    ledger) adopt the current one.
+    """
+    key = _normalize_key(source, file_name, bronze_table)
+
+    with _LEDGER_LOCK:
+        entry = _load_ledger().get(key)
+    if entry is None:
         return False
+    if file_path is None or not os.path.exists(file_path):
+        return True
 
-    return (
-        (df["source"].str.lower().str.strip() == source.lower().strip()) &
-        (df["file_name"].str.lower().str.strip() == file_name.lower().strip()) &
-        (df["bronze_table"].str.lower().str.strip() == bronze_table.lower().strip())
-    ).any()
+    stored_size, stored_mtime, stored_hash = entry
+    st = os.stat(file_path)
+    if stored_hash is not None and (st.st_size, st.st_mtime_ns) == (stored_size, stored_mtime):
+        return True
+
+    fingerprint = file_fingerprint(file_path)
+    if stored_hash is None:
+        logger.info(f"Recording fingerprint for previously processed file: {file_name}")
+    elif fingerprint[2] != stored_hash:
+        logger.info(f"[CHANGED] Content of {file_name} changed since last load")
+        return False
+    # adopted fingerprint, or touched but identical bytes: refresh size/mtime
+    # so the next check is stat-only
+    with _LEDGER_LOCK:
+        _record(key, fingerprint)
+    return True
 
 
-def mark_file_processed(source, file_name, bronze_table):
+def mark_file_processed(source, file_name, bronze_table, file_path=None, fingerprint=None):
     """
-    Mark a file as processed after successful bronze load.
+    Mark a file as processed after successful bronze load,
+    storing its size, mtime and content hash.
+
+    Pass the fingerprint taken before the file was read, so a file
+    rewritten during the load is not recorded with bytes that were never
+    loaded (it then counts as changed on the next run). Without one it is
+    taken from file_path now, or left empty.
     """
-    row = pd.DataFrame(
-        [[source, file_name, bronze_table]],
-        columns=["source", "file_name", "bronze_table"]
-    )
+    key = _normalize_key(source, file_name, bronze_table)
     logger.info(f"Marking file as processed: Table={bronze_table}")
-    os.makedirs(os.path.dirname(PROCESSED_FILE), exist_ok=True)
 
-    if os.path.exists(PROCESSED_FILE) and os.path.getsize(PROCESSED_FILE) > 0:
-        row.to_csv(PROCESSED_FILE, mode="a", header=False, index=False)
-    else:
-        row.to_csv(PROCESSED_FILE, index=False)
+    if fingerprint is None:
+        fingerprint = file_fingerprint(file_path) if file_path is not None else (None, None, None)
+    with _LEDGER_LOCK:
+        _record(key, fingerprint)
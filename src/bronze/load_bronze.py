@@ -1,55 +1,43 @@
 import os
+import re
 import sys
 import time
 import pandas as pd
-import json
-import numpy as np
 
-from sqlalchemy import types
-from typing import Any, cast
+from contextlib import nullcontext
+from sqlalchemy import bindparam, inspect, text, types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, cast
 from sqlalchemy.dialects.mysql import JSON as MYSQL_JSON
 
 from src.core.logger import setup_logger
 from src.core.database import get_engine
+from src.core.writer import log_table_throughput, write_dataframe
+from src.core.publish import get_publish_mode, shadow_table
 from src.core.paths import get_raw_data_path, get_project_root
+from src.core.config import load_pipeline_config
+from src.core.sql_files import read_sql_file, split_statements
+from src.bronze.helper import (
+    read_bronze_csv,
+    read_bronze_csv_chunks,
+    read_bronze_header,
+    add_raw_row,
+    add_row_hash,
+    OccurrenceCounter,
+    RawRowArchive,
+)
+from src.bronze.bulk_load import load_data_infile
 
 
 
 from src.bronze.ingestion_checker import(
     PROCESSED_FILE,
+    file_fingerprint,
     is_file_processed,
     mark_file_processed)
 
 logger = setup_logger("bronze")
 
-#! Bronze CSV Reader Function
-def read_bronze_csv(csv_path: str) -> pd.DataFrame:
-    """
-    Bronze CSV reader:
-    - checks file exists
-    - reads all columns as string
-    - normalizes headers
-    """
-    if not os.path.exists(csv_path):
-        raise FileNotFoundError(f"CSV not found at: {csv_path}")
-
-    df = pd.read_csv(csv_path, dtype=str)
-    df.columns = df.columns.str.strip().str.lower()
-    return df
-
-#! Add Raw Row Function
-def add_raw_row(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Adds raw_row JSON column for Bronze layer
-    """
-    df_temp = df.where(pd.notnull(df), np.nan)
-    df["raw_row"] = df_temp.apply(
-        lambda r: json.dumps(r.to_dict(), default=str),
-        axis=1
-    )
-    return df
-
-
 #! Database Connection Function
 def data_base_connection() -> None | Any:
     try:
@@ -60,499 +48,513 @@ def data_base_connection() -> None | Any:
         logger.exception("Connection error while creating bronze DB engine: %s", e)
         return None  
     
-#! 1.Customer Load Function
-def load_cust_info() -> None:
-    
-    start_time = time.time()
-    source = "source_crm"
-    file_name = "cust_info.csv"
-    bronze_table = "crm_customers_info"
-    table_name = "crm_customers_info"
-    logger.info(f'[START] Loading table: {table_name}')
-
-    engine =data_base_connection()
-    if engine is None:
-        logger.warning("Exiting due to database connection failure.")
-        return
-    try:
-        if is_file_processed(source, file_name, bronze_table):
-            logger.info(f'[SKIP] Table already processed: {table_name}')
-            return
+#! Streaming Source Reader
+def get_chunk_size() -> int | None:
+    """Rows per CSV chunk from pipeline_config.yaml (bronze.chunk_size); None = whole file."""
+    chunk_size = load_pipeline_config().get("bronze", {}).get("chunk_size")
+    return int(chunk_size) if chunk_size else None
 
-        # 1. Read CSV (wrapped)
-        csv_path = get_raw_data_path(
-        os.path.join("source_crm", "cust_info.csv")
-    )
 
-        df = read_bronze_csv(str(csv_path))
-        
-        # 2. Add raw_row (wrapped)
-        df = add_raw_row(df)
-
-
-        # 3. Map Columns 
-        # .get() 
-        df['cst_id']              = df.get('cst_id')
-        df['cst_key']             = df.get('cst_key')
-        df['cst_firstname']       = df.get('cst_firstname')
-        df['cst_lastname']        = df.get('cst_lastname')
-        df['cst_marital_status']  = df.get('cst_marital_status')
-        df['cst_gndr']            = df.get('cst_gndr')
-        df['cst_create_date_raw'] = df.get('cst_create_date')
-
-
-        #* Select columns to write
-        final_cols = [
-            'raw_row', 
-            'cst_id', 
-            'cst_key',
-            'cst_firstname', 
-            'cst_lastname', 
-            'cst_marital_status',
-            'cst_gndr', 
-            'cst_create_date_raw',   
-        ]
-        
-        #* Filter dataframe to only include columns that actually exist now
-        cols_to_write = [c for c in final_cols if c in df.columns]
-        df_final = df[cols_to_write]
-
-        #* 6. Write to MySQL 
-        dtype_map = {
-            "raw_row": MYSQL_JSON,
-            "cst_id": types.VARCHAR(50),
-            "cst_key": types.VARCHAR(100),
-            "cst_firstname": types.VARCHAR(100)
-        }
-
-        logger.info(f"Writing {len(df_final)} rows to table 'crm_customers_info'...")
-        
-        df_final.to_sql(
-            name='crm_customers_info',
-            con=engine,
-            if_exists="replace",
-            index=False,
-            dtype=cast(Any, dtype_map)
-        )
-        mark_file_processed(source, file_name, bronze_table)
-        elapsed_time = time.time() - start_time
-        logger.info(
-            f"[END] Loaded table: {table_name} | Time taken: {elapsed_time:.2f} seconds"
+def iter_source_frames(csv_path: str) -> Iterator[pd.DataFrame]:
+    """
+    Yield the source file as bronze-ready frames:
+    - one frame for the whole file when chunk_size is not configured
+    - fixed-size chunks otherwise, so peak memory is bounded by chunk_size
+    """
+    chunk_size = get_chunk_size()
+    if chunk_size is None:
+        yield read_bronze_csv(csv_path)
+    else:
+        yield from read_bronze_csv_chunks(csv_path, chunk_size)
+
+#! Target Spec Helpers
+WRITE_METHODS = ("to_sql", "load_data")
+LOAD_MODES = ("replace", "append")
+RAW_ROW_MODES = ("inline", "pointer")
+REQUIRED_TARGET_KEYS = ("name", "source", "file_name", "columns")
+
+SQL_TYPES: dict[str, Any] = {
+    "JSON": MYSQL_JSON,
+    "VARCHAR": types.VARCHAR,
+    "TEXT": types.Text,
+    "INT": types.Integer,
+    "BIGINT": types.BigInteger,
+    "DECIMAL": types.DECIMAL,
+    "DATE": types.Date,
+    "DATETIME": types.DateTime,
+}
+_SQL_TYPE_PATTERN = re.compile(r"^\s*(\w+)\s*(?:\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\))?\s*$")
+
+
+def parse_sql_type(spec: str) -> Any:
+    """Turn a config type string such as 'VARCHAR(50)' or 'JSON' into a SQLAlchemy type."""
+    match = _SQL_TYPE_PATTERN.match(spec)
+    if not match or match.group(1).upper() not in SQL_TYPES:
+        raise ValueError(f"Unsupported column type in pipeline_config.yaml: '{spec}'")
+    type_cls = SQL_TYPES[match.group(1).upper()]
+    args = [int(a) for a in match.group(2, 3) if a is not None]
+    return type_cls(*args) if args else type_cls()
+
+
+def build_dtype_map(target: dict) -> dict[str, Any]:
+    """SQLAlchemy dtype map for a target; raw_row is always JSON, row_hash BIGINT."""
+    dtypes = {"raw_row": "JSON", "row_hash": "BIGINT", **(target.get("dtypes") or {})}
+    return {column: parse_sql_type(spec) for column, spec in dtypes.items()}
+
+
+def get_bronze_targets() -> list[dict]:
+    """Bronze target specs from pipeline_config.yaml (bronze.targets), validated."""
+    targets = load_pipeline_config().get("bronze", {}).get("targets", [])
+    for target in targets:
+        missing = [k for k in REQUIRED_TARGET_KEYS if k not in target]
+        if missing:
+            raise ValueError(
+                f"Bronze target {target.get('name', '?')} is missing keys: {missing}"
             )
-        logger.info("Success: Data Loaded to bronze_db crm_customers_info table.")
+        method = target.get("write_method", "to_sql")
+        if method not in WRITE_METHODS:
+            raise ValueError(f"Unknown write_method '{method}' for target {target['name']}")
+        load_mode = target.get("load_mode", "replace")
+        if load_mode not in LOAD_MODES:
+            raise ValueError(f"Unknown load_mode '{load_mode}' for target {target['name']}")
+        raw_row_mode = target.get("raw_row_mode", "inline")
+        if raw_row_mode not in RAW_ROW_MODES:
+            raise ValueError(f"Unknown raw_row_mode '{raw_row_mode}' for target {target['name']}")
+    return targets
+
+
+def map_target_columns(df: pd.DataFrame, target: dict, loaded_at: pd.Timestamp) -> pd.DataFrame:
+    """
+    Project a raw_row-encoded source frame onto the bronze table layout:
+    raw_row, then target.columns (bronze_column: source_column) in config
+    order, then loaded_at when the target asks for it, then row_hash when the
+    frame carries one. Source columns that are absent from the file are
+    written as NULL.
+    """
+    mapped = {"raw_row": df["raw_row"]}
+    for bronze_col, source_col in target["columns"].items():
+        mapped[bronze_col] = df[source_col] if source_col in df.columns else None
+    df_final = pd.DataFrame(mapped, index=df.index)
+    if target.get("loaded_at", False):
+        df_final["loaded_at"] = loaded_at
+    if "row_hash" in df.columns:
+        df_final["row_hash"] = df["row_hash"]
+    return df_final
 
-    except Exception as e:
-        logger.exception(
-            f"[ERROR] Loading table: {table_name} | Error: {e}"
-            )
-        logger.warning(f"Processing Error: {e}")
 
-#! 2. Sales Load Function
-def load_sales_details_info() -> None:
-    start_time = time.time()
-    source = "source_crm"
-    file_name = "sales_details.csv"
-    bronze_table = "crm_sales_details"
-    table_name = "crm_sales_details"
-    logger.info(f'[START] Loading table: {table_name}')
+#! Incremental (append) Mode Helpers
+# row_hash values per IN (...) lookup, well under SQLite's bound-parameter limit
+HASH_LOOKUP_BATCH = 1000
 
 
+def has_row_hash_column(engine: Any, table_name: str) -> bool:
+    """
+    False when a bronze table exists without a row_hash column (loaded
+    before hashes); True when it has one or does not exist yet.
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table(table_name):
+        return True
+    return "row_hash" in {c["name"] for c in inspector.get_columns(table_name)}
 
-    #! Connect to Database
-    engine =data_base_connection()
-    if engine is None:
-        logger.warning("Exiting due to database connection failure.")
-        return
 
-    try:
-        #! Check if file already processed
-        if is_file_processed(source, file_name, bronze_table):
-            logger.info(f"[SKIP] Table already processed: {table_name}")   
-            return
-        
-        csv_path = get_raw_data_path(
-        os.path.join("source_crm", "sales_details.csv")
+def fetch_existing_hashes(engine: Any, table_name: str, hashes: pd.Series) -> pd.Index:
+    """
+    The values of hashes already stored in a bronze table.
+
+    Only the chunk's own hashes are looked up, in batches of
+    WHERE row_hash IN (...) served by the row_hash index, so the cost
+    follows the chunk size rather than the table size.
+    """
+    candidates = pd.unique(hashes.dropna()).tolist()
+    stmt = text(f"SELECT row_hash FROM {table_name} WHERE row_hash IN :hashes").bindparams(
+        bindparam("hashes", expanding=True)
     )
-        #! 1. Read CSV (wrapped)
-        df = read_bronze_csv(str(csv_path))
-
-        #! 2. Add raw_row (wrapped)
-        df = add_raw_row(df)
-        #! 3. Map Columns 
-        #! .get() 
-
-        df['ingest_id']            = df.get('ingest_id')
-        df['sales_prd_key']        = df.get('sls_prd_key')
-        df['sales_ord_num']        = df.get('sls_ord_num')
-        df['sales_cust_id']        = df.get('sls_cust_id')
-        df['sales_order_date_raw'] = df.get('sls_order_dt')
-        df['sales_ship_date_raw']  = df.get('sls_ship_dt')
-        df['sales_due_date_raw']   = df.get('sls_due_dt')
-        df['sales_sales']          = df.get('sls_sales')
-        df['sales_quantity']       = df.get('sls_quantity')
-        df['sales_price']          = df.get('sls_price')
-        df['loaded_at']            = pd.Timestamp.now()
-
-        final_cols =['ingest_id',
-                    'raw_row',
-                    'sales_prd_key',
-                    'sales_ord_num',
-                    'sales_cust_id',
-                    'sales_order_date_raw',
-                    'sales_ship_date_raw',
-                    'sales_due_date_raw',
-                    'sales_sales',
-                    'sales_quantity',
-                    'sales_price',
-                    'loaded_at']
-        
-        cols_to_write = [c for c in final_cols if c in df.columns]
-        df_final = df[cols_to_write]
-        
-        dtype_map = {
-            "raw_row": MYSQL_JSON,
-            "sales_order_num": types.VARCHAR(50),
-            "sales_order_key": types.VARCHAR(100),
-            "sales_order_id": types.VARCHAR(100)
-        }
-        logger.info(f"Writing {len(df_final)} rows to table 'crm_sales_details'...")
-        df_final.to_sql(
-            name='crm_sales_details',
-            con=engine,
-            if_exists="replace",
-            index=False,
-            dtype=cast(Any, dtype_map)
-        )
-        
-        logger.info("Success: Data Loaded to bronze_db crm_sales_details table.")
-        mark_file_processed(source, file_name, bronze_table)
-        elapsed_time = time.time() - start_time
-        logger.info(
-            f"[END] Loaded table: {table_name} | Time taken: {elapsed_time:.2f} seconds"
-        )
-    except Exception as e:
-        logger.exception(
-            f"[ERROR] Loading table: {table_name} | Error: {e}"
-        )
-        logger.warning(f"Processing Error: {e}")
+    found = []
+    with engine.connect() as conn:
+        for start in range(0, len(candidates), HASH_LOOKUP_BATCH):
+            batch = candidates[start:start + HASH_LOOKUP_BATCH]
+            found += conn.execute(stmt, {"hashes": batch}).scalars().all()
+    return pd.Index(found, dtype="int64").unique()
+
+
+def ensure_row_hash_index(engine: Any, table_name: str) -> None:
+    """Create the row_hash lookup index on a bronze table when it is missing."""
+    index_name = f"ix_{table_name}_row_hash"
+    inspector = inspect(engine)
+    if not inspector.has_table(table_name):
+        return
+    if any(ix["name"] == index_name for ix in inspector.get_indexes(table_name)):
+        return
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE INDEX {index_name} ON {table_name} (row_hash)"))
+    logger.info(f"[INDEX] Created {index_name}")
 
-#! 3.Product Load Function
-def load_prd_info() -> None:
-    start_time = time.time()
-    source = "source_crm"
-    file_name = "prd_info.csv"
-    bronze_table = "crm_prd_info"
-    table_name = "crm_prd_info"
-    logger.info(f'[START] Loading table: {table_name}')
 
-    
-    #! Connect to Database 
-    engine =data_base_connection()
-    if engine is None:
-        logger.warning("Exiting due to database connection failure.")
-        return
+#! DDL Provisioning
+DEFAULT_DDL_FILE = "create_bronze_table.sql"
+# the engine is already bound to the configured bronze database
+_SKIPPED_DDL_PREFIXES = ("CREATE DATABASE", "USE ")
 
-    try:
-        #! Check if file already processed
-        if is_file_processed(source, file_name, bronze_table):
-            logger.info(f"[SKIP] Table already processed: {table_name}")
-            return
-    
-        #! 1. Read CSV 
-        csv_path = get_raw_data_path(
-        os.path.join("source_crm", "prd_info.csv")
-    )
-        df = read_bronze_csv(str(csv_path))
-        #! 2. Add raw_row
-        df = add_raw_row(df)
-        df['prd_id']    = df.get('prd_id')
-        df['prd_key']   = df.get('prd_key')
-        df['prd_name']  = df.get('prd_nm')
-        df['prd_cost']  = df.get('prd_cost')
-        df['prd_line']  = df.get('prd_line')
-        df['prd_start_date_raw'] = df.get('prd_start_dt')
-        df['prd_end_date_raw'] = df.get('prd_end_dt')
-
-        #! Select columns to write
-        final_cols =['raw_row',
-                    'prd_id',
-                    'prd_key',
-                    'prd_name',
-                    'prd_cost',
-                    'prd_line',
-                    'prd_start_date_raw',
-                    'prd_end_date_raw']
-        
-        #! Filter dataframe to only include columns that actually exist now
-        cols_to_write = [c for c in final_cols if c in df.columns]
-        df_final = df[cols_to_write]
-        #! Write to MySQL
-        dtype_map = {
-            "raw_row":  MYSQL_JSON,
-            "prd_id":   types.VARCHAR(50),
-            "prd_key":  types.VARCHAR(100),
-            "prd_name": types.VARCHAR(100)
-        }
-        #! console log
-        logger.info(f"Writing {len(df_final)} rows to table 'crm_prd_info'...")
-        df_final.to_sql(
-            name='crm_prd_info',
-            con=engine,
-            if_exists="replace",
-            index=False,
-            dtype=cast(Any, dtype_map)
-        )
-        
-    
-        elapsed_time = time.time() - start_time
-        logger.info(
-            f"[END] Loaded table: {table_name} | Time taken: {elapsed_time:.2f} seconds"
-        )
-        logger.info("Success: Data Loaded to bronze_db crm_prd_info table.")
-        mark_file_processed(source, file_name, bronze_table)
-    except Exception as e:
-        logger.error(
-            f"[ERROR] Loading table: {table_name} | Error: {e}"
-        )
-        logger.error(f"[ERROR] Processing Error: {e}")
 
-#! ERP Load Functions
-def load_erp_cust_az12() -> None:
-    start_time = time.time()
-    source = "source_erp"
-    file_name = "CUST_AZ12.csv"
-    bronze_table = "erp_cust_az12"
-    table_name = "erp_cust_az12"
-    logger.info(f'[START] Loading table: {table_name}')
-    
-    #! Connect to Database
-    engine =data_base_connection()
-    if engine is None:
-        logger.warning("[WARNING] Exiting due to database connection failure.")
-        return
+def get_ddl_settings() -> tuple[bool, str]:
+    """(enabled, file under sql/bronze/) from pipeline_config.yaml (bronze.ddl)."""
+    ddl = load_pipeline_config().get("bronze", {}).get("ddl", {}) or {}
+    return bool(ddl.get("enabled", False)), ddl.get("file", DEFAULT_DDL_FILE)
+
+
+# statements may open with comment lines, so match at any line start
+_CREATE_TABLE = re.compile(
+    r"^(\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?)`?(\w+)`?", re.IGNORECASE | re.MULTILINE
+)
+DDL_SCRATCH_SUFFIX = "__ddl"
+
+
+def _table_shape(engine: Any, table_name: str) -> list[tuple[str, str]]:
+    """(column, reflected type) pairs of a table, in column order."""
+    return [(c["name"], str(c["type"])) for c in inspect(engine).get_columns(table_name)]
+
+
+def _rebuild_from_ddl(engine: Any, table_name: str, stmt: str) -> bool:
+    """
+    Bring an existing table to the definition in stmt when it differs
+    (e.g. TEXT columns created by pandas before DDL mode was enabled).
+
+    The DDL is created under <table>__ddl and compared column by column;
+    on a mismatch the rows of the shared columns are copied into it and
+    it replaces the old table. Returns True when the table was rebuilt.
+    """
+    scratch = table_name + DDL_SCRATCH_SUFFIX
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {scratch}"))
+        conn.execute(text(_CREATE_TABLE.sub(lambda m: m.group(1) + scratch, stmt, count=1)))
     try:
-        #! Check if file already processed
-        if is_file_processed(source, file_name, bronze_table):
-            logger.info(f"[SKIP] File '{file_name}' from source '{source}' already processed. Skipping ingestion.")
-            logger.info(f"[SKIP] Table already processed: {table_name}")
-            return
-        csv_path = get_raw_data_path(os.path.join
-                ("source_erp", "CUST_AZ12.csv"))
-        #! 1. Read  CSV
-        df = read_bronze_csv(str(csv_path))
-        #! 2. Add raw_row
-        df = add_raw_row(df)
-
-        #! 3.Colunmn Mapping
-        df['ingest_id']       = df.get('ingest_id')
-        df['cid']             = df.get('cid')
-        df['birth_date_raw']  = df.get('bdate')
-        df['gender_raw']      = df.get('gen')
-        df['loaded_at']       = pd.Timestamp.now()
-
-        final_cols = ['ingest_id',
-                    'raw_row',
-                    'cid',
-                    'birth_date_raw',
-                    'gender_raw',
-                    'loaded_at']
-        
-        cols_to_write = [c for c in final_cols if c in df.columns]
-        df_final = df[cols_to_write]
-
-        #! Write to MySQL
-        dtype_map = {
-            "raw_row": MYSQL_JSON,
-            "cid": types.VARCHAR(50)
-        }
-        #! console log
-        logger.info(f"Writing {len(df_final)} rows to table 'erp_cust_az12'...")
-        df_final.to_sql(
-            name='erp_cust_az12',
-            con=engine,
-            if_exists="replace",
-            index=False,
-            dtype=cast(Any, dtype_map)
-        )
-        
-        logger.info("Success: Data Loaded to bronze_db erp_cust_az12 table.")
-        mark_file_processed(source, file_name, bronze_table)
-        elapsed_time = time.time() - start_time
-        logger.info(
-            f"[END] Loaded table: {table_name} | Time taken: {elapsed_time:.2f} seconds"
-        )
-    except Exception as e:
-        logger.exception(
-            f"[ERROR] Loading table: {table_name} | Error: {e}"
+        if _table_shape(engine, scratch) == _table_shape(engine, table_name):
+            return False
+        existing = {name for name, _ in _table_shape(engine, table_name)}
+        shared = ", ".join(name for name, _ in _table_shape(engine, scratch) if name in existing)
+        with engine.begin() as conn:
+            conn.execute(text(f"INSERT INTO {scratch} ({shared}) SELECT {shared} FROM {table_name}"))
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE {table_name}"))
+            conn.execute(text(f"ALTER TABLE {scratch} RENAME TO {table_name}"))
+        logger.warning(f"[DDL] Rebuilt {table_name} with the DDL definition (rows of {shared} kept)")
+        return True
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {scratch}"))
+
+
+def provision_bronze_tables(engine: Any, ddl_file: str = DEFAULT_DDL_FILE) -> int:
+    """
+    Create the bronze tables from the DDL script (CREATE TABLE IF NOT EXISTS),
+    keeping its ingest_id keys, column types and loaded_at defaults.
+
+    An existing table whose columns differ from the DDL (typically an
+    all-TEXT table pandas created before DDL mode) is rebuilt to the DDL
+    definition with its rows copied over. Returns the statements executed.
+    """
+    statements = [
+        stmt for stmt in split_statements(read_sql_file("bronze", ddl_file))
+        if not stmt.upper().startswith(_SKIPPED_DDL_PREFIXES)
+    ]
+    for stmt in statements:
+        match = _CREATE_TABLE.search(stmt)
+        if match and inspect(engine).has_table(match.group(2)):
+            _rebuild_from_ddl(engine, match.group(2), stmt)
+            continue
+        with engine.begin() as conn:
+            conn.execute(text(stmt))
+    logger.info(f"[DDL] Provisioned bronze tables from {ddl_file} ({len(statements)} statements)")
+    return len(statements)
+
+
+def truncate_table(engine: Any, table_name: str) -> None:
+    """Empty a table while keeping its definition (DELETE on SQLite)."""
+    if engine.dialect.name == "sqlite":
+        stmt = f"DELETE FROM {table_name}"
+    else:
+        stmt = f"TRUNCATE TABLE {table_name}"
+    with engine.begin() as conn:
+        conn.execute(text(stmt))
+
+
+#! Bronze Write Dispatcher
+def write_bronze_frame(
+    df: pd.DataFrame,
+    table_name: str,
+    engine: Any,
+    dtype_map: dict,
+    if_exists: str,
+    write_method: str = "to_sql",
+) -> None:
+    """
+    Write a prepared bronze frame using the target's configured write method.
+    Chunks are not logged one by one: load_target reports the table total.
+    """
+    if write_method == "load_data":
+        load_data_infile(
+            df,
+            table_name,
+            engine,
+            dtype=cast(Any, dtype_map),
+            if_exists=if_exists,
         )
-        logger.warning(f"Processing Error: {e}")
+        return
+    write_dataframe(df, table_name, engine, dtype=cast(Any, dtype_map), if_exists=if_exists, log=False)
 
-def load_erp_location_a101() -> None:
+
+#! Generic Target Loader
+def load_target(
+    target: dict,
+    engine: Any,
+    stats: dict | None = None,
+    use_ddl: bool = False,
+) -> str:
+    """
+    Load one bronze target described in pipeline_config.yaml.
+
+    load_mode 'replace' rebuilds the table from the file; 'append' inserts
+    only rows whose row_hash is not already in the table. raw_row_mode
+    'pointer' stores a pointer into the target's raw_row archive (see
+    RawRowArchive and lookup_raw_row) instead of an inline JSON copy, and
+    never builds the JSON while loading. Inserted and
+    skipped row counts are written into stats when a dict is passed.
+
+    With use_ddl a table provisioned by the bronze DDL (see
+    provision_bronze_tables) is truncated on 'replace' and inserted into,
+    keeping its definition, instead of letting pandas drop and recreate it.
+    A target the DDL does not define falls back to a pandas-created table.
+
+    Returns:
+        'loaded', 'skipped' (already in the ledger) or 'failed'.
+    """
     start_time = time.time()
-    source = "source_erp"
-    file_name = "LOC_A101.csv"
-    bronze_table = "erp_location_a101"
-    table_name = "erp_location_a101"
+    source = target["source"]
+    file_name = target["file_name"]
+    table_name = target["name"]
+    write_method = target.get("write_method", "to_sql")
+    load_mode = target.get("load_mode", "replace")
+    raw_row_mode = target.get("raw_row_mode", "inline")
     logger.info(f'[START] Loading table: {table_name}')
 
-    logger.info("Starting Bronze Load: ERP Location.")
-    
-    #! Connect to Database
-    engine =data_base_connection()
-    if engine is None:
-        logger.warning("Exiting due to database connection failure.")
-        return
     try:
-        #! Check if file already processed
-        if is_file_processed(source, file_name, bronze_table):
-            logger.info(f"[SKIP] File '{file_name}' from source '{source}' already processed. Skipping ingestion.")
+        csv_path = get_raw_data_path(os.path.join(source, file_name))
+
+        #! Check if file already processed (and its bytes are unchanged)
+        if is_file_processed(source, file_name, table_name, file_path=str(csv_path)):
             logger.info(f"[SKIP] Table already processed: {table_name}")
-            return
-        csv_path = get_raw_data_path(os.path.join
-                ("source_erp", "LOC_A101.csv"))
-        #! 1. Read  CSV
-        df = read_bronze_csv(str(csv_path))
-        #! 2. Add raw_row
-        df = add_raw_row(df)
-
-        #! 3.Colunmn Mapping
-        df['cid']             = df.get('cid')
-        df['country_name']    = df.get('cntry')
-        df['loaded_at']       = pd.Timestamp.now()
-
-        final_cols = ['raw_row',
-                    'cid',
-                    'country_name',
-                    'loaded_at']
-        
-        cols_to_write = [c for c in final_cols if c in df.columns]
-        df_final = df[cols_to_write]
-
-        #! Write to MySQL
-        dtype_map = {
-            "raw_row": MYSQL_JSON,
-            "cid": types.VARCHAR(50)
-        }
-        #! console log
-        logger.info(f"Writing {len(df_final)} rows to table 'erp_location_a101'")
-        df_final.to_sql(
-            name='erp_location_a101',
-            con=engine,
-            if_exists="replace",
-            index=False,
-            chunksize=1000,
-            dtype=cast(Any, dtype_map)
+            return "skipped"
+        # taken before reading, so the ledger records the bytes actually loaded
+        fingerprint = file_fingerprint(str(csv_path))
+
+        missing = [c for c in target["columns"].values()
+                   if c not in read_bronze_header(str(csv_path))]
+        if missing:
+            logger.warning(f"[MAPPING] {file_name} lacks columns {missing}; writing NULLs")
+
+        # hashes are only looked up in a table that held rows before this run:
+        # rows written by earlier chunks of the same file never share a hash
+        lookup_existing = False
+        # row_hash only serves append lookups; a one-off replace of an append
+        # target still writes it so later runs can append
+        hash_rows = load_mode == "append"
+        if load_mode == "append":
+            if not has_row_hash_column(engine, table_name):
+                logger.warning(
+                    f"[DELTA] {table_name} has no row_hash column; replacing it once"
+                )
+                load_mode = "replace"
+            elif inspect(engine).has_table(table_name):
+                ensure_row_hash_index(engine, table_name)
+                lookup_existing = True
+
+        if use_ddl and not inspect(engine).has_table(table_name):
+            logger.warning(
+                f"[DDL] {table_name} is not provisioned by the bronze DDL; "
+                "letting pandas create it"
+            )
+            use_ddl = False
+
+        # replace loads go through a shadow table in shadow publish mode, so
+        # readers keep seeing the previous table until the swap
+        shadow = load_mode == "replace" and get_publish_mode() == "shadow"
+        if shadow:
+            publish = shadow_table(engine, table_name, like_existing=use_ddl)
+        else:
+            publish = nullcontext(table_name)
+            if use_ddl and load_mode == "replace":
+                truncate_table(engine, table_name)
+        # pandas creates the table on the first chunk unless it already exists
+        recreate = load_mode == "replace" and not use_ddl
+
+        dtype_map = build_dtype_map(target)
+        loaded_at = pd.Timestamp.now()
+        occurrences = OccurrenceCounter() if hash_rows else None
+        rows_written = 0
+        rows_skipped = 0
+        write_seconds = 0.0
+        chunks_written = 0
+        pointer_mode = raw_row_mode == "pointer"
+        # the archive is entered first so it only drops older generations
+        # after the publish (e.g. the shadow swap) has succeeded
+        archive = (
+            RawRowArchive(f"{source}/{file_name}", fresh=load_mode == "replace")
+            if pointer_mode else nullcontext()
         )
-        
-        logger.info("Success: Data Loaded to bronze_db erp_location_a101 table.")
-        mark_file_processed(source, file_name, bronze_table)
+        with archive, publish as write_table:
+            for chunk_no, df in enumerate(iter_source_frames(str(csv_path))):
+                #! 1. Add raw_row (and row_hash for append targets)
+                source_columns = list(df.columns)
+                if not pointer_mode:
+                    df = add_raw_row(df)
+                if hash_rows:
+                    df = add_row_hash(df, occurrences)
+                if pointer_mode:
+                    df["raw_row"] = None  # pointers are assigned to the rows written
+                #! 2. Map columns
+                df_final = map_target_columns(df, target, loaded_at)
+                #! 3. Keep only unseen rows in append mode
+                if lookup_existing:
+                    existing = fetch_existing_hashes(engine, table_name, df_final["row_hash"])
+                    is_new = existing.get_indexer(df_final["row_hash"]) == -1
+                    rows_skipped += int((~is_new).sum())
+                    df_final = df_final[is_new]
+                    if df_final.empty:
+                        continue
+                if pointer_mode:
+                    df_final = df_final.assign(raw_row=archive.add(df.loc[df_final.index, source_columns]))
+                #! 4. Write to MySQL
+                logger.info(f"Writing {len(df_final)} rows to table '{write_table}'...")
+                write_start = time.perf_counter()
+                write_bronze_frame(
+                    df_final,
+                    write_table,
+                    engine,
+                    dtype_map,
+                    if_exists="replace" if recreate and chunk_no == 0 else "append",
+                    write_method=write_method,
+                )
+                write_seconds += time.perf_counter() - write_start
+                chunks_written += 1
+                rows_written += len(df_final)
+
+        if chunks_written:
+            log_table_throughput(table_name, rows_written, write_seconds, chunks_written)
+        if load_mode == "append":
+            ensure_row_hash_index(engine, table_name)
+            logger.info(f"[DELTA] {table_name} | Inserted: {rows_written} | Skipped: {rows_skipped}")
+        if stats is not None:
+            stats.update(rows_inserted=rows_written, rows_skipped=rows_skipped)
+
+        logger.info(f"Success: Data Loaded to bronze_db {table_name} table.")
+        mark_file_processed(source, file_name, table_name, fingerprint=fingerprint)
         elapsed_time = time.time() - start_time
         logger.info(
-            f"[END] Loaded table: {table_name} | Time taken: {elapsed_time:.2f} seconds"
+            f"[END] Loaded table: {table_name} | Rows: {rows_written} | Time taken: {elapsed_time:.2f} seconds"
         )
+        return "loaded"
     except Exception as e:
         logger.exception(
             f"[ERROR] Loading table: {table_name} | Error: {e}"
         )
+        return "failed"
 
-def load_erp_px_cat_g1v2() -> None:
-    start_time = time.time()
-    source = "source_erp"
-    file_name = "PX_CAT_G1V2.csv"
-    bronze_table = "erp_px_cat_g1v2"
-    table_name = "erp_px_cat_g1v2"
-    logger.info(f'[START] Loading table: {table_name}')
-    logger.info("Starting Bronze Load: ERP Category.")
-    
-    #! Connect to Database
-    engine =data_base_connection()
-    if engine is None:
-        logger.warning("Exiting due to database connection failure.")
-        return
+
+#! Orchestration Function
+def get_parallel_settings() -> tuple[bool, int]:
+    """(enabled, max_workers) from pipeline_config.yaml (bronze.parallel)."""
+    parallel = load_pipeline_config().get("bronze", {}).get("parallel", {}) or {}
+    return bool(parallel.get("enabled", False)), int(parallel.get("max_workers", 4))
+
+
+def _run_loader(target: dict, engine: Any, use_ddl: bool = False) -> dict:
+    """Run one target load and capture its status, row counts and wall time."""
+    start = time.time()
+    stats = {"rows_inserted": 0, "rows_skipped": 0}
     try:
-        #! Check if file already processed
-        if is_file_processed(source, file_name, bronze_table):  
-            logger.info(f"File '{file_name}' from source '{source}' already processed. Skipping ingestion.")
-            logger.info(f"[SKIP] Table already processed: {table_name}")
-            return
-        csv_path = get_raw_data_path(os.path.join
-                ("source_erp", "PX_CAT_G1V2.csv"))
-        #! 1. Read  CSV
-        df = read_bronze_csv(str(csv_path))
-        #! 2. Add raw_row
-        df = add_raw_row(df)
-
-        #! 3.Colunmn Mapping
-        df['ingest_id']       = df.get('ingest_id')
-        df['id']              = df.get('id')
-        df['cat']             = df.get('cat')
-        df['subcat']         = df.get('subcat')
-        df['maintenance_raw'] = df.get('maintenance')
-        df['loaded_at']       = pd.Timestamp.now()
-
-        final_cols = ['ingest_id',
-                    'raw_row',
-                    'id',
-                    'cat',
-                    'subcat',
-                    'maintenance_raw',
-                    'loaded_at']
-        
-        cols_to_write = [c for c in final_cols if c in df.columns]
-        df_final = df[cols_to_write]
-
-        #! Write to MySQL
-        dtype_map = {
-            "raw_row": MYSQL_JSON,
-            "id": types.VARCHAR(50)
-        }
-        #! console log
-        logger.info(f"Writing {len(df_final)} rows to table 'erp_px_cat_g1v2'...")
-        df_final.to_sql(
-            name='erp_px_cat_g1v2',
-            con=engine,
-            if_exists="replace",
-            index=False,
-            dtype=cast(Any, dtype_map)
-        )
-        
-        logger.info("Success: Data Loaded to bronze_db erp_px_cat_g1v2 table.")
-        mark_file_processed(source, file_name, bronze_table)
-        elapsed_time = time.time() - start_time
-        logger.info(
-            f"[END] Loaded table: {table_name} | Time taken: {elapsed_time:.2f} seconds"
-        )
+        status = load_target(target, engine, stats, use_ddl=use_ddl)
     except Exception as e:
-        logger.exception(
-            f"[ERROR] Loading table: {table_name} | Error: {e}"
-        )
-        logger.warning(f"Processing Error: {e}")
+        logger.exception(f"[ERROR] Loader crashed for table: {target['name']} | Error: {e}")
+        status = "failed"
+    return {"table": target["name"], "status": status, "seconds": time.time() - start, **stats}
 
-#! Orchestration Function
-def run_bronze_pipeline() -> None:
+
+def run_bronze_pipeline(
+    parallel: bool | None = None,
+    max_workers: int | None = None,
+    use_ddl: bool | None = None,
+) -> list[dict]:
     """
     Orchestrates complete Bronze layer ingestion.
     Entry point for local runs, schedulers, and future Airflow DAGs.
+
+    Every target in pipeline_config.yaml (bronze.targets) is loaded by the
+    same generic loader over one shared engine. Targets read independent
+    files and write independent tables, so with parallel mode on they run
+    concurrently on a thread pool. With bronze.ddl enabled the tables are
+    provisioned from the bronze DDL once, before any loader starts.
+    Arguments override bronze.parallel and bronze.ddl.enabled.
+
+    Returns:
+        One {table, status, seconds, rows_inserted, rows_skipped} dict per
+        target, in config order.
     """
+    cfg_parallel, cfg_workers = get_parallel_settings()
+    parallel = cfg_parallel if parallel is None else parallel
+    max_workers = cfg_workers if max_workers is None else max_workers
+    cfg_ddl, ddl_file = get_ddl_settings()
+    use_ddl = cfg_ddl if use_ddl is None else use_ddl
+
     logger.info("Starting Bronze Layer Pipeline...")
     batch_start = time.time()
-    logger.info("[BATCH START] Bronze layer ingestion started")
-    # CRM sources
-    load_cust_info()
-    load_prd_info()
-    load_sales_details_info()
-
-    # ERP sources
-    load_erp_cust_az12()
-    load_erp_location_a101()
-    load_erp_px_cat_g1v2()
-
-    logger.info("Bronze Layer Pipeline Completed Successfully.")
+    targets = get_bronze_targets()
+    mode = f"parallel, {max_workers} workers" if parallel else "sequential"
+    logger.info(f"[BATCH START] Bronze layer ingestion started ({len(targets)} targets, {mode})")
+
+    engine = data_base_connection()
+    if engine is None:
+        logger.warning("Exiting due to database connection failure.")
+        return [{"table": t["name"], "status": "failed", "seconds": 0.0,
+                 "rows_inserted": 0, "rows_skipped": 0} for t in targets]
+
+    if use_ddl:
+        try:
+            provision_bronze_tables(engine, ddl_file)
+        except Exception as e:
+            logger.exception(f"[ERROR] Provisioning bronze tables from {ddl_file} failed: {e}")
+            return [{"table": t["name"], "status": "failed", "seconds": 0.0,
+                     "rows_inserted": 0, "rows_skipped": 0} for t in targets]
+
+    if parallel:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bronze") as pool:
+            futures = [pool.submit(_run_loader, target, engine, use_ddl) for target in targets]
+            results = [f.result() for f in futures]
+    else:
+        results = [_run_loader(target, engine, use_ddl) for target in targets]
+
+    for r in results:
+        logger.info(
+            f"[BATCH] {r['table']}: {r['status']} ({r['seconds']:.2f}s) | "
+            f"inserted={r.get('rows_inserted', 0)} skipped={r.get('rows_skipped', 0)}"
+        )
+    counts = {status: sum(r["status"] == status for r in results)
+              for status in ("loaded", "skipped", "failed")}
+
     batch_duration = time.time() - batch_start
     logger.info(
-        f"[BATCH END] Bronze layer completed | Total time={batch_duration:.2f}s"
+        f"[BATCH END] Bronze layer completed | "
+        f"loaded={counts['loaded']} skipped={counts['skipped']} failed={counts['failed']} | "
+        f"Total time={batch_duration:.2f}s"
     )
+    if counts["failed"]:
+        logger.warning(f"Bronze Layer Pipeline finished with {counts['failed']} failed loader(s).")
+    else:
+        logger.info("Bronze Layer Pipeline Completed Successfully.")
     logger.info(f"Total Bronze Layer Time: {batch_duration:.2f} seconds.")
+    return results
+
+
 def main():
     run_bronze_pipeline()
 
@@ -1,7 +1,9 @@
 import os
 import json
 import logging
-from sqlalchemy import create_engine, text
+import threading
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError
 from urllib.parse import quote_plus
 from src.core.paths import get_config_path, get_project_root
@@ -9,6 +11,25 @@ from src.core.paths import get_config_path, get_project_root
 
 logger = logging.getLogger(__name__)
 
+# Pool tuning; each key can be overridden under mysql.pool in db_config.json.
+# pool_recycle keeps connections younger than MySQL's wait_timeout, so no
+# per-checkout ping is needed.
+POOL_DEFAULTS = {
+    "pool_size": 5,
+    "max_overflow": 5,
+    "pool_recycle": 1800,
+    "pool_timeout": 30,
+}
+
+#! Process-wide engine registry: one pooled engine per layer
+_ENGINES: dict[str, Engine] = {}
+_CONNECTIONS_OPENED: dict[str, int] = {}
+_REGISTRY_LOCK = threading.Lock()
+# separate from _REGISTRY_LOCK: the probe in _create_layer_engine opens the
+# first connection (firing _on_connect) while get_engine holds the registry lock
+_STATS_LOCK = threading.Lock()
+
+
 def load_config():
    
     config_path = get_config_path()
@@ -37,20 +58,40 @@ def _create_database(cfg: dict, dbname: str) -> None:
         admin_url = f"mysql+pymysql://{user}:{pwd_quoted}@{host}:{port}/"
         admin_engine = create_engine(admin_url, pool_pre_ping=True)
         
-        with admin_engine.connect() as conn:
-            conn.execute(text(f"CREATE DATABASE IF NOT EXISTS {dbname};"))
-            conn.commit()
-            logger.info(f"✓ Database '{dbname}' created/verified successfully")
+        try:
+            with admin_engine.connect() as conn:
+                conn.execute(text(f"CREATE DATABASE IF NOT EXISTS {dbname};"))
+                conn.commit()
+                logger.info(f"✓ Database '{dbname}' created/verified successfully")
+        finally:
+            admin_engine.dispose()
             
     except Exception as e:
         logger.error(f"Failed to create database '{dbname}': {e}")
         raise
 
 
-def get_engine(layer="bronze"):
+def _track_connections(engine: Engine, layer: str) -> None:
+    """Count every new DBAPI connection the engine's pool opens."""
+    with _STATS_LOCK:
+        _CONNECTIONS_OPENED.setdefault(layer, 0)
+
+    def _on_connect(dbapi_connection, connection_record):
+        with _STATS_LOCK:
+            _CONNECTIONS_OPENED[layer] = _CONNECTIONS_OPENED.get(layer, 0) + 1
+
+    event.listen(engine, "connect", _on_connect)
+
+
+def _probe(engine: Engine) -> None:
+    """Single connection-health probe, run once when the engine is created."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def _create_layer_engine(layer: str) -> Engine:
     """
-    # Get SQLAlchemy engine for the specified layer (bronze, silver, gold).
-    - Get SQLAlchemy engine for specified layer.
+    Build a pooled SQLAlchemy engine for a layer (bronze, silver, gold).
     - Automatically creates database if it doesn't exist on first connection.
     """
     full_config = load_config()
@@ -79,13 +120,20 @@ def get_engine(layer="bronze"):
     pwd_quoted = quote_plus(pwd)
     
     url = f"mysql+pymysql://{user}:{pwd_quoted}@{host}:{port}/{dbname}"
-    
+    # LOCAL INFILE lets the bronze bulk loader use LOAD DATA; the server still
+    # has to allow it (local_infile=ON), otherwise loaders fall back to inserts.
+    connect_args = {"local_infile": bool(cfg.get("local_infile", True))}
+    pool_options = {**POOL_DEFAULTS, **cfg.get("pool", {})}
+
+    def _build() -> Engine:
+        engine = create_engine(url, connect_args=connect_args, **pool_options)
+        _track_connections(engine, layer)
+        return engine
+
     try:
         # Try to create engine and test connection
-        engine = create_engine(url, pool_pre_ping=True)
-        # Test the connection
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        engine = _build()
+        _probe(engine)
         
         logger.info(f"Connected to {layer} database: {dbname}")
         return engine
@@ -93,19 +141,62 @@ def get_engine(layer="bronze"):
     except OperationalError as e:
         # Database likely doesn't exist
         logger.warning(f"Database '{dbname}' not found or connection failed. Attempting to create...")
+        engine.dispose()
         
         try:
             # Create the database
             _create_database(cfg, dbname)
             
             # Create a new engine and test connection
-            engine = create_engine(url, pool_pre_ping=True)
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            engine = _build()
+            _probe(engine)
             
             logger.info(f"Successfully connected to newly created {layer} database: {dbname}")
             return engine
             
         except Exception as create_error:
             logger.error(f"Failed to create and connect to database '{dbname}': {create_error}")
-            raise
\ No newline at end of file
+            raise
+
+
+def get_engine(layer="bronze"):
+    """
+    # Get SQLAlchemy engine for the specified layer (bronze, silver, gold).
+    - Engines are cached per layer for the life of the process, so every
+      loader, silver step and DQ check shares one connection pool per layer.
+    - Automatically creates database if it doesn't exist on first connection.
+    """
+    engine = _ENGINES.get(layer)
+    if engine is not None:
+        return engine
+
+    with _REGISTRY_LOCK:
+        engine = _ENGINES.get(layer)
+        if engine is None:
+            engine = _create_layer_engine(layer)
+            _ENGINES[layer] = engine
+    return engine
+
+
+def get_connection_stats() -> dict[str, int]:
+    """Number of DBAPI connections opened per layer since the last reset."""
+    with _STATS_LOCK:
+        return dict(_CONNECTIONS_OPENED)
+
+
+def dispose_engines() -> dict[str, int]:
+    """
+    Dispose every cached engine (closing pooled connections) at shutdown.
+
+    Returns:
+        Connections opened per layer during the run; counters are reset.
+    """
+    with _REGISTRY_LOCK:
+        for layer, engine in _ENGINES.items():
+            engine.dispose()
+            logger.info(f"Disposed {layer} engine")
+        _ENGINES.clear()
+    with _STATS_LOCK:
+        stats = dict(_CONNECTIONS_OPENED)
+        _CONNECTIONS_OPENED.clear()
+    return stats
@@ -8,6 +8,7 @@ DATA_DIR = PROJECT_ROOT / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 LOG_DIR = DATA_DIR / "logs"
 PROCESSED_DIR = DATA_DIR / "processed"
+RAW_ARCHIVE_DIR = PROCESSED_DIR / "raw_archive"
 
 
 
@@ -16,6 +17,12 @@ def get_raw_data_path(filename: str) -> Path:
     # Returns the absolute path to a raw data file in the data/raw directory."""
     return RAW_DATA_DIR / filename
 
+def get_raw_archive_path(file_ref: str, generation: str) -> Path:
+    """
+    # Returns one generation of the raw_row archive of a raw file (source/file_name),
+    # data/processed/raw_archive/<source>/<file_name>/<generation>.csv"""
+    return RAW_ARCHIVE_DIR / file_ref / f"{generation}.csv"
+
 def get_project_root() -> Path:
     """
     # Returns the absolute path to the root 'data_engineering_project' folder."""
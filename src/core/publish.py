@@ -0,0 +1,369 @@
+"""
+Core Module: Shadow-Table Publishing
+------------------------------------
+Zero-downtime table refreshes for every layer.
+
+In 'shadow' publish mode a table is never rebuilt in place: the new data is
+loaded into <table>__shadow and swapped in with a single RENAME TABLE, so
+readers (silver extracts, gold views, dashboards) see either the previous
+table or the new one, never a missing or half-written one. 'direct' mode
+keeps the old behaviour of replacing the live table.
+
+Incremental loads use upsert_dataframe() instead: the rows are staged,
+rows identical to the live ones are discarded, and the rest are upserted
+by key (INSERT ... ON DUPLICATE KEY UPDATE on MySQL, ON CONFLICT on
+SQLite). merge_dataframe() is the delete-then-insert fallback for tables
+whose key cannot be made unique.
+
+Usage:
+    from src.core.publish import publish_chunks, publish_dataframe, shadow_table, upsert_dataframe
+"""
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
+
+import pandas as pd
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.config import load_pipeline_config
+from src.core.logger import setup_logger
+from src.core.writer import log_table_throughput, write_dataframe
+
+logger = setup_logger(__name__.split(".")[-1])
+
+PUBLISH_MODES = ("direct", "shadow")
+SHADOW_SUFFIX = "__shadow"
+RETIRED_SUFFIX = "__old"
+STAGE_SUFFIX = "__stage"
+UNCHANGED_IGNORE = ("loaded_at",)
+
+
+def get_publish_mode() -> str:
+    """Publish mode from pipeline_config.yaml (publish.mode); defaults to 'direct'."""
+    mode = (load_pipeline_config().get("publish", {}) or {}).get("mode", "direct")
+    if mode not in PUBLISH_MODES:
+        raise ValueError(f"Unknown publish.mode '{mode}' (expected one of {PUBLISH_MODES})")
+    return mode
+
+
+def _drop_table(conn: Any, table_name: str) -> None:
+    conn.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
+
+
+def _create_like(engine: Engine, table_name: str, shadow_name: str) -> None:
+    """Create an empty copy of a table's definition (keys, types, defaults)."""
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            ddl = conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": table_name},
+            ).scalar_one()
+            ddl = re.sub(
+                rf"^(CREATE TABLE\s+(?:IF NOT EXISTS\s+)?)[\"`]?{re.escape(table_name)}[\"`]?",
+                rf"\g<1>{shadow_name}",
+                ddl,
+                count=1,
+                flags=re.IGNORECASE,
+            )
+            conn.execute(text(ddl))
+        else:
+            conn.execute(text(f"CREATE TABLE {shadow_name} LIKE {table_name}"))
+
+
+def swap_in_shadow(engine: Engine, table_name: str, shadow_name: str) -> None:
+    """
+    Atomically replace table_name with shadow_name and drop the old table.
+    MySQL renames both tables in one RENAME TABLE statement; SQLite does the
+    two renames inside one transaction.
+    """
+    retired = table_name + RETIRED_SUFFIX
+    exists = inspect(engine).has_table(table_name)
+    with engine.begin() as conn:
+        _drop_table(conn, retired)
+        if engine.dialect.name == "mysql":
+            if exists:
+                conn.execute(text(
+                    f"RENAME TABLE {table_name} TO {retired}, {shadow_name} TO {table_name}"
+                ))
+            else:
+                conn.execute(text(f"RENAME TABLE {shadow_name} TO {table_name}"))
+        else:
+            if exists:
+                conn.execute(text(f"ALTER TABLE {table_name} RENAME TO {retired}"))
+            conn.execute(text(f"ALTER TABLE {shadow_name} RENAME TO {table_name}"))
+        _drop_table(conn, retired)
+
+
+@contextmanager
+def shadow_table(engine: Engine, table_name: str, like_existing: bool = False) -> Iterator[str]:
+    """
+    Yield the name of a fresh shadow table to load into, then swap it in.
+
+    Args:
+        engine: SQLAlchemy engine for the table's layer.
+        table_name: Live table to refresh.
+        like_existing: Create the shadow with the live table's definition
+            (for DDL-provisioned tables) instead of leaving creation to the
+            first write.
+
+    The live table is untouched until the block finishes; on error the
+    shadow is dropped and the live table keeps serving the previous data.
+    """
+    shadow_name = table_name + SHADOW_SUFFIX
+    with engine.begin() as conn:
+        _drop_table(conn, shadow_name)  # leftover from an interrupted run
+    if like_existing:
+        _create_like(engine, table_name, shadow_name)
+
+    try:
+        yield shadow_name
+    except BaseException:
+        with engine.begin() as conn:
+            _drop_table(conn, shadow_name)
+        raise
+
+    if not inspect(engine).has_table(shadow_name):
+        # nothing was written (e.g. an empty source); keep the live table
+        logger.warning(f"[PUBLISH] {shadow_name} was never created; {table_name} left as is")
+        return
+    swap_in_shadow(engine, table_name, shadow_name)
+    logger.info(f"[PUBLISH] Swapped {shadow_name} into {table_name}")
+
+
+def publish_dataframe(
+    df: pd.DataFrame,
+    table_name: str,
+    engine: Engine,
+    dtype: dict | None = None,
+) -> dict[str, Any]:
+    """
+    Replace a table with df, through a shadow table in 'shadow' publish mode.
+
+    Returns:
+        The write stats from write_dataframe, reported under table_name.
+    """
+    if get_publish_mode() != "shadow":
+        return write_dataframe(df, table_name, engine, dtype=dtype, if_exists="replace")
+
+    with shadow_table(engine, table_name) as shadow_name:
+        stats = write_dataframe(df, shadow_name, engine, dtype=dtype, if_exists="replace")
+    return {**stats, "table": table_name}
+
+
+def publish_chunks(
+    frames: Iterable[pd.DataFrame],
+    table_name: str,
+    engine: Engine,
+    dtype: dict | None = None,
+) -> dict[str, Any]:
+    """
+    Replace a table with a stream of frames, written as they arrive.
+
+    The first frame replaces the table and the rest are appended; in
+    'shadow' publish mode all of them go to the shadow table, which is
+    swapped in only after the last frame.
+
+    Throughput is logged once for the whole table, not per frame.
+
+    Returns:
+        dict with table, rows, seconds, rows_per_sec and batches.
+    """
+    def write_all(target: str) -> dict[str, Any]:
+        rows, seconds, batches = 0, 0.0, 0
+        for frame in frames:
+            stats = write_dataframe(
+                frame,
+                target,
+                engine,
+                dtype=dtype,
+                if_exists="replace" if batches == 0 else "append",
+                log=False,
+            )
+            rows += stats["rows"]
+            seconds += stats["seconds"]
+            batches += 1
+        rows_per_sec = log_table_throughput(table_name, rows, seconds, batches)
+        return {"table": table_name, "rows": rows, "seconds": seconds,
+                "rows_per_sec": rows_per_sec, "batches": batches}
+
+    if get_publish_mode() != "shadow":
+        return write_all(table_name)
+    with shadow_table(engine, table_name) as shadow_name:
+        return write_all(shadow_name)
+
+
+def merge_dataframe(
+    df: pd.DataFrame,
+    table_name: str,
+    engine: Engine,
+    keys: list[str],
+    dtype: dict | None = None,
+) -> dict[str, Any]:
+    """
+    Merge rows into a table by key: rows whose key already exists are
+    replaced, new keys are inserted, other rows are untouched.
+
+    The frame is written to <table>__stage first; the delete of matching
+    keys and the insert from the stage then run in one transaction.
+    Creates the table when it does not exist yet.
+
+    Returns:
+        dict with table, rows (merged) and replaced (pre-existing keys).
+    """
+    if df.empty:
+        return {"table": table_name, "rows": 0, "replaced": 0}
+    if not inspect(engine).has_table(table_name):
+        stats = write_dataframe(df, table_name, engine, dtype=dtype, if_exists="replace")
+        return {"table": table_name, "rows": stats["rows"], "replaced": 0}
+
+    stage_name = table_name + STAGE_SUFFIX
+    quote = engine.dialect.identifier_preparer.quote
+    columns = ", ".join(quote(c) for c in df.columns)
+    match = " AND ".join(f"{table_name}.{quote(k)} = s.{quote(k)}" for k in keys)
+
+    write_dataframe(df, stage_name, engine, dtype=dtype, if_exists="replace")
+    try:
+        with engine.begin() as conn:
+            replaced = conn.execute(text(
+                f"DELETE FROM {table_name} "
+                f"WHERE EXISTS (SELECT 1 FROM {stage_name} s WHERE {match})"
+            )).rowcount
+            conn.execute(text(
+                f"INSERT INTO {table_name} ({columns}) SELECT {columns} FROM {stage_name}"
+            ))
+    finally:
+        with engine.begin() as conn:
+            _drop_table(conn, stage_name)
+
+    logger.info(f"[MERGE] {table_name}: {len(df)} rows merged ({replaced} replaced)")
+    return {"table": table_name, "rows": len(df), "replaced": replaced}
+
+
+def ensure_unique_key(engine: Engine, table_name: str, keys: list[str]) -> bool:
+    """
+    Make sure keys are backed by a primary key or unique index, adding
+    ux_<table>_key when neither exists.
+
+    Returns:
+        False when the index cannot be created (e.g. the live table already
+        holds duplicate keys), True otherwise.
+    """
+    insp = inspect(engine)
+    wanted = set(keys)
+    declared = [insp.get_pk_constraint(table_name).get("constrained_columns") or []]
+    declared += [u["column_names"] for u in insp.get_unique_constraints(table_name)]
+    declared += [i["column_names"] for i in insp.get_indexes(table_name) if i.get("unique")]
+    if any(set(columns) == wanted for columns in declared):
+        return True
+
+    quote = engine.dialect.identifier_preparer.quote
+    index_name = f"ux_{table_name}_key"
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE UNIQUE INDEX {index_name} ON {table_name} "
+                f"({', '.join(quote(k) for k in keys)})"
+            ))
+    except SQLAlchemyError as e:
+        logger.warning(f"[INDEX] Could not add unique key {keys} to {table_name}: {e}")
+        return False
+    logger.info(f"[INDEX] Added {index_name} on {table_name} ({', '.join(keys)})")
+    return True
+
+
+def _upsert_sql(engine: Engine, table_name: str, stage_name: str, columns: list[str], keys: list[str]) -> str:
+    quote = engine.dialect.identifier_preparer.quote
+    column_list = ", ".join(quote(c) for c in columns)
+    updates = [c for c in columns if c not in keys]
+    if engine.dialect.name == "mysql":
+        assignments = ", ".join(f"{quote(c)} = s.{quote(c)}" for c in updates)
+        return (
+            f"INSERT INTO {table_name} ({column_list}) "
+            f"SELECT {column_list} FROM {stage_name} AS s "
+            f"ON DUPLICATE KEY UPDATE {assignments}"
+        )
+    assignments = ", ".join(f"{quote(c)} = excluded.{quote(c)}" for c in updates)
+    # WHERE true disambiguates ON CONFLICT from a join constraint in SQLite
+    return (
+        f"INSERT INTO {table_name} ({column_list}) "
+        f"SELECT {column_list} FROM {stage_name} WHERE true "
+        f"ON CONFLICT ({', '.join(quote(k) for k in keys)}) DO UPDATE SET {assignments}"
+    )
+
+
+def upsert_dataframe(
+    df: pd.DataFrame,
+    table_name: str,
+    engine: Engine,
+    keys: list[str],
+    dtype: dict | None = None,
+    ignore: tuple[str, ...] = UNCHANGED_IGNORE,
+) -> dict[str, Any]:
+    """
+    Upsert rows into a table by key, touching only rows that changed.
+
+    The frame (last row per key) is written to <table>__stage in
+    packet-sized batches. In one transaction, staged rows equal to their
+    live row on every column except keys and ignore (null-safe compare) are
+    discarded, and the remainder is upserted. Creates the table when it
+    does not exist yet; falls back to merge_dataframe() when keys cannot be
+    backed by a unique index.
+
+    Returns:
+        dict with table, rows (staged), inserted, updated and unchanged
+        (in the merge fallback, updated counts the live rows replaced).
+    """
+    empty = {"table": table_name, "rows": 0, "inserted": 0, "updated": 0, "unchanged": 0}
+    if df.empty:
+        return empty
+    df = df.drop_duplicates(subset=keys, keep="last")
+
+    if not inspect(engine).has_table(table_name):
+        stats = write_dataframe(df, table_name, engine, dtype=dtype, if_exists="replace")
+        ensure_unique_key(engine, table_name, keys)
+        return {**empty, "rows": stats["rows"], "inserted": stats["rows"]}
+    if not ensure_unique_key(engine, table_name, keys):
+        stats = merge_dataframe(df, table_name, engine, keys, dtype=dtype)
+        return {**empty, "rows": stats["rows"], "inserted": max(0, stats["rows"] - stats["replaced"]),
+                "updated": stats["replaced"]}
+
+    stage_name = table_name + STAGE_SUFFIX
+    quote = engine.dialect.identifier_preparer.quote
+    equal = "<=>" if engine.dialect.name == "mysql" else "IS"
+    match = " AND ".join(f"t.{quote(k)} = s.{quote(k)}" for k in keys)
+    same = " AND ".join(
+        f"t.{quote(c)} {equal} {stage_name}.{quote(c)}"
+        for c in df.columns
+        if c not in keys and c not in ignore
+    )
+    same_key = " AND ".join(f"t.{quote(k)} = {stage_name}.{quote(k)}" for k in keys)
+    unchanged_where = f"{same_key} AND {same}" if same else same_key
+
+    write_dataframe(df, stage_name, engine, dtype=dtype, if_exists="replace")
+    try:
+        with engine.begin() as conn:
+            unchanged = conn.execute(text(
+                f"DELETE FROM {stage_name} WHERE EXISTS (SELECT 1 FROM {table_name} t "
+                f"WHERE {unchanged_where})"
+            )).rowcount
+            updated = conn.execute(text(
+                f"SELECT COUNT(*) FROM {stage_name} s "
+                f"WHERE EXISTS (SELECT 1 FROM {table_name} t WHERE {match})"
+            )).scalar_one()
+            staged = len(df) - unchanged
+            if staged:
+                conn.execute(text(_upsert_sql(engine, table_name, stage_name, list(df.columns), keys)))
+    finally:
+        with engine.begin() as conn:
+            _drop_table(conn, stage_name)
+
+    stats = {**empty, "rows": len(df), "inserted": staged - updated, "updated": updated, "unchanged": unchanged}
+    logger.info(
+        f"[UPSERT] {table_name}: {stats['inserted']} inserted, {updated} updated, "
+        f"{unchanged} unchanged"
+    )
+    return stats
@@ -0,0 +1,35 @@
+"""
+SQL Script Helpers
+------------------
+Read the layer scripts under sql/<layer>/ and split them into statements
+that can be executed one by one through SQLAlchemy.
+
+Usage:
+    from src.core.sql_files import read_sql_file, split_statements
+    statements = split_statements(read_sql_file("gold", "create_dim_customers.sql"))
+"""
+import os
+from src.core.paths import get_project_root
+
+
+def read_sql_file(layer: str, filename: str) -> str:
+    """Return the contents of a SQL file under sql/<layer>/."""
+    sql_path = os.path.join(get_project_root(), "sql", layer, filename)
+    if not os.path.exists(sql_path):
+        raise FileNotFoundError(f"SQL file not found: {sql_path}")
+    with open(sql_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _is_comment_only(statement: str) -> bool:
+    return all(
+        not line.strip() or line.strip().startswith("--")
+        for line in statement.splitlines()
+    )
+
+
+def split_statements(sql_text: str) -> list[str]:
+    """Split a SQL script on semicolons into individual statements,
+    stripping empty and comment-only entries."""
+    statements = [s.strip() for s in sql_text.split(";") if s.strip()]
+    return [s for s in statements if not _is_comment_only(s)]
@@ -0,0 +1,146 @@
+"""
+Core Module: DataFrame Writer
+-----------------------------
+Shared write path used by every layer (bronze loaders, silver pipelines).
+
+Rows are sent as multi-VALUES INSERT statements. The number of rows per
+statement is sized from the server's max_allowed_packet and the measured
+width of the frame's rows, so wide tables get smaller batches and narrow
+tables get bigger ones. Every write reports its throughput; callers that
+write one table in several chunks turn the per-call line off (log=False)
+and report the table total with log_table_throughput().
+
+Usage:
+    from src.core.writer import write_dataframe
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from src.core.logger import setup_logger
+
+logger = setup_logger(__name__.split(".")[-1])
+
+DEFAULT_MAX_ALLOWED_PACKET = 4 * 1024 * 1024  # MySQL 5.7 default (bytes)
+PACKET_FILL_RATIO = 0.5       # leave headroom for SQL text and escaping
+MAX_BATCH_ROWS = 20_000       # cap on rows per INSERT regardless of packet size
+ROW_SAMPLE_SIZE = 1_000       # rows sampled to estimate row width
+PER_VALUE_OVERHEAD = 4        # quotes + comma + separator per value
+
+_packet_cache: dict[str, int] = {}
+
+
+def get_max_allowed_packet(engine: Engine) -> int:
+    """Return @@max_allowed_packet for the engine's server (cached per URL)."""
+    key = str(engine.url)
+    if key not in _packet_cache:
+        try:
+            with engine.connect() as conn:
+                value = conn.execute(text("SELECT @@max_allowed_packet")).scalar()
+            _packet_cache[key] = int(value or DEFAULT_MAX_ALLOWED_PACKET)
+        except Exception as e:
+            logger.warning(
+                f"[WRITE] Could not read max_allowed_packet ({e}); "
+                f"assuming {DEFAULT_MAX_ALLOWED_PACKET} bytes"
+            )
+            _packet_cache[key] = DEFAULT_MAX_ALLOWED_PACKET
+    return _packet_cache[key]
+
+
+def estimate_row_bytes(df: pd.DataFrame, sample_rows: int = ROW_SAMPLE_SIZE) -> int:
+    """Estimate the encoded size of one row as it appears in a VALUES tuple."""
+    if df.empty or len(df.columns) == 0:
+        return 1
+    sample = df.head(sample_rows)
+    total = 0
+    for column in sample.columns:
+        # NULLs are sent as the 4-byte literal NULL
+        total += sum(
+            len(str(v).encode("utf-8")) if not pd.isna(v) else 4
+            for v in sample[column].tolist()
+        )
+    mean_bytes = total / len(sample)
+    return max(1, int(mean_bytes) + PER_VALUE_OVERHEAD * len(sample.columns))
+
+
+def rows_per_batch(
+    row_bytes: int,
+    max_allowed_packet: int,
+    fill_ratio: float = PACKET_FILL_RATIO,
+    max_rows: int = MAX_BATCH_ROWS,
+) -> int:
+    """Number of rows that fit in one INSERT under the packet budget."""
+    budget = int(max_allowed_packet * fill_ratio)
+    return max(1, min(max_rows, budget // max(1, row_bytes)))
+
+
+def write_dataframe(
+    df: pd.DataFrame,
+    table_name: str,
+    engine: Engine,
+    dtype: dict | None = None,
+    if_exists: str = "replace",
+    log: bool = True,
+) -> dict[str, Any]:
+    """
+    Write a frame with adaptively sized multi-row INSERTs.
+
+    Args:
+        df: Frame to write (index is not written).
+        table_name: Target table in the engine's database.
+        engine: SQLAlchemy engine for the target layer.
+        dtype: Optional {column: SQLAlchemy type} for table creation.
+        if_exists: 'replace' | 'append' | 'fail' (as in DataFrame.to_sql).
+        log: Log this call's throughput at INFO (debug only when False,
+            for chunked writes summarized by the caller).
+
+    Returns:
+        dict with table, rows, seconds, rows_per_sec and batch_rows.
+    """
+    row_bytes = estimate_row_bytes(df)
+    batch_rows = rows_per_batch(row_bytes, get_max_allowed_packet(engine))
+
+    start = time.perf_counter()
+    df.to_sql(
+        name=table_name,
+        con=engine,
+        if_exists=if_exists,
+        index=False,
+        dtype=dtype,  # type: ignore[arg-type]
+        chunksize=batch_rows,
+        method="multi",
+    )
+    seconds = time.perf_counter() - start
+    rows_per_sec = len(df) / seconds if seconds > 0 else float(len(df))
+
+    logger.log(
+        logging.INFO if log else logging.DEBUG,
+        f"[WRITE] {table_name}: {len(df)} rows in {seconds:.2f}s "
+        f"({rows_per_sec:,.0f} rows/s, batch={batch_rows} rows, ~{row_bytes} B/row)"
+    )
+    return {
+        "table": table_name,
+        "rows": len(df),
+        "seconds": seconds,
+        "rows_per_sec": rows_per_sec,
+        "batch_rows": batch_rows,
+    }
+
+
+def log_table_throughput(table_name: str, rows: int, seconds: float, chunks: int) -> float:
+    """
+    Log the total throughput of a table written in several chunks, as one
+    [WRITE] line. Returns rows per second.
+    """
+    rows_per_sec = rows / seconds if seconds > 0 else float(rows)
+    logger.info(
+        f"[WRITE] {table_name}: {rows} rows in {seconds:.2f}s "
+        f"({rows_per_sec:,.0f} rows/s, {chunks} chunks)"
+    )
+    return rows_per_sec
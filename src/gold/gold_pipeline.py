@@ -4,40 +4,23 @@ Gold Layer Pipeline
 Reads SQL view definitions from sql/gold/create_dim_customers.sql
 and executes them against the MySQL gold database.
 """
-import os
 from sqlalchemy import text
 from src.core.logger import setup_logger
 from src.core.database import get_engine
-from src.core.paths import get_project_root
+from src.core.sql_files import read_sql_file, split_statements
 
 
 logger = setup_logger("gold_pipeline")
 
 
-def _read_sql_file(filename: str) -> str:
-    """Return the contents of a SQL file under sql/gold/."""
-    sql_path = os.path.join(get_project_root(), "sql", "gold", filename)
-    if not os.path.exists(sql_path):
-        raise FileNotFoundError(f"SQL file not found: {sql_path}")
-    with open(sql_path, "r", encoding="utf-8") as f:
-        return f.read()
-
-
-def _split_statements(sql_text: str) -> list[str]:
-    """Split a SQL script on semicolons into individual statements,
-    stripping empty entries."""
-    statements = [s.strip() for s in sql_text.split(";") if s.strip()]
-    return statements
-
-
 def run_gold_pipeline() -> None:
     """Execute all gold-layer SQL views."""
     logger.info("=" * 60)
     logger.info("[START] Starting Gold Layer Pipeline")
 
     engine = get_engine("gold")
-    sql_text = _read_sql_file("create_dim_customers.sql")
-    statements = _split_statements(sql_text)
+    sql_text = read_sql_file("gold", "create_dim_customers.sql")
+    statements = split_statements(sql_text)
 
     succeeded, failed = 0, 0
 
@@ -0,0 +1,185 @@
+"""
+Silver Module: Bronze Reader
+----------------------------
+Shared extract step for every silver pipeline.
+
+Reads a bronze table with an explicit column list instead of SELECT *, so
+bronze-only columns (raw_row JSON, row_hash, ingest_id, ...) never cross
+the wire unless a pipeline asks for them. Requested columns the table does
+not have are skipped with a warning, and the caller's schema enforcement
+reports them as missing as before.
+
+Large tables can be streamed instead: iter_bronze_table() reads through an
+unbuffered server-side cursor (stream_results) and yields fixed-size
+batches, so client memory is bounded by the batch size, not the table.
+
+With silver.dtype_backend set to 'pyarrow' (needs the optional pyarrow
+package), bronze is read with dtype_backend="pyarrow" and the silver
+schemas cast string columns to string[pyarrow] (get_string_dtype()), so
+the .str work in the transforms runs on Arrow buffers instead of Python
+objects. Without pyarrow installed the setting falls back to 'numpy' with
+a warning.
+
+Usage:
+    from src.silver.bronze_reader import read_bronze_table, iter_bronze_table, use_dtype_backend
+    df = read_bronze_table("crm_sales_details", list(schema_sales))
+    for batch in iter_bronze_table("crm_sales_details", list(schema_sales), 100_000):
+        ...
+"""
+from __future__ import annotations
+
+import importlib.util
+from contextlib import contextmanager
+from typing import Any, Iterator, Sequence
+
+import pandas as pd
+from sqlalchemy import inspect, text
+
+from src.core.config import load_pipeline_config
+from src.core.database import get_engine
+from src.core.logger import setup_logger
+
+logger = setup_logger(__name__.split(".")[-1])
+
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+_backend_override: str | None = None
+
+
+def _pyarrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def get_dtype_backend() -> str:
+    """
+    silver.dtype_backend from pipeline_config.yaml: 'numpy' (default) or
+    'pyarrow'; 'pyarrow' degrades to 'numpy' when pyarrow is not installed.
+    """
+    configured = (load_pipeline_config().get("silver", {}) or {}).get("dtype_backend")
+    backend = _backend_override or configured or "numpy"
+    if backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Unknown silver.dtype_backend '{backend}' (expected one of {DTYPE_BACKENDS})")
+    if backend == "pyarrow" and not _pyarrow_available():
+        logger.warning("[EXTRACT] silver.dtype_backend is 'pyarrow' but pyarrow is not installed; using numpy")
+        return "numpy"
+    return backend
+
+
+@contextmanager
+def use_dtype_backend(backend: str) -> Iterator[None]:
+    """Run a block under a given backend regardless of the config (benchmarks, tests)."""
+    global _backend_override
+    previous, _backend_override = _backend_override, backend
+    try:
+        yield
+    finally:
+        _backend_override = previous
+
+
+def get_string_dtype(backend: str | None = None) -> str:
+    """Dtype the silver schemas use for 'string' columns under a backend."""
+    backend = backend if backend is not None else get_dtype_backend()
+    return "string[pyarrow]" if backend == "pyarrow" else "string"
+
+
+def _read_options(backend: str | None) -> dict:
+    backend = backend if backend is not None else get_dtype_backend()
+    return {"dtype_backend": "pyarrow"} if backend == "pyarrow" else {}
+
+
+def _range_filter(ingest_range: tuple[int, int] | None) -> str:
+    if ingest_range is None:
+        return ""
+    after, upto = (int(v) for v in ingest_range)
+    return f" WHERE ingest_id > {after} AND ingest_id <= {upto}"
+
+
+def build_select(
+    engine: Any,
+    table_name: str,
+    columns: Sequence[str] | None,
+    ingest_range: tuple[int, int] | None = None,
+) -> str:
+    """
+    SELECT statement for the requested columns that exist in the table,
+    in the requested order; all columns when columns is None. ingest_range
+    (after, upto) limits it to rows with after < ingest_id <= upto.
+    """
+    if columns is None:
+        return f"SELECT * FROM {table_name}" + _range_filter(ingest_range)
+
+    available = {c["name"] for c in inspect(engine).get_columns(table_name)}
+    missing = [c for c in columns if c not in available]
+    if missing:
+        logger.warning(f"[EXTRACT] {table_name} lacks requested columns: {missing}")
+    selected = [c for c in columns if c in available]
+    if not selected:
+        raise ValueError(f"None of the requested columns exist in {table_name}: {list(columns)}")
+
+    quote = engine.dialect.identifier_preparer.quote
+    return (
+        f"SELECT {', '.join(quote(c) for c in selected)} FROM {table_name}"
+        + _range_filter(ingest_range)
+    )
+
+
+def read_bronze_table(
+    table_name: str,
+    columns: Sequence[str] | None = None,
+    engine: Any = None,
+    ingest_range: tuple[int, int] | None = None,
+    dtype_backend: str | None = None,
+) -> pd.DataFrame:
+    """
+    Extract a bronze table for a silver pipeline.
+
+    Args:
+        table_name: Bronze table to read.
+        columns: Columns the silver schema needs; None reads every column.
+        engine: Engine to read from; defaults to the bronze engine.
+        ingest_range: Optional (after, upto) ingest_id window for delta reads.
+        dtype_backend: 'numpy' or 'pyarrow'; defaults to get_dtype_backend().
+    """
+    engine = engine if engine is not None else get_engine("bronze")
+    options = _read_options(dtype_backend)
+    try:
+        return pd.read_sql(build_select(engine, table_name, columns, ingest_range), engine, **options)
+    except Exception as e:
+        raise RuntimeError(f"Failed to extract from bronze table {table_name}") from e
+
+
+def get_silver_chunk_size() -> int | None:
+    """Rows per streamed batch from pipeline_config.yaml (silver.chunk_size); None = one frame."""
+    chunk_size = (load_pipeline_config().get("silver", {}) or {}).get("chunk_size")
+    return int(chunk_size) if chunk_size else None
+
+
+def iter_bronze_table(
+    table_name: str,
+    columns: Sequence[str] | None,
+    chunk_size: int,
+    engine: Any = None,
+    ingest_range: tuple[int, int] | None = None,
+    dtype_backend: str | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a bronze table in batches of at most chunk_size rows.
+
+    Rows come from a server-side cursor (stream_results=True; an unbuffered
+    SSCursor on MySQL), so only one batch is held client-side at a time.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    engine = engine if engine is not None else get_engine("bronze")
+    options = _read_options(dtype_backend)
+
+    try:
+        sql = build_select(engine, table_name, columns, ingest_range)
+        with engine.connect() as conn:
+            conn = conn.execution_options(stream_results=True, max_row_buffer=chunk_size)
+            total_rows = 0
+            for batch in pd.read_sql(text(sql), conn, chunksize=chunk_size, **options):
+                total_rows += len(batch)
+                yield batch
+    except Exception as e:
+        raise RuntimeError(f"Failed to stream from bronze table {table_name}") from e
+    logger.info(f"[EXTRACT] Streamed {total_rows} rows from {table_name}")
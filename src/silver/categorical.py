@@ -0,0 +1,172 @@
+"""
+Silver Module: Categorical Encoding
+-----------------------------------
+Low-cardinality string columns (gender, marital status, product line,
+country, category...) hold a handful of distinct values repeated on
+every row. encode_categoricals() turns such columns into pandas
+'category' columns (small integer codes + one copy of each value) and
+logs the table's memory before and after.
+
+Value mappings then run on the categories instead of the rows:
+map_categories() applies a function to the distinct values only and
+rebuilds the column by re-pointing the codes, so standardizing a
+million-row gender column costs a mapping over two or three strings.
+fill_na() fills missing values, adding the fill value as a category.
+
+Fixed {old: new} value maps (the ERP replacement dicts) are compiled once
+by compile_replacements() into lookup arrays; replace_values() matches
+the stripped distinct values against them with one Index.get_indexer
+call and re-points the codes, without touching the rest of the frame.
+
+Categorical columns are written by to_sql like the string columns they
+replace, so silver table definitions do not change.
+
+Usage:
+    from src.silver.categorical import encode_categoricals, fill_na, map_categories
+    encode_categoricals(df, "crm_customers_info")
+    df["cst_gndr"] = fill_na(map_categories(df["cst_gndr"], lambda v: v.str.lower().map(GENDER)), "n/a")
+    replaced = replace_values(df["country_name"], compile_mapping({"US": "United States"}))
+"""
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from src.core.logger import setup_logger
+
+logger = setup_logger(__name__.split(".")[-1])
+
+# encode a string column when it has at most this many distinct values...
+CATEGORY_MAX_UNIQUE = 64
+# ...and they make up at most this share of its rows
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _memory_mb(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True, index=False).sum() / 1e6
+
+
+def encode_categoricals(
+    df: pd.DataFrame,
+    table_name: str,
+    columns: Iterable[str] | None = None,
+    max_unique: int = CATEGORY_MAX_UNIQUE,
+    max_ratio: float = CATEGORY_MAX_UNIQUE_RATIO,
+) -> list[str]:
+    """
+    Convert low-cardinality string columns of df to 'category', in place.
+
+    Args:
+        df: Frame to encode.
+        table_name: Name used in the memory report.
+        columns: Candidate columns; defaults to all string columns.
+        max_unique: Upper bound on distinct values.
+        max_ratio: Upper bound on distinct values / rows.
+
+    Returns:
+        The columns that were encoded.
+    """
+    columns = list(columns) if columns is not None else list(df.select_dtypes(include="string").columns)
+    if df.empty:
+        return []
+    before = _memory_mb(df)
+
+    encoded = []
+    for column in columns:
+        if column not in df.columns or isinstance(df[column].dtype, pd.CategoricalDtype):
+            continue
+        distinct = df[column].nunique(dropna=True)
+        if distinct <= max_unique and distinct <= len(df) * max_ratio:
+            df[column] = df[column].astype("category")
+            encoded.append(column)
+
+    after = _memory_mb(df)
+    logger.info(
+        f"[MEMORY] {table_name}: {before:.2f} MB -> {after:.2f} MB "
+        f"({len(encoded)} categorical columns: {', '.join(encoded) or '-'})"
+    )
+    return encoded
+
+
+def _from_mapped(values: pd.Series, codes: np.ndarray, mapped: np.ndarray) -> pd.Series:
+    """Category column of mapped[code] per row (missing codes stay missing)."""
+    # several old values may map to the same new one (US, USA -> United States)
+    new_codes, new_categories = pd.factorize(mapped)
+    remapped = np.where(codes >= 0, new_codes.take(codes, mode="clip"), -1)
+    result = pd.Categorical.from_codes(remapped, categories=pd.Index(new_categories, dtype="string"))
+    return pd.Series(result, index=values.index, name=values.name)
+
+
+def map_categories(values: pd.Series, func: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    Apply a value mapping to the distinct values of a column.
+
+    Args:
+        values: Column to map (encoded to 'category' first if needed).
+        func: Takes a string Series of the distinct values and returns the
+            mapped values, aligned with it (NA to drop a value).
+
+    Returns:
+        A 'category' column holding func(value) for every row; values that
+        were missing stay missing.
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype("category")
+    categories = values.cat.categories
+    if len(categories) == 0:
+        return values
+    mapped = func(pd.Series(categories.astype("string"), dtype="string"))
+    mapped = pd.Series(mapped).to_numpy(dtype=object, na_value=None)
+    return _from_mapped(values, values.cat.codes.to_numpy(), mapped)
+
+
+def compile_mapping(mapping: dict) -> tuple[pd.Index, np.ndarray]:
+    """
+    Lookup arrays for a {old value: new value} map: the old values as an
+    Index (hashed once) and the new values aligned with it (None for NA).
+    """
+    old = pd.Index(list(mapping), dtype=object)
+    new = np.array([None if pd.isna(v) else v for v in mapping.values()], dtype=object)
+    return old, new
+
+
+def compile_replacements(replacements: dict[str, dict]) -> dict[str, tuple[pd.Index, np.ndarray]]:
+    """compile_mapping() for each column of {column: {old: new}}."""
+    return {column: compile_mapping(mapping) for column, mapping in replacements.items()}
+
+
+def replace_values(values: pd.Series, compiled: tuple[pd.Index, np.ndarray]) -> tuple[pd.Series, int]:
+    """
+    Replace values of a column through compiled lookup arrays, matching
+    after stripping whitespace; unmatched values are kept (stripped).
+
+    Works on the category codes when values is categorical, otherwise on
+    a factorization of it; either way only the distinct values are looked
+    up.
+
+    Returns:
+        (replaced 'category' column, number of rows whose value matched)
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, uniques = pd.factorize(values)
+    if len(uniques) == 0:
+        return values.astype("category"), 0
+
+    old, new = compiled
+    stripped = pd.Index(uniques).astype("string").str.strip().to_numpy(dtype=object, na_value=None)
+    position = old.get_indexer(stripped)
+    matched = position >= 0
+    mapped = np.where(matched, new.take(position, mode="clip"), stripped)
+    hits = int(matched.take(codes[codes >= 0]).sum())
+    return _from_mapped(values, codes, mapped), hits
+
+
+def fill_na(values: pd.Series, value: str) -> pd.Series:
+    """fillna that also works on 'category' columns without value as a category."""
+    if isinstance(values.dtype, pd.CategoricalDtype) and value not in values.cat.categories:
+        values = values.cat.add_categories([value])
+    return values.fillna(value)
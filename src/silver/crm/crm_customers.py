@@ -1,5 +1,5 @@
 import pandas as pd
-from sqlalchemy import String, Date, DateTime
+from sqlalchemy import String, Date, DateTime, inspect
 
 # # Setup path for module imports
 # _current_file = Path(__file__).resolve()
@@ -11,16 +11,18 @@ from sqlalchemy import String, Date, DateTime
 # from utils.db_connection import get_engine
 # from utils.logger import setup_logger
 from src.core.database import get_engine
+from src.silver.bronze_reader import get_string_dtype, read_bronze_table
+from src.silver.categorical import encode_categoricals, fill_na, map_categories
+from src.silver.date_parser import parse_date_column
+from src.silver.dedup import keep_latest
+from src.silver.normalize import normalize_strings
+from src.silver.watermarks import ingest_range, plan_extract, publish_silver
 from src.core.logger import setup_logger
 
 logger = setup_logger("crm_customers")
 
-def extract_from_bronze(table_name: str) -> pd.DataFrame:
-    engine = get_engine("bronze")
-    try:
-        return pd.read_sql(f"SELECT * FROM {table_name}", engine)
-    except Exception as e:
-        raise RuntimeError(f"Failed to extract from bronze table {table_name}") from e
+def extract_from_bronze(table_name: str, plan: dict | None = None) -> pd.DataFrame:
+    return read_bronze_table(table_name, columns=list(schema_customer), ingest_range=ingest_range(plan))
 #! Define schema for data types
 schema_customer ={
     "cst_id"              : "string",
@@ -34,23 +36,14 @@ schema_customer ={
 
 #! combined normalization function for all string columns in the dataframe
 def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
-    str_cols = df.select_dtypes(include="string").columns
-    for col in str_cols:
-        logger.info(f"Normalizing nulls in column: {col}")
-        df[col] = (
-            df[col]
-            .str.strip()
-            .replace(
-                ["", "NULL", "null", "None", "none", "nan", "NaN"], 
-                pd.NA
-                )
-        )
-    df.drop("raw_row",axis=1,inplace=True)
-    df[["cst_firstname","cst_lastname"]] = df[["cst_firstname","cst_lastname"]].apply(lambda x: x.str.strip().str.title())
+    df = df.drop(columns="raw_row", errors="ignore")
+    converted = normalize_strings(df, title_columns=["cst_firstname", "cst_lastname"])
+    logger.info(f"[NULLS] Null tokens converted per column: {converted}")
     return df
 
 #! high level schema enforcement function 
 def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    string_dtype = get_string_dtype()  # 'string' or 'string[pyarrow]' (silver.dtype_backend)
     for column, dtype in schema.items():
 
         if column not in df.columns:
@@ -62,11 +55,11 @@ def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
             if dtype == "Int64":
                 df[column] = df[column].astype("Int64")
         elif dtype.startswith("datetime"):
-            df[column] = pd.to_datetime(df[column], errors="coerce")
+            df[column] = parse_date_column(df[column], column)
         elif dtype == "boolean":
             df[column] = df[column].astype("boolean")
         elif dtype == "string":
-            df[column] = df[column].astype("string")
+            df[column] = df[column].astype(string_dtype)
         else:
             # fallback (rare cases)
             df[column] = df[column].astype(dtype)
@@ -97,27 +90,26 @@ def standardize_data(df: pd.DataFrame) -> pd.DataFrame:
 
     if df.empty:
         return df
-    #! Gender Standardization
-    df["cst_gndr"] = (
-        df["cst_gndr"]
-        .str.lower()
-        .map({
+    #! Gender Standardization (mapped on the distinct values only)
+    df["cst_gndr"] = map_categories(
+        df["cst_gndr"],
+        lambda values: values.str.lower().map({
             "m": "Male",
             "f": "Female",
-        })
+        }),
     )
 
     #!Marital Status Standardization
-    df["cst_marital_status"] = (
-        df["cst_marital_status"]
-        .str.lower()
-        .map({
+    df["cst_marital_status"] = map_categories(
+        df["cst_marital_status"],
+        lambda values: values.str.lower().map({
             "s": "Single",
             "m": "Married",
-        })
+        }),
     )
 
-    df[["cst_gndr","cst_marital_status"]] = df[["cst_gndr","cst_marital_status"]].fillna("n/a")
+    for column in ("cst_gndr", "cst_marital_status"):
+        df[column] = fill_na(df[column], "n/a")
 
     return df
 
@@ -132,15 +124,8 @@ def deduplicate_latest_by_date(
         logger.info("[DEDUP] Empty DataFrame.")
         return df, pd.DataFrame()
 
-    df = df.copy()
-    sort_cols = [primary_key, date_col]
-    ascending_order = [True, False]    
-    # Sort so latest records come first per primary key
-    df_sorted = df.sort_values(by=sort_cols, ascending=ascending_order)
-    # Keep latest per primary key
-    kept_rows = df_sorted.drop_duplicates(subset=primary_key, keep="first")
-    #! Identify deleted rows based on index difference
-    deleted_rows = df_sorted[~df_sorted.index.isin(kept_rows.index)]
+    #! hash-based keep-latest: one grouped idxmax, no sort, no copy
+    kept_rows, deleted_rows = keep_latest(df, [primary_key], date_col)
 	#! logging into log file for debugging and monitoring how many duplicates were found and removed
     logger.info(f"[DEDUP] Total rows   : {len(df)}")
     logger.info(f"[DEDUP] Kept rows    : {len(kept_rows)}")
@@ -161,10 +146,37 @@ def remove_null_primary_keys(df: pd.DataFrame, primary_key: str) -> pd.DataFrame
 
     return df_clean
 
+#! incremental runs: never let an older record overwrite a newer silver one
+def drop_outdated_updates(df: pd.DataFrame, engine) -> pd.DataFrame:
+    """
+    Drop delta rows whose cst_create_date is older than the silver row with
+    the same cst_id, so a delta merge keeps the same "latest record wins"
+    outcome as a full recompute.
+    """
+    if df.empty or not inspect(engine).has_table("crm_customers_info"):
+        return df
+    current = pd.read_sql("SELECT cst_id, cst_create_date FROM crm_customers_info", engine)
+    current["cst_create_date"] = pd.to_datetime(current["cst_create_date"], errors="coerce")
+    merged = df.merge(current, on="cst_id", how="left", suffixes=("", "_silver"))
+    keep = (
+        merged["cst_create_date_silver"].isna()
+        | (merged["cst_create_date"] >= merged["cst_create_date_silver"])
+    ).to_numpy()
+    dropped = int((~keep).sum())
+    if dropped:
+        logger.info(f"[MERGE] {dropped} delta customers older than silver skipped")
+    return df.loc[keep]
+
+
 def run_customers_pipeline(table_name: str)-> None:
-    df_customers = extract_from_bronze(table_name)
+    plan = plan_extract("crm_customers_info", table_name)
+    if plan["mode"] == "none":
+        logger.info("[WATERMARK] crm_customers_info is up to date; nothing to process")
+        return
+    df_customers = extract_from_bronze(table_name, plan)
     df_customers = enforce_schema(df_customers, schema_customer) # object → string, datetime → datetime64, etc.
     df_customers = normalize_data(df_customers)           
+    encode_categoricals(df_customers, "crm_customers_info")
     df_customers = standardize_data(df_customers) # standardize gender and marital status values  
     df_customers = remove_null_primary_keys(df_customers, primary_key="cst_id")
 
@@ -180,13 +192,14 @@ def run_customers_pipeline(table_name: str)-> None:
         "cst_create_date_raw": "cst_create_date"
     })
     df_customers["loaded_at"] = pd.Timestamp.now()
+    if plan["mode"] == "delta":
+        df_customers = drop_outdated_updates(df_customers, get_engine("silver"))
 
-    df_customers.to_sql(
-        name = "crm_customers_info",
-        con  = get_engine("silver"),
-         if_exists = "replace",
-         index=False,
-         dtype={
+    publish_silver(
+        df_customers,
+        "crm_customers_info",
+        plan=plan,
+        dtype={
             "cst_id"              : String(50),
             "cst_key"             : String(100),
             "cst_firstname"       : String(200),
@@ -195,9 +208,8 @@ def run_customers_pipeline(table_name: str)-> None:
             "cst_gender"          : String(50),
             "cst_create_date"     : Date(),
             "loaded_at"           : DateTime()
-         }, # type: ignore
-         chunksize=1000
-         )
+        }, # type: ignore
+    )
 
 if __name__ == "__main__":
     run_customers_pipeline("crm_customers_info")
\ No newline at end of file
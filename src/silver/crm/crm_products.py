@@ -1,15 +1,16 @@
 import pandas as pd
-from src.core.database import get_engine
+from src.silver.bronze_reader import get_string_dtype, read_bronze_table
+from src.silver.categorical import encode_categoricals, fill_na, map_categories
+from src.silver.date_parser import parse_date_column
+from src.silver.normalize import normalize_strings
+from src.silver.scd2 import close_versions
+from src.silver.watermarks import ingest_range, plan_extract, publish_silver_versions
 from src.core.logger import setup_logger
 from sqlalchemy import Date, String, Numeric, DateTime
 logger = setup_logger(__name__.split(".")[-1])
 
-def extract_from_bronze(table_name: str) -> pd.DataFrame:
-    engine = get_engine("bronze")
-    try:
-        return pd.read_sql(f"SELECT * FROM {table_name}", engine)
-    except Exception as e:
-        raise RuntimeError(f"Failed to extract from bronze table {table_name}") from e
+def extract_from_bronze(table_name: str, plan: dict | None = None) -> pd.DataFrame:
+    return read_bronze_table(table_name, columns=list(schema_products), ingest_range=ingest_range(plan))
     
 schema_products = {
     "prd_id"              : "int",
@@ -22,6 +23,7 @@ schema_products = {
     }
 
 def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    string_dtype = get_string_dtype()  # 'string' or 'string[pyarrow]' (silver.dtype_backend)
     for column, dtype in schema.items():
 
         if column not in df.columns:
@@ -33,11 +35,11 @@ def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
             if dtype == "Int64":
                 df[column] = df[column].astype("Int64")
         elif dtype.startswith("datetime"):
-            df[column] = pd.to_datetime(df[column], errors="coerce")
+            df[column] = parse_date_column(df[column], column)
         elif dtype == "boolean":
             df[column] = df[column].astype("boolean")
         elif dtype == "string":
-            df[column] = df[column].astype("string")    
+            df[column] = df[column].astype(string_dtype)    
         else:
             # fallback (rare cases)
             df[column] = df[column].astype(dtype)
@@ -45,19 +47,9 @@ def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
     return df
 
 def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
-    str_cols = df.select_dtypes(include="string").columns
-    for col in str_cols:
-        logger.info(f"Normalizing nulls in column: {col}")
-        df[col] = (
-            df[col]
-            .str.strip()
-            .replace(
-                ["", "NULL", "null", "None", "none", "nan", "NaN"], 
-                pd.NA
-                )
-        )
-    df.drop("raw_row",axis=1,inplace=True)
-    df["prd_name"] = df["prd_name"].str.strip().str.title()
+    df = df.drop(columns="raw_row", errors="ignore")
+    converted = normalize_strings(df, title_columns=["prd_name"])
+    logger.info(f"[NULLS] Null tokens converted per column: {converted}")
     return df
 
 def standardize_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -65,21 +57,22 @@ def standardize_data(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
     #! Product Line Standardization
-    df["prd_line"] = (
-        df["prd_line"]
-        .str.strip().replace({
-    "R": "Road",
-	"M": "Mountain",
-	"T": "Touring",
-	"S": "Other sales"
-        })
+    df["prd_line"] = map_categories(
+        df["prd_line"],
+        lambda values: values.str.strip().replace({
+            "R": "Road",
+            "M": "Mountain",
+            "T": "Touring",
+            "S": "Other sales"
+        }),
     )
-    df["prd_line"] = df["prd_line"].fillna("n/a")
+    df["prd_line"] = fill_na(df["prd_line"], "n/a")
     df["prd_cost"] = df["prd_cost"].fillna(0)
     # df["prd_end_date_raw"] = df["prd_start_date_raw"].shift(-1) + pd.Timedelta(weeks=26)
- #! window function [LEAD]
-    df = df.sort_values(by=["prd_key", "prd_start_date_raw"])
-    df["prd_end_date_raw"] = (df.groupby("prd_key")["prd_start_date_raw"].shift(-1) - pd.Timedelta(days=1))
+    # end date = day before the next version of the product starts; on a
+    # delta run this only covers the new versions and is redone against the
+    # stored history by publish_silver_versions
+    df = close_versions(df, ["prd_key"], "prd_start_date_raw", "prd_end_date_raw")
     return df
 
 #!transformation function to create new columns based on existing ones
@@ -111,9 +104,14 @@ def data_quality_checks(df: pd.DataFrame)-> None:
     
 
 def run_products_pipeline(table_name: str) -> None:
-    df_products = extract_from_bronze(table_name)
+    plan = plan_extract("crm_prd_info", table_name)
+    if plan["mode"] == "none":
+        logger.info("[WATERMARK] crm_prd_info is up to date; nothing to process")
+        return
+    df_products = extract_from_bronze(table_name, plan)
     df_products = enforce_schema(df_products, schema_products)
     df_products = normalize_data(df_products)
+    encode_categoricals(df_products, "crm_prd_info")
     df_products = standardize_data(df_products)
     df_products = transform_crm_products(df_products)
     data_quality_checks(df_products) 
@@ -124,11 +122,13 @@ def run_products_pipeline(table_name: str) -> None:
     })
     df_products["loaded_at"] = pd.Timestamp.now()
 
-    df_products.to_sql(
-        name = "crm_prd_info",
-        con  = get_engine("silver"),
-        if_exists = "replace",
-        index=False,
+    publish_silver_versions(
+        df_products,
+        "crm_prd_info",
+        plan=plan,
+        keys=["cat_id", "prd_key"],  # the bronze prd_key, split by transform_crm_products
+        start_col="prd_start_dt",
+        end_col="prd_end_dt",
         dtype={
             "prd_id"              : String(50),
             "prd_key"             : String(100),
@@ -139,9 +139,8 @@ def run_products_pipeline(table_name: str) -> None:
             "prd_start_dt"        : Date(),
             "prd_end_dt"          : Date(),
             "loaded_at"           : DateTime()
-         }, # type: ignore
-         chunksize=1000
-         )
+        }, # type: ignore
+    )
     
 
 if __name__ == "__main__":
@@ -1,5 +1,9 @@
 import pandas as pd
-from src.core.database import get_engine
+from src.silver.bronze_reader import get_silver_chunk_size, get_string_dtype, iter_bronze_table, read_bronze_table
+from src.silver.date_parser import parse_date_column, parse_dates
+from src.silver.normalize import normalize_strings
+from src.silver.validation import get_rules, split_valid
+from src.silver.watermarks import ingest_range, plan_extract, publish_silver, publish_silver_chunks
 from src.core.logger import setup_logger
 from sqlalchemy import String, Integer, Numeric, DateTime, Date
 
@@ -14,12 +18,8 @@ from sqlalchemy import String, Integer, Numeric, DateTime, Date
 
 logger = setup_logger(__name__.split(".")[-1])
 
-def extract_from_bronze(table_name: str) -> pd.DataFrame:
-    engine = get_engine("bronze")
-    try:
-        return pd.read_sql(f"SELECT * FROM {table_name}", engine)
-    except Exception as e:
-        raise RuntimeError(f"Failed to extract from bronze table {table_name}") from e
+def extract_from_bronze(table_name: str, plan: dict | None = None) -> pd.DataFrame:
+    return read_bronze_table(table_name, columns=list(schema_sales), ingest_range=ingest_range(plan))
 
 #! Define expected schema for sales data
 schema_sales = {
@@ -46,6 +46,7 @@ def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame with updated datatypes.
     """
+    string_dtype = get_string_dtype()  # 'string' or 'string[pyarrow]' (silver.dtype_backend)
     for column, dtype in schema.items():
 
         if column not in df.columns:
@@ -57,11 +58,11 @@ def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
             if dtype == "Int64":
                 df[column] = df[column].astype("Int64")
         elif dtype.startswith("datetime"):
-            df[column] = pd.to_datetime(df[column], errors="coerce")
+            df[column] = parse_date_column(df[column], column)
         elif dtype == "boolean":
             df[column] = df[column].astype("boolean")
         elif dtype == "string":
-            df[column] = df[column].astype("string")    
+            df[column] = df[column].astype(string_dtype)    
         else:
             # fallback (rare cases)
             df[column] = df[column].astype(dtype)
@@ -84,18 +85,9 @@ def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Cleaned and normalized dataframe.
     """
-    str_cols = df.select_dtypes(include="string").columns
-    for col in str_cols:
-        logger.info(f"Normalizing nulls in column: {col}")
-        df[col] = (
-            df[col]
-            .str.strip()
-            .replace(
-                ["", "NULL", "null", "None", "none", "nan", "NaN"], 
-                pd.NA
-                )
-        )
-    df.drop("raw_row",axis=1,inplace=True)
+    df = df.drop(columns="raw_row", errors="ignore")
+    converted = normalize_strings(df)
+    logger.info(f"[NULLS] Null tokens converted per column: {converted}")
     return df
 
 
@@ -104,36 +96,32 @@ def normalize_data(df: pd.DataFrame) -> pd.DataFrame:
 def datetime_conversion(df:pd.DataFrame) -> pd.DataFrame:
     """
     Converts raw date columns to proper datetime format and logs conversion issues.
+    Columns already parsed by enforce_schema are left as they are.
     """
     date_cols = [col for col in df.columns if col.endswith("_date_raw")]
-    for col in date_cols:
-        df[col] = pd.to_datetime(df[col], format = "%Y-%m-%d", errors="coerce")
-        null_count = df[col].isna().sum()
-        logger.info(f"Converted {col} to datetime. Null values after conversion: {null_count}")
-        logger.info(f"{col} -> {null_count} invalid dates converted to NaT")
+    parse_dates(df, [col for col in date_cols if not pd.api.types.is_datetime64_any_dtype(df[col])])
     return df
 
+#! business rules: each expression is true for the rows that violate it
+#! (overridden by silver.validation_rules.crm_sales_details in pipeline_config.yaml)
+SALES_RULES = [
+    {"name": "negative_price",    "expr": "sales_price < 0"},
+    {"name": "negative_quantity", "expr": "sales_quantity < 0"},
+    {"name": "negative_sales",    "expr": "sales_sales < 0"},
+    {"name": "order_after_ship",  "expr": "sales_order_date_raw > sales_ship_date_raw"},
+    {"name": "missing_quantity",  "expr": "sales_quantity.isna()"},
+    {"name": "missing_price",     "expr": "sales_price.isna()"},
+]
+
 #! data validation function
-def validate_data(df: pd.DataFrame)-> tuple[pd.DataFrame, pd.DataFrame]:
+def validate_data(df: pd.DataFrame, rules: list[dict] | None = None)-> tuple[pd.DataFrame, pd.DataFrame]:
     """ Validates data against business rules and logs any issues found. 
         Example rules: 
         - valid_df: Records that passed validation 
-        - invalid_df: Records thar failed validation and were logged for review """
-    invalid_mask = (
-        (df["sales_price"] < 0) |
-        (df["sales_quantity"] < 0) |
-        (df["sales_sales"] < 0) |
-        (df["sales_order_date_raw"] > df["sales_ship_date_raw"]) |
-        (df["sales_quantity"].isna()) |
-        (df["sales_price"].isna())
-    )
-
-    invalid_df = df.loc[invalid_mask].copy()
-    valid_df = df.loc[~invalid_mask].copy()
-
-    if not invalid_df.empty:
-        logger.warning(f"{len(invalid_df)} invalid records detected.")
-
+        - invalid_df: Records thar failed validation and were logged for review,
+          with a 'violations' bitmask of the rules they broke """
+    rules = rules if rules is not None else get_rules("crm_sales_details", default=SALES_RULES)
+    valid_df, invalid_df, _ = split_valid(df, "crm_sales_details", rules)
     return valid_df, invalid_df
 
 #!treating some colums [e.g sales_sales, sales_quality,sales_price]
@@ -159,13 +147,35 @@ def clean_sales_data(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
     
-def run_sales_pipeline(table_name: str)-> None:
-    df_sales = extract_from_bronze(table_name)
+#! silver column types for crm_sales_details
+silver_sales_dtype = {
+    "sales_ord_num"       : String(100),
+    "sales_prd_key"       : String(100),
+    "sales_cust_id"       : String(50),
+    "sales_sales"         : Numeric(12,2),
+    "sales_quantity"      : Integer(),
+    "sales_price"         : Numeric(12,2),
+    "sales_order_date"    : Date(),
+    "sales_ship_date"     : Date(),
+    "sales_due_date"      : Date(),
+    "loaded_at"           : DateTime()
+}
+
+
+def transform_sales(df_sales: pd.DataFrame, rules: list[dict] | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Run one bronze batch through schema enforcement, normalization,
+    validation and cleaning. Every step is row-local, so batches can be
+    transformed independently. rules are the validation rules (read from
+    the config when not given).
+
+    Returns:
+        (valid rows in silver layout, invalid rows)
+    """
     df_sales = enforce_schema(df_sales, schema_sales)
-    df_sales = normalize_data(df_sales)
-    df_sales = datetime_conversion(df_sales)
+    df_sales = normalize_data(df_sales)  # dates were parsed once, in enforce_schema
 
-    valid_df, invalid_df = validate_data(df_sales)
+    valid_df, invalid_df = validate_data(df_sales, rules)
 
     logger.info(f"Valid records: {len(valid_df)}")
     logger.info(f"Invalid records: {len(invalid_df)}")
@@ -179,25 +189,48 @@ def run_sales_pipeline(table_name: str)-> None:
         "sales_due_date_raw": "sales_due_date"
     })
     valid_df["loaded_at"] = pd.Timestamp.now()
+    return valid_df, invalid_df
+
+
+def run_sales_pipeline(table_name: str, chunk_size: int | None = None)-> None:
+    """
+    Build silver crm_sales_details from bronze.
+
+    With silver.incremental on, only bronze rows past the table's watermark
+    are processed and merged in by (sales_ord_num, sales_prd_key); otherwise
+    the table is recomputed. With a chunk size (argument or
+    silver.chunk_size) bronze is streamed through a server-side cursor and
+    each batch is transformed and written before the next is fetched, so
+    memory stays flat as the table grows.
+    """
+    plan = plan_extract("crm_sales_details", table_name)
+    if plan["mode"] == "none":
+        logger.info("[WATERMARK] crm_sales_details is up to date; nothing to process")
+        return
+
+    rules = get_rules("crm_sales_details", default=SALES_RULES)
+    chunk_size = chunk_size if chunk_size is not None else get_silver_chunk_size()
+    if chunk_size:
+        batches = (
+            transform_sales(batch, rules)[0]
+            for batch in iter_bronze_table(
+                table_name, list(schema_sales), chunk_size, ingest_range=ingest_range(plan)
+            )
+        )
+        stats = publish_silver_chunks(batches, "crm_sales_details", silver_sales_dtype, plan)  # type: ignore
+        logger.info(f"[STREAM] crm_sales_details: {stats['rows']} rows in {stats['batches']} batches")
+        return
+
+    df_sales = extract_from_bronze(table_name, plan)
+    valid_df, _ = transform_sales(df_sales, rules)
+
+    publish_silver(
+        valid_df,
+        "crm_sales_details",
+        dtype=silver_sales_dtype, # type: ignore
+        plan=plan,
+    )
+
 
-    valid_df.to_sql(
-        name = "crm_sales_details",
-        con  = get_engine("silver"),
-        if_exists = "replace",
-        index=False,
-        dtype={
-            "sales_ord_num"       : String(100),
-            "sales_prd_key"       : String(100),
-            "sales_cust_id"       : String(50),
-            "sales_sales"         : Numeric(12,2),
-            "sales_quantity"      : Integer(),
-            "sales_price"         : Numeric(12,2),
-            "sales_order_date"    : Date(),
-            "sales_ship_date"     : Date(),
-            "sales_due_date"      : Date(),
-            "loaded_at"           : DateTime()
-         }, # type: ignore
-         chunksize=1000
-         )
 if __name__ == "__main__":
-    run_sales_pipeline("crm_sales_details")
\ No newline at end of file
+    run_sales_pipeline("crm_sales_details")
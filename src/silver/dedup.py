@@ -0,0 +1,75 @@
+"""
+Silver Module: Deduplication
+----------------------------
+Keep-latest deduplication for any silver table with a primary key and a
+recency column.
+
+keep_latest() hashes the key columns into group codes, takes the
+position of the most recent row per group with a single grouped idxmax,
+and splits the frame with one boolean mask. There is no sort and no
+defensive copy of the input; the only copies are the kept and deleted
+frames themselves. Both keep the input's row order.
+
+- ties on the recency column keep the first row in input order
+- missing recency values (NaT/NaN) lose to any present value
+- missing keys form their own group, as in drop_duplicates
+
+Usage:
+    from src.silver.dedup import keep_latest
+    kept, deleted = keep_latest(df, ["cst_id"], "cst_create_date_raw")
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.core.logger import setup_logger
+
+logger = setup_logger(__name__.split(".")[-1])
+
+
+def _group_codes(df: pd.DataFrame, keys: list[str]) -> np.ndarray:
+    if len(keys) == 1:
+        return pd.factorize(df[keys[0]], use_na_sentinel=False)[0]
+    return df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+
+
+def _recency_rank(values: pd.Series) -> np.ndarray:
+    """Recency as a sortable number, with missing values lowest."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # NaT is the smallest int64, so it already loses every comparison
+        # (in the column's own unit: 9999-12-31 placeholders overflow [ns])
+        return values.to_numpy().view("int64")
+    numbers = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return np.where(np.isnan(numbers), -np.inf, numbers)
+
+
+def latest_mask(df: pd.DataFrame, keys: list[str], recency_col: str) -> np.ndarray:
+    """Boolean mask selecting the most recent row of each key."""
+    codes = _group_codes(df, keys)
+    latest = pd.Series(_recency_rank(df[recency_col])).groupby(codes, sort=False).idxmax()
+    mask = np.zeros(len(df), dtype=bool)
+    mask[latest.to_numpy()] = True
+    return mask
+
+
+def keep_latest(
+    df: pd.DataFrame,
+    keys: list[str],
+    recency_col: str,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Split df into the latest row per key and the rows it supersedes.
+
+    Args:
+        df: Frame to deduplicate (left unchanged).
+        keys: Primary key column(s).
+        recency_col: Datetime or numeric column; the highest value wins.
+
+    Returns:
+        (kept rows, deleted rows), both in input order.
+    """
+    if df.empty:
+        return df, df.iloc[0:0]
+    mask = latest_mask(df, keys, recency_col)
+    return df[mask], df[~mask]
@@ -1,7 +1,12 @@
 import os
 import sys
+import functools
+from contextlib import nullcontext
 import pandas as pd
-from src.core.database import get_engine
+from src.silver.bronze_reader import get_string_dtype, read_bronze_table
+from src.silver.categorical import compile_replacements, encode_categoricals, fill_na, replace_values
+from src.silver.date_parser import parse_date_column
+from src.silver.watermarks import ingest_range, plan_extract, publish_silver
 from src.core.logger import setup_logger
 from sqlalchemy import String, Date, DateTime
 
@@ -17,12 +22,32 @@ from sqlalchemy import String, Date, DateTime
 
 logger = setup_logger(__name__.split(".")[-1])
 
-def extract_from_bronze(table_name: str) -> pd.DataFrame:
-    engine = get_engine("bronze")
-    try:
-        return pd.read_sql(f"SELECT * FROM {table_name}", engine)
-    except Exception as e:
-        raise RuntimeError(f"Failed to extract from bronze table {table_name}") from e
+
+def copy_on_write():
+    """
+    Context in which pandas copy-on-write is on, so column selections,
+    slices and reassignments share memory until written to. Scoped to the
+    ERP transforms rather than set process-wide; always on (and the option
+    deprecated) from pandas 3.0, where this is a no-op.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        return pd.option_context("mode.copy_on_write", True)
+    return nullcontext()
+
+
+def _with_copy_on_write(pipeline):
+    @functools.wraps(pipeline)
+    def run(*args, **kwargs):
+        with copy_on_write():
+            return pipeline(*args, **kwargs)
+    return run
+
+def extract_from_bronze(
+    table_name: str,
+    columns: list[str] | None = None,
+    plan: dict | None = None,
+) -> pd.DataFrame:
+    return read_bronze_table(table_name, columns=columns, ingest_range=ingest_range(plan))
 
 schema_customer ={
     "cid"                 : "string",
@@ -35,8 +60,12 @@ schema_location = {
     "country_name"        : "string",
 }
 
+# px_cat has no schema enforcement; these are the columns silver keeps
+category_columns = ["id", "cat", "subcat", "maintenance_raw"]
+
 #! high level schema enforcement function 
 def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    string_dtype = get_string_dtype()  # 'string' or 'string[pyarrow]' (silver.dtype_backend)
     for column, dtype in schema.items():
 
         if column not in df.columns:
@@ -48,11 +77,11 @@ def enforce_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
             if dtype == "Int64":
                 df[column] = df[column].astype("Int64")
         elif dtype.startswith("datetime"):
-            df[column] = pd.to_datetime(df[column], errors="coerce")
+            df[column] = parse_date_column(df[column], column)
         elif dtype == "boolean":
             df[column] = df[column].astype("boolean")
         elif dtype == "string":
-            df[column] = df[column].astype("string")
+            df[column] = df[column].astype(string_dtype)
         else:
             # fallback (rare cases)
             df[column] = df[column].astype(dtype)
@@ -64,17 +93,26 @@ def standardize_customer_id(df: pd.DataFrame) -> pd.DataFrame:
     if "cid" not in df.columns:
         logger.warning("[CID WARNING] 'cid' column not found.")
         return df
-    before = len(df)
-    df = df.loc[df["cid"].str.len() >= 10].copy()
-    dropped = before - len(df)
+    keep = (_as_string(df["cid"]).str.len() >= 10).fillna(False).to_numpy(dtype=bool)
+    dropped = int((~keep).sum())
     if dropped > 0:
+        # the filtered frame is new anyway; copy-on-write makes the
+        # column assignment below safe without a defensive copy
+        df = df.loc[keep]
         logger.warning(
             f"{dropped} records dropped due to invalid CID length."
         )
-    df.loc[:, "cid"] = df["cid"].astype(str).str[-10:]
+    df["cid"] = _as_string(df["cid"]).str[-10:]
 
     return df
 
+
+def _as_string(values: pd.Series) -> pd.Series:
+    """values unchanged when already a string column, else cast to str."""
+    if pd.api.types.is_string_dtype(values) and values.dtype != object:
+        return values
+    return values.astype(str)
+
 customer_replacemts = {
     "gender_raw": {
         "M": "Male",
@@ -93,31 +131,35 @@ location_replacements ={
     }
 }
 
-def apply_value_replacements(df: pd.DataFrame,replacements: dict) -> pd.DataFrame:
+# compiled once into lookup arrays (see categorical.compile_replacements)
+CUSTOMER_REPLACEMENTS = compile_replacements(customer_replacemts)
+LOCATION_REPLACEMENTS = compile_replacements(location_replacements)
+
+def apply_value_replacements(df: pd.DataFrame, replacements: dict) -> pd.DataFrame:
     """
     Apply value mappings to multiple columns.
 
+    Columns are replaced in place (no copy of the frame); each column is
+    mapped through its distinct values and comes back categorical.
+
     Args:
         df: Input dataframe
-        replacements: Dictionary of {column: {old_value: new_value}}
+        replacements: Dictionary of {column: {old_value: new_value}}, or
+            the same compiled with compile_replacements()
 
     Returns:
         Updated dataframe
     """
 
-    df = df.copy()
-
     for column, mapping in replacements.items():
 
         if column not in df.columns:
             logger.warning(f"[REPLACEMENT WARNING] Column '{column}' not found.")
             continue
 
-        df.loc[:, column] = (
-            df[column]
-            .str.strip()
-            .replace(mapping)
-        )
+        compiled = compile_replacements({column: mapping})[column] if isinstance(mapping, dict) else mapping
+        df[column], hits = replace_values(df[column], compiled)
+        logger.info(f"[REPLACE] {column}: {hits} values mapped")
 
     return df
 
@@ -131,13 +173,18 @@ def transform_erp_cid_column(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         logger.warning("Input dataframe is empty. Skipping transformation.")
         return df
-    df["cid"] = df["cid"].astype(str).str.replace("-", "", regex=False)
+    df["cid"] = _as_string(df["cid"]).str.replace("-", "", regex=False)
     return df
 
+@_with_copy_on_write
 def run_customer_pipeline()-> None:
     logger.info("Starting ERP Customers Silver Pipeline")
     try:
-        df_customer = extract_from_bronze("erp_cust_az12")
+        plan = plan_extract("erp_cust_az12", "erp_cust_az12")
+        if plan["mode"] == "none":
+            logger.info("[WATERMARK] erp_cust_az12 is up to date; nothing to process")
+            return
+        df_customer = extract_from_bronze("erp_cust_az12", list(schema_customer), plan)
         logger.info(f"Extracted {len(df_customer)} records from bronze.")
         
         df_customer = enforce_schema(df_customer, schema_customer)
@@ -146,8 +193,9 @@ def run_customer_pipeline()-> None:
         df_customer = standardize_customer_id(df_customer)
         logger.info("Customer ID standardization completed.")
         
-        df_customer = apply_value_replacements(df_customer, customer_replacemts)
-        df_customer["gender_raw"] = df_customer["gender_raw"].fillna("n/a")
+        encode_categoricals(df_customer, "erp_cust_az12")
+        df_customer = apply_value_replacements(df_customer, CUSTOMER_REPLACEMENTS)
+        df_customer["gender_raw"] = fill_na(df_customer["gender_raw"], "n/a")
         logger.info("Value replacements applied.")
         
         df_customer = drop_technical_columns(df_customer)
@@ -156,35 +204,39 @@ def run_customer_pipeline()-> None:
         
         #! Save to silver layer
         df_customer["loaded_at"] = pd.Timestamp.now()
-        df_customer.to_sql(
-            name = "erp_cust_az12",
-            con  = get_engine("silver"),
-            if_exists = "replace",
-            index=False,
+        publish_silver(
+            df_customer,
+            "erp_cust_az12",
+            plan=plan,
             dtype={
                 "cid" : String(100),
                 "birth_date_raw": Date(),
                 "gender_raw": String(50),
                 "loaded_at": DateTime()
             }, # type: ignore
-            chunksize=1000
         )
         logger.info("ERP Customers Silver Pipeline completed successfully.")
     except Exception as e:
         logger.error(f"Pipeline failed: {e}", exc_info=True)
 
 
+@_with_copy_on_write
 def run_location_pipeline()-> None:
     logger.info("Starting ERP Customer Locations Silver Pipeline")
     try:
-        df_location = extract_from_bronze("erp_location_a101")
+        plan = plan_extract("erp_location_a101", "erp_location_a101")
+        if plan["mode"] == "none":
+            logger.info("[WATERMARK] erp_location_a101 is up to date; nothing to process")
+            return
+        df_location = extract_from_bronze("erp_location_a101", list(schema_location), plan)
         logger.info(f"Extracted {len(df_location)} records from bronze for location data.")
         
         df_location = enforce_schema(df_location, schema_location)
         logger.info("Schema enforcement completed for location data.")
         
-        df_location = apply_value_replacements(df_location, location_replacements)
-        df_location["country_name"] = df_location["country_name"].fillna("n/a")
+        encode_categoricals(df_location, "erp_location_a101")
+        df_location = apply_value_replacements(df_location, LOCATION_REPLACEMENTS)
+        df_location["country_name"] = fill_na(df_location["country_name"], "n/a")
         logger.info("Value replacements applied for location data.")
         
         df_location = drop_technical_columns(df_location)
@@ -195,38 +247,41 @@ def run_location_pipeline()-> None:
 
         #! Save to silver layer
         df_location["loaded_at"] = pd.Timestamp.now()
-        df_location.to_sql(
-            name="erp_location_a101",
-            con=get_engine("silver"),
-            if_exists="replace",
-            index=False,
+        publish_silver(
+            df_location,
+            "erp_location_a101",
+            plan=plan,
             dtype={
                 "cid": String(100),
                 "country_name": String(255),
                 "loaded_at": DateTime()
             }, # type: ignore
-            chunksize=1000
         )
         logger.info("ERP Customer Locations Silver Pipeline completed successfully.")
     except Exception as e:
         logger.error(f"Location pipeline failed: {e}", exc_info=True)
 
+@_with_copy_on_write
 def run_category_pipeline()-> None:
     logger.info("Starting ERP Product Categories Silver Pipeline")
     try:
-        df_category = extract_from_bronze("erp_px_cat_g1v2")
+        plan = plan_extract("erp_px_cat_g1v2", "erp_px_cat_g1v2")
+        if plan["mode"] == "none":
+            logger.info("[WATERMARK] erp_px_cat_g1v2 is up to date; nothing to process")
+            return
+        df_category = extract_from_bronze("erp_px_cat_g1v2", category_columns, plan)
         logger.info(f"Extracted {len(df_category)} records from bronze.")
         
         df_category = drop_technical_columns(df_category)
         df_category = df_category.drop(columns=["ingest_id"], errors="ignore")
+        encode_categoricals(df_category, "erp_px_cat_g1v2", columns=["cat", "subcat", "maintenance_raw"])
         logger.info("Technical columns dropped for category data.")
     
         df_category["loaded_at"] = pd.Timestamp.now()
-        df_category.to_sql(
-            name   = "erp_px_cat_g1v2",
-            con  = get_engine("silver"),
-            if_exists = "replace",
-            index=False,
+        publish_silver(
+            df_category,
+            "erp_px_cat_g1v2",
+            plan=plan,
             dtype={
                 "id" : String(100),
                 "cat": String(100),
@@ -234,7 +289,6 @@ def run_category_pipeline()-> None:
                 "maintenance_raw": String(100),
                 "loaded_at": DateTime()
             }, # type: ignore
-            chunksize=1000
         )
         logger.info("ERP Product Categories Silver Pipeline completed successfully.")
     except Exception as e:  
@@ -0,0 +1,90 @@
+"""
+Silver Module: String Normalization
+-----------------------------------
+One-pass null-token normalization for all string columns of a frame.
+
+normalize_strings() stacks the string columns into a single array and
+factorizes it once. Whitespace stripping, null-token matching and
+optional title-casing then run on the distinct values only (typically a
+few thousand, against millions of cells), and each column is rebuilt by
+indexing the cleaned values with its slice of the codes. The same codes
+give the per-column count of values turned into NULL, with no further
+scan of the data.
+
+Tokens come from silver.null_tokens in pipeline_config.yaml (matched
+after stripping, case-sensitive); DEFAULT_NULL_TOKENS otherwise.
+
+Usage:
+    from src.silver.normalize import normalize_strings
+    converted = normalize_strings(df, title_columns=["cst_firstname", "cst_lastname"])
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from src.core.config import load_pipeline_config
+from src.core.logger import setup_logger
+
+logger = setup_logger(__name__.split(".")[-1])
+
+DEFAULT_NULL_TOKENS = ("", "NULL", "null", "None", "none", "nan", "NaN")
+
+
+def get_null_tokens() -> tuple[str, ...]:
+    """silver.null_tokens from pipeline_config.yaml, or DEFAULT_NULL_TOKENS."""
+    tokens = (load_pipeline_config().get("silver", {}) or {}).get("null_tokens")
+    if tokens is None:
+        return DEFAULT_NULL_TOKENS
+    return tuple(str(t) for t in tokens)
+
+
+def normalize_strings(
+    df: pd.DataFrame,
+    columns: Iterable[str] | None = None,
+    tokens: Iterable[str] | None = None,
+    title_columns: Iterable[str] = (),
+) -> dict[str, int]:
+    """
+    Strip every string column of df and turn null tokens into <NA>, in place.
+
+    Args:
+        df: Frame to normalize.
+        columns: Columns to process; defaults to all 'string' dtype columns.
+        tokens: Values (after stripping) that mean NULL; defaults to
+            get_null_tokens().
+        title_columns: Columns that are also title-cased.
+
+    Returns:
+        {column: number of values converted to NULL}
+    """
+    columns = list(columns) if columns is not None else list(df.select_dtypes(include="string").columns)
+    if not columns or df.empty:
+        return {column: 0 for column in columns}
+    tokens = tuple(tokens) if tokens is not None else get_null_tokens()
+    title_columns = set(title_columns)
+
+    rows = len(df)
+    stacked = np.concatenate([df[c].to_numpy(dtype=object, na_value=None) for c in columns])
+    codes, uniques = pd.factorize(stacked)
+    # missing values (code -1) point at an extra <NA> slot after the uniques
+    codes[codes < 0] = len(uniques)
+
+    stripped = pd.Series(uniques, dtype="string").str.strip()
+    is_token = np.append(stripped.isin(tokens).to_numpy(dtype=bool), False)
+    cleaned = np.append(stripped.mask(is_token[:-1]).to_numpy(dtype=object), pd.NA)
+    titled = None
+    if title_columns:
+        titled = np.append(stripped.str.title().mask(is_token[:-1]).to_numpy(dtype=object), pd.NA)
+
+    hits = np.add.reduceat(is_token[codes], np.arange(0, rows * len(columns), rows))
+    converted = {}
+    for i, column in enumerate(columns):
+        values = titled if column in title_columns else cleaned
+        column_codes = codes[i * rows:(i + 1) * rows]
+        # keep the column's string dtype (python or pyarrow storage)
+        df[column] = pd.Series(values[column_codes], index=df.index, dtype=df[column].dtype)
+        converted[column] = int(hits[i])
+    return converted
@@ -0,0 +1,140 @@
+"""
+Silver Module: Slowly Changing Dimensions (Type 2)
+--------------------------------------------------
+Version history maintenance for dimension tables such as crm_prd_info,
+where every row is one version of a business key and its end date is the
+day before the next version starts (NULL for the open version).
+
+close_versions() derives the end dates for a frame of versions; it is
+what a full rebuild runs over the whole history. merge_versions() is the
+incremental path: given only new versions, it
+
+- reads the stored versions of the affected business keys alone (the
+  keys are staged in <table>__keys and joined, never the whole table)
+- recomputes end dates over those versions plus the new ones, so a new
+  version closes the previously open record, and a late-arriving older
+  version is slotted in between the right neighbours
+- upserts the result by row key: unchanged versions are discarded by
+  upsert_dataframe(), so only the closed records and the new versions
+  are written
+
+Usage:
+    from src.silver.scd2 import close_versions, merge_versions
+    df = close_versions(df, ["prd_key"], "prd_start_date_raw", "prd_end_date_raw")
+    merge_versions(new_versions, "crm_prd_info", engine, ["cat_id", "prd_key"],
+                   "prd_start_dt", "prd_end_dt", row_key="prd_id", dtype=dtype)
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from src.core.logger import setup_logger
+from src.core.publish import upsert_dataframe
+from src.core.writer import write_dataframe
+
+logger = setup_logger(__name__.split(".")[-1])
+
+KEYS_SUFFIX = "__keys"
+
+
+def close_versions(df: pd.DataFrame, keys: list[str], start_col: str, end_col: str) -> pd.DataFrame:
+    """
+    Sort df by keys and start date and set end_col to the day before the
+    next version of the same key starts (NaT for the latest version).
+    """
+    df = df.sort_values(by=[*keys, start_col])
+    #! window function [LEAD]
+    next_start = df.groupby(keys, sort=False, observed=True, dropna=False)[start_col].shift(-1)
+    df[end_col] = next_start - pd.Timedelta(days=1)
+    return df
+
+
+def read_versions(engine: Engine, table_name: str, keys: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stored rows of table_name whose business key is one of the rows of
+    keys (its columns name the key columns).
+    """
+    if keys.empty or not inspect(engine).has_table(table_name):
+        return pd.DataFrame()
+    keys_name = table_name + KEYS_SUFFIX
+    quote = engine.dialect.identifier_preparer.quote
+    match = " AND ".join(f"t.{quote(k)} = k.{quote(k)}" for k in keys.columns)
+
+    write_dataframe(keys, keys_name, engine, if_exists="replace")
+    try:
+        with engine.connect() as conn:
+            return pd.read_sql(text(f"SELECT t.* FROM {table_name} t JOIN {keys_name} k ON {match}"), conn)
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {keys_name}"))
+
+
+def _align(stored: pd.DataFrame, like: pd.DataFrame) -> pd.DataFrame:
+    """Cast rows read back from the database to the dtypes of the new versions."""
+    stored = stored[[c for c in like.columns if c in stored.columns]]
+    for column in stored.columns:
+        dtype = like[column].dtype
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            stored[column] = pd.to_datetime(stored[column], errors="coerce").astype(dtype)
+        elif not isinstance(dtype, pd.CategoricalDtype):
+            stored[column] = stored[column].astype(dtype)
+    return stored
+
+
+def merge_versions(
+    new_versions: pd.DataFrame,
+    table_name: str,
+    engine: Engine,
+    keys: list[str],
+    start_col: str,
+    end_col: str,
+    row_key: str,
+    dtype: dict | None = None,
+) -> dict[str, Any]:
+    """
+    Add new versions to an SCD2 table, closing the records they supersede.
+
+    Args:
+        new_versions: New version rows, with the table's columns (end_col
+            is recomputed).
+        table_name: Target table.
+        engine: Engine of the target database.
+        keys: Business key columns (one history per key).
+        start_col: Version start date column.
+        end_col: Version end date column.
+        row_key: Column identifying a single version (the upsert key).
+        dtype: SQLAlchemy column types for the write.
+
+    Returns:
+        upsert_dataframe() stats plus versions (new rows) and keys (business
+        keys touched).
+    """
+    if new_versions.empty:
+        return {"table": table_name, "rows": 0, "inserted": 0, "updated": 0, "unchanged": 0,
+                "versions": 0, "keys": 0}
+    affected = new_versions[keys].drop_duplicates()
+    stored = read_versions(engine, table_name, affected)
+    if not stored.empty:
+        stored = _align(stored, new_versions)
+    else:
+        stored = new_versions.iloc[0:0]
+
+    # a re-delivered version (same row key) replaces its stored copy
+    history = pd.concat([stored, new_versions], ignore_index=True)
+    history = history.drop_duplicates(subset=[row_key], keep="last")
+    history = close_versions(history, keys, start_col, end_col)
+    if "loaded_at" in history.columns:
+        history["loaded_at"] = pd.Timestamp.now()
+
+    stats = upsert_dataframe(history, table_name, engine, [row_key], dtype=dtype)
+    stats.update(versions=len(new_versions), keys=len(affected))
+    logger.info(
+        f"[SCD2] {table_name}: {len(new_versions)} new versions for {len(affected)} keys "
+        f"({len(stored)} stored versions read) -> {stats['inserted']} inserted, "
+        f"{stats['updated']} closed/updated"
+    )
+    return stats
@@ -0,0 +1,120 @@
+"""
+Silver Module: Validation Rules
+-------------------------------
+Declarative row validation for any silver table.
+
+A rule is a name and a pandas eval expression over the table's columns
+that is true for the rows violating it, e.g. {name: negative_price, expr: "sales_price < 0"}.
+Rules come from silver.validation_rules.<table> in pipeline_config.yaml,
+or from the defaults the table's module passes in.
+
+evaluate_rules() evaluates every expression once with pd.eval,
+vectorized (through numexpr when it is installed, pandas' own evaluator
+otherwise), and ORs the results into a per-row violation bitmask: bit i
+is set when rule i fired. The per-rule counts come from the same evaluation, so which rules
+fired (and how often) is known without re-scanning the data. The
+bitmask uses the smallest unsigned integer type that fits the rules.
+
+Usage:
+    from src.silver.validation import describe_violations, get_rules, split_valid
+    rules = get_rules("crm_sales_details")
+    valid_df, invalid_df, counts = split_valid(df, "crm_sales_details", rules)
+    describe_violations(invalid_df["violations"].iloc[0], rules)  # ["negative_price", ...]
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.core.config import load_pipeline_config
+from src.core.logger import setup_logger
+
+logger = setup_logger(__name__.split(".")[-1])
+
+VIOLATIONS_COLUMN = "violations"
+_MASK_DTYPES = (np.uint8, np.uint16, np.uint32, np.uint64)
+
+
+def get_rules(table_name: str, default: list[dict] | None = None) -> list[dict]:
+    """silver.validation_rules.<table_name> from pipeline_config.yaml, or default."""
+    configured = ((load_pipeline_config().get("silver", {}) or {}).get("validation_rules") or {})
+    rules = configured.get(table_name)
+    if rules is None:
+        return list(default or [])
+    for rule in rules:
+        if not {"name", "expr"} <= set(rule):
+            raise ValueError(f"Validation rule for {table_name} needs a name and an expr: {rule}")
+    return [{"name": str(r["name"]), "expr": str(r["expr"])} for r in rules]
+
+
+def mask_dtype(rule_count: int) -> Any:
+    """Smallest unsigned integer type with a bit per rule."""
+    for dtype in _MASK_DTYPES:
+        if rule_count <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(f"At most 64 validation rules are supported (got {rule_count})")
+
+
+def _violated(df: pd.DataFrame, columns: dict[str, pd.Series], rule: dict) -> np.ndarray:
+    try:
+        result = pd.eval(rule["expr"], local_dict=columns)
+    except (NotImplementedError, TypeError):
+        # a construct numexpr cannot compile (e.g. col.isna()): pandas' evaluator
+        result = pd.eval(rule["expr"], local_dict=columns, engine="python")
+    except Exception as e:
+        raise ValueError(f"Validation rule '{rule['name']}' ({rule['expr']}) failed: {e}") from e
+    # comparisons with missing values are not violations (as with NaN)
+    return pd.Series(result, index=df.index).fillna(False).to_numpy(dtype=bool)
+
+
+def evaluate_rules(df: pd.DataFrame, rules: list[dict]) -> tuple[np.ndarray, dict[str, int]]:
+    """
+    Evaluate every rule once over df.
+
+    Returns:
+        (violation bitmask per row, {rule name: rows violating it})
+    """
+    dtype = mask_dtype(len(rules))
+    mask = np.zeros(len(df), dtype=dtype)
+    # resolved once for all rules (DataFrame.eval would rebuild them, index
+    # included, on every call)
+    columns = {column: df[column] for column in df.columns}
+    counts = {}
+    for bit, rule in enumerate(rules):
+        violated = _violated(df, columns, rule)
+        mask |= violated.astype(dtype) << dtype(bit)
+        counts[rule["name"]] = int(violated.sum())
+    return mask, counts
+
+
+def describe_violations(value: int, rules: list[dict]) -> list[str]:
+    """Names of the rules whose bits are set in one bitmask value."""
+    return [rule["name"] for bit, rule in enumerate(rules) if int(value) >> bit & 1]
+
+
+def split_valid(
+    df: pd.DataFrame,
+    table_name: str,
+    rules: list[dict],
+) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, int]]:
+    """
+    Split df into rows passing every rule and rows violating at least one.
+
+    The invalid rows carry a 'violations' bitmask column (see
+    describe_violations); the valid rows are returned unchanged, as a copy
+    callers may assign columns to.
+
+    Returns:
+        (valid rows, invalid rows, {rule name: rows violating it})
+    """
+    mask, counts = evaluate_rules(df, rules)
+    invalid = mask != 0
+    valid_df = df.loc[~invalid].copy()
+    invalid_df = df.loc[invalid].assign(**{VIOLATIONS_COLUMN: mask[invalid]})
+
+    if len(invalid_df):
+        fired = ", ".join(f"{name}={count}" for name, count in counts.items() if count)
+        logger.warning(f"[VALIDATION] {table_name}: {len(invalid_df)} invalid rows ({fired})")
+    return valid_df, invalid_df, counts
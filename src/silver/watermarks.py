@@ -0,0 +1,260 @@
+"""
+Silver Module: Watermarks
+-------------------------
+Incremental silver processing driven by bronze ingest_id.
+
+A silver_watermarks table in silver_db records, per silver table, the
+highest bronze ingest_id already processed and that row's loaded_at.
+Before a run, plan_extract() compares it with bronze:
+
+- 'full'  : no watermark yet, incremental mode off, bronze has no
+            ingest_id, or bronze was rebuilt (the watermark row's loaded_at
+            no longer matches) -> recompute the table and replace it
+- 'delta' : only rows with watermark < ingest_id <= current high-water
+            mark are read, transformed and upserted into silver by key
+- 'none'  : nothing new since the last run
+
+The watermark is advanced only after the silver write succeeded; upserts
+are keyed, so re-processing a window after a failure is harmless. The
+TABLE_KEYS of each silver table are kept as a unique index so the upsert
+can rely on ON DUPLICATE KEY UPDATE. Versioned (SCD2) tables go through
+publish_silver_versions(), which closes superseded versions on a delta
+instead of plainly upserting it.
+
+Usage:
+    plan = plan_extract("crm_sales_details", "crm_sales_details")
+    df = read_bronze_table("crm_sales_details", columns, ingest_range=ingest_range(plan))
+    publish_silver(df, "crm_sales_details", dtype, plan)
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+import pandas as pd
+from sqlalchemy import inspect, text
+
+from src.core.config import load_pipeline_config
+from src.core.database import get_engine
+from src.core.logger import setup_logger
+from src.core.publish import ensure_unique_key, publish_chunks, publish_dataframe, upsert_dataframe
+from src.database_checks.check_duplicates import TABLE_KEYS
+from src.silver.scd2 import merge_versions
+
+logger = setup_logger(__name__.split(".")[-1])
+
+WATERMARK_TABLE = "silver_watermarks"
+
+
+def is_incremental_enabled() -> bool:
+    """silver.incremental from pipeline_config.yaml (default false)."""
+    return bool((load_pipeline_config().get("silver", {}) or {}).get("incremental", False))
+
+
+def _ensure_watermark_table(engine: Any) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"""
+            CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+                silver_table   VARCHAR(100) NOT NULL PRIMARY KEY,
+                bronze_table   VARCHAR(100) NOT NULL,
+                last_ingest_id BIGINT NOT NULL,
+                last_loaded_at DATETIME NULL,
+                updated_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        ))
+
+
+def get_watermark(engine: Any, silver_table: str) -> dict | None:
+    """Last processed {ingest_id, loaded_at} for a silver table, if any."""
+    _ensure_watermark_table(engine)
+    with engine.connect() as conn:
+        row = conn.execute(
+            text(
+                f"SELECT last_ingest_id, last_loaded_at FROM {WATERMARK_TABLE} "
+                "WHERE silver_table = :silver_table"
+            ),
+            {"silver_table": silver_table},
+        ).fetchone()
+    if row is None:
+        return None
+    return {"ingest_id": int(row[0]), "loaded_at": row[1]}
+
+
+def save_watermark(engine: Any, silver_table: str, bronze_table: str, high: dict) -> None:
+    """Record the bronze high-water mark a silver table has been built up to."""
+    _ensure_watermark_table(engine)
+    loaded_at = pd.Timestamp(high["loaded_at"]).to_pydatetime() if high["loaded_at"] is not None else None
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"DELETE FROM {WATERMARK_TABLE} WHERE silver_table = :silver_table"),
+            {"silver_table": silver_table},
+        )
+        conn.execute(
+            text(
+                f"INSERT INTO {WATERMARK_TABLE} "
+                "(silver_table, bronze_table, last_ingest_id, last_loaded_at) "
+                "VALUES (:silver_table, :bronze_table, :ingest_id, :loaded_at)"
+            ),
+            {
+                "silver_table": silver_table,
+                "bronze_table": bronze_table,
+                "ingest_id": int(high["ingest_id"]),
+                "loaded_at": loaded_at,
+            },
+        )
+    logger.info(f"[WATERMARK] {silver_table} -> ingest_id {high['ingest_id']}")
+
+
+def bronze_high_water(engine: Any, bronze_table: str) -> dict | None:
+    """
+    Highest ingest_id in a bronze table with its loaded_at; None when the
+    table is empty or was not provisioned with ingest_id/loaded_at.
+    """
+    columns = {c["name"] for c in inspect(engine).get_columns(bronze_table)}
+    if not {"ingest_id", "loaded_at"} <= columns:
+        return None
+    with engine.connect() as conn:
+        row = conn.execute(text(
+            f"SELECT ingest_id, loaded_at FROM {bronze_table} ORDER BY ingest_id DESC LIMIT 1"
+        )).fetchone()
+    return None if row is None else {"ingest_id": int(row[0]), "loaded_at": row[1]}
+
+
+def _same_generation(engine: Any, bronze_table: str, watermark: dict) -> bool:
+    """True when the watermark row still exists with the loaded_at it had."""
+    with engine.connect() as conn:
+        loaded_at = conn.execute(
+            text(f"SELECT loaded_at FROM {bronze_table} WHERE ingest_id = :ingest_id"),
+            {"ingest_id": watermark["ingest_id"]},
+        ).scalar()
+    if loaded_at is None or watermark["loaded_at"] is None:
+        return False
+    return pd.Timestamp(loaded_at) == pd.Timestamp(watermark["loaded_at"])
+
+
+def plan_extract(
+    silver_table: str,
+    bronze_table: str,
+    bronze_engine: Any = None,
+    silver_engine: Any = None,
+) -> dict:
+    """
+    Decide how much of bronze a silver run has to read.
+
+    Returns:
+        {silver_table, bronze_table, mode: 'full'|'delta'|'none',
+         after, upto, high} where high is the watermark to save afterwards.
+    """
+    bronze_engine = bronze_engine if bronze_engine is not None else get_engine("bronze")
+    silver_engine = silver_engine if silver_engine is not None else get_engine("silver")
+    plan = {"silver_table": silver_table, "bronze_table": bronze_table,
+            "mode": "full", "after": None, "upto": None, "high": None}
+
+    if not is_incremental_enabled():
+        return plan
+    high = bronze_high_water(bronze_engine, bronze_table)
+    if high is None:
+        logger.info(f"[WATERMARK] {bronze_table} has no ingest_id rows; full recompute")
+        return plan
+    plan["high"] = high
+
+    watermark = get_watermark(silver_engine, silver_table)
+    if watermark is None:
+        logger.info(f"[WATERMARK] No watermark for {silver_table}; full recompute")
+    elif not _same_generation(bronze_engine, bronze_table, watermark):
+        logger.info(f"[WATERMARK] {bronze_table} was reloaded since the last run; full recompute")
+    elif high["ingest_id"] <= watermark["ingest_id"]:
+        plan["mode"] = "none"
+    else:
+        plan.update(mode="delta", after=watermark["ingest_id"], upto=high["ingest_id"])
+        logger.info(
+            f"[WATERMARK] {silver_table}: delta ingest_id {plan['after']} < id <= {plan['upto']}"
+        )
+    return plan
+
+
+def ingest_range(plan: dict | None) -> tuple[int, int] | None:
+    """(after, upto) window for a delta plan, None for full reads."""
+    if plan is None or plan["mode"] != "delta":
+        return None
+    return plan["after"], plan["upto"]
+
+
+def publish_silver(
+    df: pd.DataFrame,
+    silver_table: str,
+    dtype: dict | None,
+    plan: dict | None = None,
+    engine: Any = None,
+) -> dict:
+    """
+    Write a silver table according to its extract plan: replace it after a
+    full recompute, upsert by TABLE_KEYS after a delta, then advance the
+    watermark.
+    """
+    engine = engine if engine is not None else get_engine("silver")
+    keys = TABLE_KEYS["silver"][silver_table]
+    if plan is not None and plan["mode"] == "delta":
+        stats = upsert_dataframe(df, silver_table, engine, keys, dtype=dtype)
+    else:
+        stats = publish_dataframe(df, silver_table, engine, dtype=dtype)
+    _finish_plan(engine, silver_table, plan, keys)
+    return stats
+
+
+def _finish_plan(engine: Any, silver_table: str, plan: dict | None, keys: list[str]) -> None:
+    """Re-key a rebuilt table for later upserts and advance the watermark."""
+    if plan is None or plan["high"] is None:
+        return
+    if plan["mode"] == "full" and inspect(engine).has_table(silver_table):
+        ensure_unique_key(engine, silver_table, keys)
+    save_watermark(engine, silver_table, plan["bronze_table"], plan["high"])
+
+
+def publish_silver_versions(
+    df: pd.DataFrame,
+    silver_table: str,
+    dtype: dict | None,
+    plan: dict | None,
+    keys: list[str],
+    start_col: str,
+    end_col: str,
+    engine: Any = None,
+) -> dict:
+    """
+    publish_silver for SCD2 tables: after a delta, merge the new versions
+    into the stored history of their business keys (src.silver.scd2) so
+    only the superseded open records are closed; replace the table after
+    a full recompute.
+    """
+    engine = engine if engine is not None else get_engine("silver")
+    row_keys = TABLE_KEYS["silver"][silver_table]
+    if plan is not None and plan["mode"] == "delta":
+        stats = merge_versions(df, silver_table, engine, keys, start_col, end_col, row_keys[0], dtype=dtype)
+    else:
+        stats = publish_dataframe(df, silver_table, engine, dtype=dtype)
+    _finish_plan(engine, silver_table, plan, row_keys)
+    return stats
+
+
+def publish_silver_chunks(
+    frames: Iterable[pd.DataFrame],
+    silver_table: str,
+    dtype: dict | None,
+    plan: dict | None = None,
+    engine: Any = None,
+) -> dict:
+    """Streaming variant of publish_silver: each frame is replaced/upserted as it arrives."""
+    engine = engine if engine is not None else get_engine("silver")
+    keys = TABLE_KEYS["silver"][silver_table]
+    if plan is not None and plan["mode"] == "delta":
+        rows, batches = 0, 0
+        for frame in frames:
+            rows += upsert_dataframe(frame, silver_table, engine, keys, dtype=dtype)["rows"]
+            batches += 1
+        stats = {"table": silver_table, "rows": rows, "batches": batches}
+    else:
+        stats = publish_chunks(frames, silver_table, engine, dtype=dtype)
+    _finish_plan(engine, silver_table, plan, keys)
+    return stats
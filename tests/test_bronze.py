@@ -0,0 +1,654 @@
+"""
+Bronze Helper Unit Tests
+-------------------------
+Tests for bronze-layer helpers (raw_row encoding) using in-memory
+DataFrames — no DB needed.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_bronze.py -v
+"""
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import nullcontext
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+
+from src.bronze.helper import add_raw_row, add_row_hash, build_raw_row, read_bronze_csv, read_bronze_csv_chunks
+from src.bronze import bulk_load
+from src.bronze.bulk_load import write_infile
+from src.bronze import helper
+from src.bronze import ingestion_checker, load_bronze
+from src.core.sql_files import read_sql_file, split_statements
+
+
+def _legacy_raw_row(df: pd.DataFrame) -> list[str]:
+    """Reference row-wise encoding the column-wise builder must match."""
+    df_temp = df.where(pd.notnull(df), np.nan)
+    return df_temp.apply(
+        lambda r: json.dumps(r.to_dict(), default=str), axis=1
+    ).tolist()
+
+
+class TestBuildRawRow:
+    def test_matches_row_wise_json(self):
+        df = pd.DataFrame({
+            "sls_ord_num": ["SO43697", "SO43698", None],
+            "sls_prd_key": ["BK-R93R-62", "BK-R93R-62", "HL-U509"],
+            "sls_price": ["3578", np.nan, "  12 "],
+        }, dtype=str)
+        assert list(build_raw_row(df)) == _legacy_raw_row(df)
+
+    def test_escapes_quotes_and_non_ascii(self):
+        df = pd.DataFrame({"cst_lastname": ['O"Brien', "Müller", "a\\b\n"]}, dtype=str)
+        raw = list(build_raw_row(df))
+        assert raw == _legacy_raw_row(df)
+        assert json.loads(raw[1]) == {"cst_lastname": "Müller"}
+
+    def test_real_source_file_parity(self):
+        csv_path = PROJECT_ROOT / "data" / "raw" / "source_erp" / "PX_CAT_G1V2.csv"
+        df = pd.read_csv(csv_path, dtype=str)
+        df.columns = df.columns.str.strip().str.lower()
+        assert list(build_raw_row(df)) == _legacy_raw_row(df)
+
+    def test_empty_frame(self):
+        df = pd.DataFrame({"cid": pd.Series([], dtype=str)})
+        assert len(build_raw_row(df)) == 0
+
+
+class TestAddRawRow:
+    def test_adds_column_in_place(self):
+        df = pd.DataFrame({"cid": ["AW-00011000"], "cntry": ["DE"]}, dtype=str)
+        result = add_raw_row(df)
+        assert result is df
+        assert result["raw_row"].iloc[0] == '{"cid": "AW-00011000", "cntry": "DE"}'
+
+
+class TestReadBronzeCsvChunks:
+    def _write_csv(self, tmp_path, rows):
+        csv_path = tmp_path / "LOC_A101.csv"
+        lines = [" CID ,CNTRY"] + [f"AW-{i:08d},DE" for i in range(rows)]
+        csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return str(csv_path)
+
+    def test_chunks_are_bounded_and_complete(self, tmp_path):
+        csv_path = self._write_csv(tmp_path, 25)
+        chunks = list(read_bronze_csv_chunks(csv_path, chunk_size=10))
+        assert [len(c) for c in chunks] == [10, 10, 5]
+        assert all(list(c.columns) == ["cid", "cntry"] for c in chunks)
+
+    def test_chunks_match_full_read(self, tmp_path):
+        csv_path = self._write_csv(tmp_path, 25)
+        streamed = pd.concat(read_bronze_csv_chunks(csv_path, chunk_size=7), ignore_index=True)
+        pd.testing.assert_frame_equal(streamed, read_bronze_csv(csv_path))
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            list(read_bronze_csv_chunks(str(tmp_path / "nope.csv"), chunk_size=10))
+
+
+class TestWriteInfile:
+    def test_encloses_values_and_writes_null_word(self, tmp_path):
+        df = pd.DataFrame({
+            "raw_row": ['{"cid": "A\\u00e9"}', '{"cid": null}'],
+            "cid": ['say "hi"', None],
+        })
+        path = tmp_path / "stage.csv"
+        write_infile(df, str(path))
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == '"{""cid"": ""A\\u00e9""}","say ""hi"""'
+        assert lines[1] == '"{""cid"": null}",NULL'
+
+    def test_empty_frame_writes_empty_file(self, tmp_path):
+        path = tmp_path / "stage.csv"
+        write_infile(pd.DataFrame({"cid": []}), str(path))
+        assert path.read_text(encoding="utf-8") == ""
+
+
+
+class TestLoadDataInfile:
+    class _Connection:
+        """Stands in for the MySQL connection: LOAD DATA reports rowcount rows."""
+        def __init__(self, rowcount):
+            self.rowcount = rowcount
+
+        def execute(self, statement, params=None):
+            return SimpleNamespace(rowcount=self.rowcount)
+
+    def _engine(self, monkeypatch, rowcount):
+        engine = create_engine("sqlite://")
+        monkeypatch.setattr(engine, "begin", lambda: nullcontext(self._Connection(rowcount)))
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        return engine, statements
+
+    def test_uses_load_data_rowcount(self, monkeypatch):
+        engine, statements = self._engine(monkeypatch, rowcount=2)
+        df = pd.DataFrame({"cid": ["A", "B"]})
+        assert bulk_load.load_data_infile(df, "t", engine, if_exists="append") == 2
+        assert not any("COUNT(" in stmt for stmt in statements)
+
+    def test_rowcount_mismatch_raises(self, monkeypatch):
+        engine, _ = self._engine(monkeypatch, rowcount=1)
+        with pytest.raises(RuntimeError, match="mismatch"):
+            bulk_load.load_data_infile(pd.DataFrame({"cid": ["A", "B"]}), "t", engine)
+
+class TestParallelBronzePipeline:
+    def _targets(self, *names):
+        return [{"name": n, "source": "source_crm", "file_name": f"{n}.csv", "columns": {}}
+                for n in names]
+
+    def test_runs_loaders_concurrently_and_aggregates(self, monkeypatch):
+        barrier = threading.Barrier(3, timeout=5)
+        outcomes = {"crm_customers_info": "loaded", "erp_cust_az12": "skipped"}
+
+        def fake_load_target(target, engine, stats=None, use_ddl=False):
+            barrier.wait()  # only passes if all three run at once
+            if target["name"] not in outcomes:
+                raise RuntimeError("boom")
+            return outcomes[target["name"]]
+
+        monkeypatch.setattr(load_bronze, "get_bronze_targets",
+                            lambda: self._targets("crm_customers_info", "erp_cust_az12", "erp_px_cat_g1v2"))
+        monkeypatch.setattr(load_bronze, "data_base_connection", lambda: object())
+        monkeypatch.setattr(load_bronze, "load_target", fake_load_target)
+
+        results = load_bronze.run_bronze_pipeline(parallel=True, max_workers=3, use_ddl=False)
+        assert [r["table"] for r in results] == ["crm_customers_info", "erp_cust_az12", "erp_px_cat_g1v2"]
+        assert [r["status"] for r in results] == ["loaded", "skipped", "failed"]
+        assert all(r["seconds"] >= 0 for r in results)
+
+    def test_sequential_mode_shares_one_engine(self, monkeypatch):
+        engine = object()
+        seen = []
+        monkeypatch.setattr(load_bronze, "get_bronze_targets", lambda: self._targets("crm_prd_info", "erp_cust_az12"))
+        monkeypatch.setattr(load_bronze, "data_base_connection", lambda: engine)
+        monkeypatch.setattr(load_bronze, "load_target", lambda t, e, stats=None, use_ddl=False: seen.append(e) or "loaded")
+        results = load_bronze.run_bronze_pipeline(parallel=False, use_ddl=False)
+        assert [r["status"] for r in results] == ["loaded", "loaded"]
+        assert seen == [engine, engine]
+
+
+class TestGenericLoader:
+    TARGET = {
+        "name": "erp_location_a101",
+        "source": "source_erp",
+        "file_name": "LOC_A101.csv",
+        "loaded_at": True,
+        "columns": {"cid": "cid", "country_name": "cntry", "region": "region"},
+        "dtypes": {"cid": "VARCHAR(50)"},
+    }
+
+    def test_parse_sql_type(self):
+        assert load_bronze.parse_sql_type("VARCHAR(50)").length == 50
+        decimal = load_bronze.parse_sql_type("decimal(12, 2)")
+        assert (decimal.precision, decimal.scale) == (12, 2)
+        with pytest.raises(ValueError):
+            load_bronze.parse_sql_type("GEOMETRY")
+
+    def test_map_target_columns(self):
+        df = add_raw_row(pd.DataFrame({"cid": ["AW-1"], "cntry": ["DE"]}, dtype=str))
+        stamp = pd.Timestamp("2024-01-01")
+        result = load_bronze.map_target_columns(df, self.TARGET, stamp)
+        assert list(result.columns) == ["raw_row", "cid", "country_name", "region", "loaded_at"]
+        assert result["country_name"].iloc[0] == "DE"
+        assert pd.isna(result["region"].iloc[0])
+        assert result["loaded_at"].iloc[0] == stamp
+
+    def test_load_target_end_to_end(self, tmp_path, monkeypatch):
+        raw_dir = tmp_path / "raw" / "source_erp"
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "LOC_A101.csv").write_text(
+            "CID,CNTRY\n" + "".join(f"AW-{i:08d},DE\n" for i in range(12)), encoding="utf-8"
+        )
+        monkeypatch.setattr(load_bronze, "get_raw_data_path", lambda rel: tmp_path / "raw" / rel)
+        monkeypatch.setattr(load_bronze, "get_chunk_size", lambda: 5)
+        monkeypatch.setattr(ingestion_checker, "LEDGER_DB", str(tmp_path / "ledger.db"))
+        monkeypatch.setattr(ingestion_checker, "PROCESSED_FILE", str(tmp_path / "processed_files.csv"))
+        engine = create_engine("sqlite://")
+
+        assert load_bronze.load_target(self.TARGET, engine) == "loaded"
+        loaded = pd.read_sql("SELECT * FROM erp_location_a101", engine)
+        assert len(loaded) == 12
+        # replace loads never look rows up, so they carry no row_hash
+        assert list(loaded.columns) == ["raw_row", "cid", "country_name", "region", "loaded_at"]
+        # JSON-typed raw_row holds the row's JSON text
+        assert json.loads(loaded["raw_row"].iloc[0]) == '{"cid": "AW-00000000", "cntry": "DE"}'
+
+        # second run is skipped through the ledger
+        assert load_bronze.load_target(self.TARGET, engine) == "skipped"
+
+        # changed bytes under the same name are reloaded
+        with open(raw_dir / "LOC_A101.csv", "a", encoding="utf-8") as f:
+            f.write("AW-99999999,FR\n")
+        assert load_bronze.load_target(self.TARGET, engine) == "loaded"
+        assert len(pd.read_sql("SELECT * FROM erp_location_a101", engine)) == 13
+
+    def test_chunked_load_logs_one_table_throughput(self, tmp_path, monkeypatch, caplog):
+        raw_dir = tmp_path / "raw" / "source_erp"
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "LOC_A101.csv").write_text(
+            "CID,CNTRY\n" + "".join(f"AW-{i:08d},DE\n" for i in range(12)), encoding="utf-8"
+        )
+        monkeypatch.setattr(load_bronze, "get_raw_data_path", lambda rel: tmp_path / "raw" / rel)
+        monkeypatch.setattr(load_bronze, "get_chunk_size", lambda: 5)
+        monkeypatch.setattr(ingestion_checker, "LEDGER_DB", str(tmp_path / "ledger.db"))
+        monkeypatch.setattr(ingestion_checker, "PROCESSED_FILE", str(tmp_path / "processed_files.csv"))
+
+        with caplog.at_level(logging.INFO):
+            assert load_bronze.load_target(self.TARGET, create_engine("sqlite://")) == "loaded"
+        writes = [r.getMessage() for r in caplog.records
+                  if r.levelno == logging.INFO and r.getMessage().startswith("[WRITE]")]
+        assert len(writes) == 1
+        assert writes[0].startswith("[WRITE] erp_location_a101: 12 rows in ")
+        assert writes[0].endswith(", 3 chunks)")
+
+    def test_append_mode_inserts_only_new_rows(self, tmp_path, monkeypatch):
+        raw_dir = tmp_path / "raw" / "source_erp"
+        raw_dir.mkdir(parents=True)
+        csv = raw_dir / "LOC_A101.csv"
+        # two identical rows must both survive as distinct source rows
+        csv.write_text("CID,CNTRY\nAW-1,DE\nAW-1,DE\nAW-2,FR\n", encoding="utf-8")
+        monkeypatch.setattr(load_bronze, "get_raw_data_path", lambda rel: tmp_path / "raw" / rel)
+        monkeypatch.setattr(load_bronze, "get_chunk_size", lambda: 2)
+        monkeypatch.setattr(ingestion_checker, "LEDGER_DB", str(tmp_path / "ledger.db"))
+        monkeypatch.setattr(ingestion_checker, "PROCESSED_FILE", str(tmp_path / "processed_files.csv"))
+        engine = create_engine("sqlite://")
+        target = {**self.TARGET, "load_mode": "append"}
+
+        stats = {}
+        assert load_bronze.load_target(target, engine, stats) == "loaded"
+        assert stats == {"rows_inserted": 3, "rows_skipped": 0}
+
+        with open(csv, "a", encoding="utf-8") as f:
+            f.write("AW-1,DE\nAW-3,US\n")
+        stats = {}
+        assert load_bronze.load_target(target, engine, stats) == "loaded"
+        assert stats == {"rows_inserted": 2, "rows_skipped": 3}
+
+        loaded = pd.read_sql("SELECT cid, row_hash FROM erp_location_a101", engine)
+        assert sorted(loaded["cid"]) == ["AW-1", "AW-1", "AW-1", "AW-2", "AW-3"]
+        assert loaded["row_hash"].is_unique
+        indexes = [ix["name"] for ix in inspect(engine).get_indexes("erp_location_a101")]
+        assert "ix_erp_location_a101_row_hash" in indexes
+
+    def test_existing_hashes_are_looked_up_per_chunk(self, monkeypatch):
+        engine = create_engine("sqlite://")
+        pd.DataFrame({"row_hash": range(0, 50, 2)}).to_sql("t", engine, index=False)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        monkeypatch.setattr(load_bronze, "HASH_LOOKUP_BATCH", 10)
+
+        found = load_bronze.fetch_existing_hashes(engine, "t", pd.Series(range(25), dtype="int64"))
+        assert sorted(found) == list(range(0, 25, 2))
+        assert len(statements) == 3
+        assert all("WHERE row_hash IN" in stmt for stmt in statements)
+
+    def test_row_hash_is_stable_across_chunking(self):
+        df = pd.DataFrame({"a": ["x", "x", "y", "x"], "b": ["1", "1", "2", "1"]})
+        whole = add_row_hash(add_raw_row(df.copy()))["row_hash"].tolist()
+
+        occurrences = helper.OccurrenceCounter()
+        chunked = []
+        for start in (0, 2):
+            part = add_raw_row(df.iloc[start:start + 2].copy())
+            chunked += add_row_hash(part, occurrences)["row_hash"].tolist()
+        assert chunked == whole
+        assert len(set(whole)) == 4
+        assert len(occurrences) == 2
+
+    def test_occurrence_counts_run_across_chunks(self):
+        occurrences = helper.OccurrenceCounter()
+        first = occurrences.prior(np.array([5, 3, 5], dtype=np.uint64))
+        second = occurrences.prior(np.array([3, 9, 5, 5], dtype=np.uint64))
+        assert first.tolist() == [0, 0, 0]
+        assert second.tolist() == [1, 0, 2, 2]
+        assert occurrences.keys.tolist() == [3, 5, 9]
+        assert occurrences.counts.tolist() == [2, 4, 1]
+
+
+class TestDDLMode:
+    SQLITE_DDL = """
+    CREATE DATABASE IF NOT EXISTS bronze_db;
+    USE bronze_db;
+    -- SQLite stand-in for the MySQL bronze DDL
+    CREATE TABLE IF NOT EXISTS erp_location_a101 (
+      ingest_id INTEGER PRIMARY KEY AUTOINCREMENT,
+      raw_row JSON NOT NULL,
+      cid VARCHAR(100) NULL,
+      country_name VARCHAR(255) NULL,
+      loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+      row_hash BIGINT NULL
+    );
+    """
+    TARGET = {
+        "name": "erp_location_a101",
+        "source": "source_erp",
+        "file_name": "LOC_A101.csv",
+        "columns": {"cid": "cid", "country_name": "cntry"},
+    }
+
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        raw_dir = tmp_path / "raw" / "source_erp"
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "LOC_A101.csv").write_text("CID,CNTRY\nAW-1,DE\nAW-2,FR\n", encoding="utf-8")
+        monkeypatch.setattr(load_bronze, "get_raw_data_path", lambda rel: tmp_path / "raw" / rel)
+        monkeypatch.setattr(load_bronze, "get_chunk_size", lambda: None)
+        monkeypatch.setattr(load_bronze, "read_sql_file", lambda layer, name: self.SQLITE_DDL)
+        monkeypatch.setattr(load_bronze, "get_publish_mode", lambda: "direct")
+        monkeypatch.setattr(ingestion_checker, "LEDGER_DB", str(tmp_path / "ledger.db"))
+        monkeypatch.setattr(ingestion_checker, "PROCESSED_FILE", str(tmp_path / "processed_files.csv"))
+        return raw_dir
+
+    def test_bronze_ddl_defines_every_target_table(self):
+        statements = split_statements(read_sql_file("bronze", "create_bronze_table.sql"))
+        creates = [s for s in statements if s.upper().startswith("CREATE TABLE")]
+        assert len(creates) == 6
+        assert all("ingest_id BIGINT AUTO_INCREMENT PRIMARY KEY" in s for s in creates)
+        assert all("row_hash" in s for s in creates)
+
+    def test_replace_truncates_and_keeps_definition(self, env):
+        engine = create_engine("sqlite://")
+        assert load_bronze.provision_bronze_tables(engine) == 1
+
+        assert load_bronze.load_target(self.TARGET, engine, use_ddl=True) == "loaded"
+        (env / "LOC_A101.csv").write_text("CID,CNTRY\nAW-3,US\n", encoding="utf-8")
+        assert load_bronze.load_target(self.TARGET, engine, use_ddl=True) == "loaded"
+
+        loaded = pd.read_sql("SELECT * FROM erp_location_a101", engine)
+        assert loaded["cid"].tolist() == ["AW-3"]
+        assert loaded["ingest_id"].tolist() == [3]       # AUTOINCREMENT survived
+        assert loaded["loaded_at"].notna().all()          # column default applied
+        assert inspect(engine).get_pk_constraint("erp_location_a101")["constrained_columns"] == ["ingest_id"]
+
+    def test_shadow_publish_keeps_ddl_definition(self, env, monkeypatch):
+        monkeypatch.setattr(load_bronze, "get_publish_mode", lambda: "shadow")
+        engine = create_engine("sqlite://")
+        load_bronze.provision_bronze_tables(engine)
+
+        assert load_bronze.load_target(self.TARGET, engine, use_ddl=True) == "loaded"
+        loaded = pd.read_sql("SELECT * FROM erp_location_a101", engine)
+        assert loaded["cid"].tolist() == ["AW-1", "AW-2"]
+        assert loaded["ingest_id"].tolist() == [1, 2]
+        assert inspect(engine).get_pk_constraint("erp_location_a101")["constrained_columns"] == ["ingest_id"]
+        assert sorted(inspect(engine).get_table_names()) == ["erp_location_a101"]
+
+    def test_unprovisioned_table_falls_back_to_pandas(self, env):
+        engine = create_engine("sqlite://")
+        assert load_bronze.load_target(self.TARGET, engine, use_ddl=True) == "loaded"
+        loaded = pd.read_sql("SELECT * FROM erp_location_a101", engine)
+        assert loaded["cid"].tolist() == ["AW-1", "AW-2"]
+        assert "ingest_id" not in loaded.columns
+
+    def test_pandas_table_is_rebuilt_to_ddl(self, env):
+        engine = create_engine("sqlite://")
+        assert load_bronze.load_target(self.TARGET, engine) == "loaded"
+        load_bronze.provision_bronze_tables(engine)
+
+        loaded = pd.read_sql("SELECT * FROM erp_location_a101", engine)
+        assert loaded["cid"].tolist() == ["AW-1", "AW-2"]
+        assert loaded["ingest_id"].tolist() == [1, 2]
+        assert inspect(engine).get_pk_constraint("erp_location_a101")["constrained_columns"] == ["ingest_id"]
+        assert sorted(inspect(engine).get_table_names()) == ["erp_location_a101"]
+
+        # a table already matching the DDL is left as it is
+        assert not load_bronze._rebuild_from_ddl(
+            engine, "erp_location_a101", split_statements(self.SQLITE_DDL)[2]
+        )
+
+
+class TestRawRowPointers:
+    TARGET = {
+        "name": "crm_sales_details",
+        "source": "source_crm",
+        "file_name": "sales_details.csv",
+        "raw_row_mode": "pointer",
+        "columns": {"sales_ord_num": "sls_ord_num", "sales_price": "sls_price"},
+    }
+    CSV = 'SLS_ORD_NUM,SLS_PRICE\nSO1,10\nSO2,\n"SO3, ""quoted""",7\nSO4,5\n"SO5\nnext line",1\n'
+
+    @pytest.fixture
+    def raw_dir(self, tmp_path, monkeypatch):
+        raw_dir = tmp_path / "raw" / "source_crm"
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "sales_details.csv").write_text(self.CSV, encoding="utf-8")
+        monkeypatch.setattr(load_bronze, "get_raw_data_path", lambda rel: tmp_path / "raw" / rel)
+        monkeypatch.setattr(
+            helper, "get_raw_archive_path", lambda ref, gen: tmp_path / "archive" / ref / f"{gen}.csv"
+        )
+        monkeypatch.setattr(load_bronze, "get_chunk_size", lambda: 2)
+        monkeypatch.setattr(ingestion_checker, "LEDGER_DB", str(tmp_path / "ledger.db"))
+        monkeypatch.setattr(ingestion_checker, "PROCESSED_FILE", str(tmp_path / "processed_files.csv"))
+        return raw_dir
+
+    def _archives(self, tmp_path):
+        return list((tmp_path / "archive" / "source_crm" / "sales_details.csv").glob("*.csv"))
+
+    def test_pointers_are_json(self):
+        pointers = helper.encode_raw_row_pointers("source_crm/a.csv", "g1", 0, 8, np.array([8, 20]), np.array([12, 5]))
+        assert [json.loads(p) for p in pointers] == [
+            {"file": "source_crm/a.csv", "gen": "g1", "header": [0, 8], "row": [8, 12]},
+            {"file": "source_crm/a.csv", "gen": "g1", "header": [0, 8], "row": [20, 5]},
+        ]
+
+    def test_lookup_reconstructs_inline_raw_row(self, raw_dir, monkeypatch):
+        # pointer mode never builds the inline JSON while loading
+        monkeypatch.setattr(load_bronze, "add_raw_row", None)
+        engine = create_engine("sqlite://")
+        assert load_bronze.load_target(self.TARGET, engine) == "loaded"
+
+        stored = pd.read_sql("SELECT raw_row, sales_ord_num FROM crm_sales_details", engine)
+        inline = add_raw_row(read_bronze_csv(str(raw_dir / "sales_details.csv")))["raw_row"]
+        assert [helper.lookup_raw_row(p) for p in stored["raw_row"]] == inline.tolist()
+        assert stored["sales_ord_num"].tolist()[2] == 'SO3, "quoted"'
+
+    def test_append_rows_survive_source_change(self, raw_dir, tmp_path):
+        engine = create_engine("sqlite://")
+        target = {**self.TARGET, "load_mode": "append"}
+        path = raw_dir / "sales_details.csv"
+        assert load_bronze.load_target(target, engine) == "loaded"
+        size = self._archives(tmp_path)[0].stat().st_size
+        path.write_text(self.CSV + "SO6,2\nSO7,3\n", encoding="utf-8")
+        assert load_bronze.load_target(target, engine) == "loaded"
+
+        stored = pd.read_sql("SELECT raw_row, sales_ord_num FROM crm_sales_details", engine)
+        inline = add_raw_row(read_bronze_csv(str(path)))["raw_row"]
+        assert stored["sales_ord_num"].tolist()[-2:] == ["SO6", "SO7"]
+        assert [helper.lookup_raw_row(p) for p in stored["raw_row"]] == inline.tolist()
+        # one archive, grown by the two inserted rows (and their header) only
+        [archive] = self._archives(tmp_path)
+        assert archive.stat().st_size - size == len("sls_ord_num,sls_price\nSO6,2\nSO7,3\n")
+
+    def test_replace_drops_older_generations(self, raw_dir, tmp_path):
+        engine = create_engine("sqlite://")
+        path = raw_dir / "sales_details.csv"
+        assert load_bronze.load_target(self.TARGET, engine) == "loaded"
+        path.write_text(self.CSV + "SO6,2\n", encoding="utf-8")
+        assert load_bronze.load_target(self.TARGET, engine) == "loaded"
+
+        stored = pd.read_sql("SELECT raw_row FROM crm_sales_details", engine)["raw_row"]
+        [archive] = self._archives(tmp_path)
+        assert {helper._parse_pointer(p)["gen"] for p in stored} == {archive.stem}
+        assert helper.lookup_raw_row(stored.iloc[-1]) == '{"sls_ord_num": "SO6", "sls_price": "2"}'
+
+    def test_lookup_without_archive_fails(self, raw_dir, tmp_path):
+        engine = create_engine("sqlite://")
+        load_bronze.load_target(self.TARGET, engine)
+        pointer = pd.read_sql("SELECT raw_row FROM crm_sales_details", engine)["raw_row"].iloc[0]
+        for archive in self._archives(tmp_path):
+            archive.unlink()
+        with pytest.raises(ValueError, match="missing"):
+            helper.lookup_raw_row(pointer)
+
+
+class TestLedger:
+    @pytest.fixture(autouse=True)
+    def isolated_ledger(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ingestion_checker, "LEDGER_DB", str(tmp_path / "ledger.db"))
+        monkeypatch.setattr(ingestion_checker, "PROCESSED_FILE", str(tmp_path / "processed_files.csv"))
+
+    def test_lookup_is_normalized(self):
+        ingestion_checker.mark_file_processed("Source_CRM", " Cust_Info.csv", "crm_customers_info")
+        assert ingestion_checker.is_file_processed("source_crm", "cust_info.csv ", "CRM_CUSTOMERS_INFO")
+        assert not ingestion_checker.is_file_processed("source_crm", "prd_info.csv", "crm_prd_info")
+
+    def test_marks_persist_across_reloads(self, monkeypatch):
+        ingestion_checker.mark_file_processed("source_crm", "cust_info.csv", "crm_customers_info")
+        ingestion_checker.mark_file_processed("source_crm", "cust_info.csv", "crm_customers_info")
+        monkeypatch.setattr(ingestion_checker, "_ledger", None)
+
+        assert ingestion_checker.is_file_processed("source_crm", "cust_info.csv", "crm_customers_info")
+        with sqlite3.connect(ingestion_checker.LEDGER_DB) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM processed_files").fetchone()[0] == 1
+
+    def test_migrates_legacy_csv(self, tmp_path):
+        (tmp_path / "processed_files.csv").write_text(
+            "source,file_name,bronze_table\n\n"
+            "source_crm,cust_info.csv,crm_customers_info\n"
+            "source_erp,LOC_A101.csv,erp_location_a101\n",
+            encoding="utf-8",
+        )
+        assert ingestion_checker.is_file_processed("source_erp", "LOC_A101.csv", "erp_location_a101")
+        assert ingestion_checker.is_file_processed("source_crm", "cust_info.csv", "crm_customers_info")
+
+    def test_concurrent_marks_are_all_recorded(self, monkeypatch):
+        tables = [f"table_{i}" for i in range(20)]
+        threads = [
+            threading.Thread(target=ingestion_checker.mark_file_processed,
+                             args=("source_crm", f"{t}.csv", t))
+            for t in tables
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        with sqlite3.connect(ingestion_checker.LEDGER_DB) as conn:
+            stored = [r[0] for r in conn.execute("SELECT bronze_table FROM processed_files")]
+        assert sorted(stored) == sorted(tables)
+        monkeypatch.setattr(ingestion_checker, "_ledger", None)
+        assert all(ingestion_checker.is_file_processed("source_crm", f"{t}.csv", t) for t in tables)
+
+
+class TestFileFingerprint:
+    @pytest.fixture(autouse=True)
+    def isolated_ledger(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ingestion_checker, "LEDGER_DB", str(tmp_path / "ledger.db"))
+        monkeypatch.setattr(ingestion_checker, "PROCESSED_FILE", str(tmp_path / "processed_files.csv"))
+        monkeypatch.setattr(ingestion_checker, "_hash_cache", {})
+
+    @pytest.fixture
+    def hash_calls(self, monkeypatch):
+        calls = []
+        real = ingestion_checker.compute_file_hash
+
+        def counting(path):
+            calls.append(path)
+            return real(path)
+
+        monkeypatch.setattr(ingestion_checker, "compute_file_hash", counting)
+        return calls
+
+    def test_hash_matches_streaming_blake2b(self, tmp_path):
+        import hashlib
+        path = tmp_path / "big.csv"
+        payload = b"a,b\n" + b"x" * (ingestion_checker.HASH_READ_SIZE + 123)
+        path.write_bytes(payload)
+        expected = hashlib.blake2b(payload, digest_size=ingestion_checker.HASH_DIGEST_SIZE).hexdigest()
+        assert ingestion_checker.compute_file_hash(path) == expected
+        (tmp_path / "empty.csv").write_bytes(b"")
+        assert ingestion_checker.compute_file_hash(tmp_path / "empty.csv") == \
+            hashlib.blake2b(b"", digest_size=ingestion_checker.HASH_DIGEST_SIZE).hexdigest()
+
+    def test_unchanged_stat_skips_hashing(self, tmp_path, monkeypatch, hash_calls):
+        path = tmp_path / "cust_info.csv"
+        path.write_text("id\n1\n", encoding="utf-8")
+        ingestion_checker.mark_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+        monkeypatch.setattr(ingestion_checker, "_hash_cache", {})
+        hash_calls.clear()
+
+        assert ingestion_checker.is_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+        assert hash_calls == []
+
+    def test_touched_file_with_same_bytes_is_skipped(self, tmp_path, hash_calls):
+        path = tmp_path / "cust_info.csv"
+        path.write_text("id\n1\n", encoding="utf-8")
+        ingestion_checker.mark_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        assert ingestion_checker.is_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+        assert len(hash_calls) == 2
+
+    def test_changed_bytes_are_not_processed(self, tmp_path):
+        path = tmp_path / "cust_info.csv"
+        path.write_text("id\n1\n", encoding="utf-8")
+        ingestion_checker.mark_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+        st = path.stat()
+        path.write_text("id\n2\n", encoding="utf-8")  # same size
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        assert not ingestion_checker.is_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+
+    def test_files_are_hashed_outside_the_ledger_lock(self, tmp_path, monkeypatch):
+        path = tmp_path / "cust_info.csv"
+        path.write_text("id\n1\n", encoding="utf-8")
+        ingestion_checker.mark_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+        path.write_text("id\n22\n", encoding="utf-8")
+        locked = []
+        real = ingestion_checker.compute_file_hash
+        monkeypatch.setattr(
+            ingestion_checker, "compute_file_hash",
+            lambda p: locked.append(ingestion_checker._LEDGER_LOCK.locked()) or real(p),
+        )
+
+        assert not ingestion_checker.is_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+        assert locked == [False]
+
+    def test_file_rewritten_during_load_is_reloaded(self, tmp_path, monkeypatch):
+        raw_dir = tmp_path / "raw" / "source_erp"
+        raw_dir.mkdir(parents=True)
+        path = raw_dir / "LOC_A101.csv"
+        path.write_text("CID,CNTRY\nAW-1,DE\n", encoding="utf-8")
+        monkeypatch.setattr(load_bronze, "get_raw_data_path", lambda rel: tmp_path / "raw" / rel)
+        real_write = load_bronze.write_bronze_frame
+
+        def write_then_rewrite_source(*args, **kwargs):
+            real_write(*args, **kwargs)
+            path.write_text("CID,CNTRY\nAW-1,DE\nAW-2,FR\n", encoding="utf-8")
+
+        monkeypatch.setattr(load_bronze, "write_bronze_frame", write_then_rewrite_source)
+        engine = create_engine("sqlite://")
+        assert load_bronze.load_target(TestGenericLoader.TARGET, engine) == "loaded"
+        monkeypatch.setattr(load_bronze, "write_bronze_frame", real_write)
+
+        # the ledger holds the bytes that were loaded, so the new ones are picked up
+        assert load_bronze.load_target(TestGenericLoader.TARGET, engine) == "loaded"
+        assert len(pd.read_sql("SELECT * FROM erp_location_a101", engine)) == 2
+
+    def test_legacy_entry_adopts_current_fingerprint(self, tmp_path, monkeypatch):
+        (tmp_path / "processed_files.csv").write_text(
+            "source,file_name,bronze_table\nsource_crm,cust_info.csv,crm_cust\n", encoding="utf-8"
+        )
+        path = tmp_path / "cust_info.csv"
+        path.write_text("id\n1\n", encoding="utf-8")
+
+        assert ingestion_checker.is_file_processed("source_crm", "cust_info.csv", "crm_cust", file_path=str(path))
+        with sqlite3.connect(ingestion_checker.LEDGER_DB) as conn:
+            size, digest = conn.execute("SELECT file_size, content_hash FROM processed_files").fetchone()
+        assert size == path.stat().st_size
+        assert digest == ingestion_checker.compute_file_hash(path)
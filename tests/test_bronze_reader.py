@@ -0,0 +1,185 @@
+"""
+Bronze Reader Unit Tests
+-------------------------
+Tests for the shared silver extract step (column projection, streaming
+and the numpy/pyarrow dtype backends).
+Uses an in-memory SQLite engine — no MySQL needed.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_bronze_reader.py -v
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.silver import bronze_reader
+from src.silver.bronze_reader import build_select, iter_bronze_table, read_bronze_table
+from src.silver import watermarks
+from src.silver.crm import crm_customers, crm_sales
+from src.silver.erp import erp_customers
+from src.core import publish
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    pd.DataFrame({
+        "ingest_id": [1, 2],
+        "raw_row": ['{"cid": "A"}', '{"cid": "B"}'],
+        "cid": ["A", "B"],
+        "country_name": ["DE", "US"],
+        "row_hash": [11, 22],
+    }).to_sql("erp_location_a101", engine, index=False)
+    return engine
+
+
+class TestBronzeReader:
+    def test_reads_only_requested_columns_in_order(self, engine):
+        df = read_bronze_table("erp_location_a101", ["country_name", "cid"], engine=engine)
+        assert list(df.columns) == ["country_name", "cid"]
+        assert df["cid"].tolist() == ["A", "B"]
+
+    def test_missing_columns_are_skipped(self, engine):
+        df = read_bronze_table("erp_location_a101", ["cid", "region"], engine=engine)
+        assert list(df.columns) == ["cid"]
+
+    def test_no_columns_reads_everything(self, engine):
+        df = read_bronze_table("erp_location_a101", engine=engine)
+        assert "raw_row" in df.columns
+
+    def test_builds_projected_select(self, engine):
+        assert build_select(engine, "erp_location_a101", ["cid"]) == 'SELECT cid FROM erp_location_a101'
+        with pytest.raises(ValueError):
+            build_select(engine, "erp_location_a101", ["nope"])
+
+    def test_unknown_table_raises_runtime_error(self, engine):
+        with pytest.raises(RuntimeError):
+            read_bronze_table("missing_table", ["cid"], engine=engine)
+
+
+class TestIterBronzeTable:
+    def test_yields_bounded_batches(self):
+        engine = create_engine("sqlite://")
+        pd.DataFrame({"cid": [f"C{i}" for i in range(10)], "raw_row": "{}"}).to_sql(
+            "erp_cust_az12", engine, index=False
+        )
+        batches = list(iter_bronze_table("erp_cust_az12", ["cid"], 4, engine=engine))
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert all(list(b.columns) == ["cid"] for b in batches)
+        assert pd.concat(batches)["cid"].tolist() == [f"C{i}" for i in range(10)]
+
+    def test_rejects_non_positive_chunk_size(self, engine):
+        with pytest.raises(ValueError):
+            next(iter_bronze_table("erp_location_a101", ["cid"], 0, engine=engine))
+
+
+class TestStreamedSalesPipeline:
+    @pytest.fixture
+    def engines(self, monkeypatch):
+        bronze = create_engine("sqlite://")
+        silver = create_engine("sqlite://")
+        n = 11
+        pd.DataFrame({
+            "ingest_id": range(1, n + 1),
+            "raw_row": "{}",
+            "sales_ord_num": [f"SO{i:03d}" for i in range(n)],
+            "sales_prd_key": "P1",
+            "sales_cust_id": "C1",
+            "sales_order_date_raw": "2024-01-01",
+            "sales_ship_date_raw": ["2024-01-10"] * (n - 1) + ["2023-12-01"],  # last row invalid
+            "sales_due_date_raw": "2024-01-15",
+            "sales_sales": "1",
+            "sales_quantity": "2",
+            "sales_price": ["10"] * (n - 2) + ["-10", "10"],  # one more invalid
+        }).to_sql("crm_sales_details", bronze, index=False)
+        monkeypatch.setattr(bronze_reader, "get_engine", lambda layer: bronze)
+        monkeypatch.setattr(watermarks, "get_engine", lambda layer: {"bronze": bronze, "silver": silver}[layer])
+        monkeypatch.setattr(watermarks, "is_incremental_enabled", lambda: False)
+        monkeypatch.setattr(publish, "get_publish_mode", lambda: "shadow")
+        return bronze, silver
+
+    def _silver(self, silver):
+        return pd.read_sql("SELECT * FROM crm_sales_details ORDER BY sales_ord_num", silver).drop(columns="loaded_at")
+
+    def test_streamed_matches_full_read(self, engines):
+        _, silver = engines
+        crm_sales.run_sales_pipeline("crm_sales_details", chunk_size=0)
+        full = self._silver(silver)
+        crm_sales.run_sales_pipeline("crm_sales_details", chunk_size=3)
+        streamed = self._silver(silver)
+
+        assert len(streamed) == 9
+        pd.testing.assert_frame_equal(streamed, full)
+        assert (streamed["sales_sales"] == 20).all()
+
+
+class TestDtypeBackend:
+    def _config(self, monkeypatch, backend):
+        monkeypatch.setattr(
+            bronze_reader, "load_pipeline_config", lambda: {"silver": {"dtype_backend": backend}}
+        )
+
+    def test_defaults_to_numpy(self, monkeypatch):
+        monkeypatch.setattr(bronze_reader, "load_pipeline_config", lambda: {})
+        assert bronze_reader.get_dtype_backend() == "numpy"
+        assert bronze_reader.get_string_dtype() == "string"
+
+    def test_pyarrow_falls_back_when_not_installed(self, monkeypatch):
+        self._config(monkeypatch, "pyarrow")
+        monkeypatch.setattr(bronze_reader, "_pyarrow_available", lambda: False)
+        assert bronze_reader.get_dtype_backend() == "numpy"
+
+    def test_unknown_backend_rejected(self, monkeypatch):
+        self._config(monkeypatch, "polars")
+        with pytest.raises(ValueError):
+            bronze_reader.get_dtype_backend()
+
+    def test_override_wins_over_config(self, monkeypatch):
+        self._config(monkeypatch, "polars")
+        with bronze_reader.use_dtype_backend("numpy"):
+            assert bronze_reader.get_dtype_backend() == "numpy"
+
+    def test_pyarrow_matches_numpy_outputs(self):
+        pytest.importorskip("pyarrow")
+        engine = create_engine("sqlite://")
+        pd.DataFrame({
+            "cst_id": ["1", "2", "3", None],
+            "cst_key": ["AW1", " AW2", "AW3", "AW4"],
+            "cst_firstname": [" jon", "NULL", "eve ", "x"],
+            "cst_lastname": ["yang", "huang", "", "y"],
+            "cst_marital_status": ["M", "s", None, "S"],
+            "cst_gndr": ["m", "F", "", "M"],
+            "cst_create_date_raw": ["2025-10-06", "bad", "2025-10-07", None],
+        }).to_sql("crm_customers_info", engine, index=False)
+        pd.DataFrame({
+            "cid": ["NASAW00011000", "AW00011001", "short"],
+            "birth_date_raw": ["1971-10-06", "9999-09-13", None],
+            "gender_raw": ["Male", " F", ""],
+        }).to_sql("erp_cust_az12", engine, index=False)
+
+        def customers(backend):
+            with bronze_reader.use_dtype_backend(backend):
+                df = read_bronze_table("crm_customers_info", list(crm_customers.schema_customer), engine=engine)
+                df = crm_customers.normalize_data(crm_customers.enforce_schema(df, crm_customers.schema_customer))
+                return crm_customers.standardize_data(df)
+
+        def erp(backend):
+            with bronze_reader.use_dtype_backend(backend):
+                df = read_bronze_table("erp_cust_az12", list(erp_customers.schema_customer), engine=engine)
+                df = erp_customers.enforce_schema(df, erp_customers.schema_customer)
+                df = erp_customers.standardize_customer_id(df)
+                return erp_customers.apply_value_replacements(df, erp_customers.customer_replacemts)
+
+        for run in (customers, erp):
+            expected, actual = run("numpy"), run("pyarrow")
+            assert "pyarrow" in str(actual["cst_id" if run is customers else "cid"].dtype)
+            as_objects = lambda df: df.astype(object).where(df.notna(), None)
+            pd.testing.assert_frame_equal(as_objects(actual), as_objects(expected))
@@ -0,0 +1,128 @@
+"""
+Categorical Encoding Unit Tests
+--------------------------------
+Tests for low-cardinality encoding and category-level value mappings
+used by the silver standardization steps.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_categorical.py -v
+"""
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.silver.categorical import (
+    compile_mapping,
+    encode_categoricals,
+    fill_na,
+    map_categories,
+    replace_values,
+)
+from src.silver.erp import erp_customers
+from src.silver.erp.erp_customers import (
+    LOCATION_REPLACEMENTS,
+    apply_value_replacements,
+    location_replacements,
+)
+
+
+class TestEncodeCategoricals:
+    def test_encodes_only_low_cardinality_columns(self):
+        df = pd.DataFrame({
+            "gender": ["M", "F"] * 50,
+            "id": [str(i) for i in range(100)],
+        }, dtype="string")
+        assert encode_categoricals(df, "customers") == ["gender"]
+        assert isinstance(df["gender"].dtype, pd.CategoricalDtype)
+        assert df["id"].dtype == "string"
+
+    def test_respects_column_list_and_empty_frames(self):
+        df = pd.DataFrame({"a": ["x"] * 10, "b": ["y"] * 10}, dtype="string")
+        assert encode_categoricals(df, "t", columns=["b"]) == ["b"]
+        assert encode_categoricals(df.iloc[:0], "t") == []
+
+
+class TestMapCategories:
+    def test_maps_distinct_values_and_keeps_missing(self):
+        values = pd.Series(["M", "f", None, "m", "X"], dtype="string")
+        calls = []
+
+        def mapping(distinct):
+            calls.append(len(distinct))
+            return distinct.str.lower().map({"m": "Male", "f": "Female"})
+
+        result = map_categories(values, mapping)
+        assert calls == [4]
+        assert result.tolist() == ["Male", "Female", pd.NA, "Male", pd.NA]
+        assert isinstance(result.dtype, pd.CategoricalDtype)
+
+    def test_merges_values_mapped_together(self):
+        values = pd.Series(["USA", "US", " DE", "Spain"], dtype="string").astype("category")
+        result = map_categories(values, lambda v: v.str.strip().replace({"USA": "United States", "US": "United States", "DE": "Germany"}))
+        assert result.tolist() == ["United States", "United States", "Germany", "Spain"]
+        assert sorted(result.cat.categories) == ["Germany", "Spain", "United States"]
+
+    def test_fill_na_adds_category(self):
+        values = map_categories(pd.Series(["a", None], dtype="string"), lambda v: v)
+        assert fill_na(values, "n/a").tolist() == ["a", "n/a"]
+        assert fill_na(pd.Series(["a", None], dtype="string"), "n/a").tolist() == ["a", "n/a"]
+
+    def test_matches_row_level_replacements(self):
+        df = pd.DataFrame({"country_name": ["USA", " US", "DE", "", "NONE", "France", None]}, dtype="string")
+        expected = df["country_name"].str.strip().replace(location_replacements["country_name"])
+        result = apply_value_replacements(df, location_replacements)["country_name"]
+        assert result.astype("string").tolist() == expected.tolist()
+
+
+class TestReplaceValues:
+    def test_plain_and_categorical_inputs_agree(self):
+        values = pd.Series([" M", "F", None, "X", "M"], dtype="string")
+        compiled = compile_mapping({"M": "Male", "F": "Female", "": "n/a"})
+
+        plain, hits = replace_values(values, compiled)
+        encoded, encoded_hits = replace_values(values.astype("category"), compiled)
+
+        assert plain.astype("string").fillna("-").tolist() == ["Male", "Female", "-", "X", "Male"]
+        assert encoded.astype("string").equals(plain.astype("string"))
+        assert hits == encoded_hits == 3
+        assert isinstance(plain.dtype, pd.CategoricalDtype)
+
+    def test_na_targets_and_empty_columns(self):
+        compiled = compile_mapping({"NONE": pd.NA})
+        result, hits = replace_values(pd.Series(["NONE", "DE"], dtype="string"), compiled)
+        assert result.isna().tolist() == [True, False] and hits == 1
+        assert replace_values(pd.Series([None, None], dtype="string"), compiled)[1] == 0
+
+    def test_replaces_in_place_without_copying_other_columns(self):
+        df = pd.DataFrame({
+            "cid": pd.Series(["AW1", "AW2"], dtype="string"),
+            "country_name": pd.Series(["US", "DE"], dtype="string"),
+        })
+        result = apply_value_replacements(df, LOCATION_REPLACEMENTS)
+        assert result is df
+        assert df["country_name"].astype("string").tolist() == ["United States", "Germany"]
+
+
+class TestCopyOnWriteScope:
+    def test_option_is_scoped_to_the_erp_pipeline(self, monkeypatch):
+        events = []
+
+        @contextmanager
+        def option_context(name, value):
+            events.append(("set", name, value))
+            yield
+            events.append(("restore", name))
+
+        monkeypatch.setattr(erp_customers.pd, "__version__", "2.2.3")
+        monkeypatch.setattr(erp_customers.pd, "option_context", option_context)
+        monkeypatch.setattr(erp_customers, "plan_extract", lambda *a: events.append("run") or {"mode": "none"})
+
+        erp_customers.run_customer_pipeline()
+        assert events == [("set", "mode.copy_on_write", True), "run", ("restore", "mode.copy_on_write")]
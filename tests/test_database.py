@@ -0,0 +1,104 @@
+"""
+Engine Registry Unit Tests
+---------------------------
+Tests for the per-layer engine cache, connection counter and disposal.
+Engine creation is redirected to SQLite — no MySQL needed.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_database.py -v
+"""
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core import database
+
+
+@pytest.fixture
+def sqlite_registry(monkeypatch):
+    """Build SQLite engines instead of MySQL ones and count the builds."""
+    builds = []
+
+    def fake_create(layer):
+        engine = create_engine("sqlite://")
+        database._track_connections(engine, layer)
+        builds.append(layer)
+        return engine
+
+    database.dispose_engines()
+    monkeypatch.setattr(database, "_create_layer_engine", fake_create)
+    yield builds
+    database.dispose_engines()
+
+
+class TestEngineRegistry:
+    def test_engine_is_cached_per_layer(self, sqlite_registry):
+        bronze = database.get_engine("bronze")
+        assert database.get_engine("bronze") is bronze
+        assert database.get_engine("silver") is not bronze
+        assert sqlite_registry == ["bronze", "silver"]
+
+    def test_concurrent_callers_share_one_engine(self, sqlite_registry):
+        engines = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            engines.append(database.get_engine("bronze"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(e) for e in engines}) == 1
+        assert sqlite_registry == ["bronze"]
+
+    def test_pooled_connections_are_reused(self, sqlite_registry):
+        engine = database.get_engine("bronze")
+        for _ in range(5):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        assert database.get_connection_stats()["bronze"] == 1
+
+    def test_dispose_resets_registry_and_returns_stats(self, sqlite_registry):
+        engine = database.get_engine("gold")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert database.dispose_engines() == {"gold": 1}
+        assert database.get_connection_stats() == {}
+        assert database.get_engine("gold") is not engine
+
+
+class TestRealEngineCreation:
+    def test_first_get_engine_probes_without_deadlock(self, monkeypatch):
+        """The real _create_layer_engine/_probe path, with create_engine patched to SQLite."""
+        config = {"mysql": {"user": "u", "password": "p", "host": "h",
+                            "bronze_db": "b", "silver_db": "s", "gold_db": "g"}}
+        monkeypatch.setattr(database, "load_config", lambda: config)
+        monkeypatch.setattr(database, "create_engine", lambda url, **kwargs: create_engine("sqlite://"))
+        database.dispose_engines()
+
+        result = {}
+        thread = threading.Thread(target=lambda: result.setdefault("engine", database.get_engine("bronze")))
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=10)
+
+        # a deadlocked thread still holds the registry lock: no cleanup then
+        assert not thread.is_alive(), "get_engine deadlocked while probing the new engine"
+        try:
+            assert database.get_connection_stats()["bronze"] == 1
+            assert database.get_engine("bronze") is result["engine"]
+        finally:
+            database.dispose_engines()
@@ -0,0 +1,96 @@
+"""
+Date Parser Unit Tests
+-----------------------
+Tests for the shared silver date parser: format inference and caching,
+arithmetic YYYYMMDD parsing, memoized unique values and invalid counts.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_date_parser.py -v
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.silver import date_parser
+from src.silver.date_parser import (
+    YYYYMMDD,
+    infer_date_format,
+    parse_date_column,
+    parse_dates,
+    parse_yyyymmdd,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    date_parser.clear_format_cache()
+    yield
+    date_parser.clear_format_cache()
+
+
+class TestParseYYYYMMDD:
+    def test_integers_and_strings(self):
+        result = parse_yyyymmdd(pd.Series([20101229, 20110105]))
+        assert result.tolist() == [pd.Timestamp("2010-12-29"), pd.Timestamp("2011-01-05")]
+        assert parse_yyyymmdd(pd.Series(["20240229"]))[0] == pd.Timestamp("2024-02-29")
+
+    def test_far_future_placeholder_dates_are_kept(self):
+        assert parse_yyyymmdd(pd.Series(["99991231"]))[0] == pd.Timestamp("9999-12-31")
+        assert parse_date_column(pd.Series(["9999-09-13", "1971-10-06"]), "bdate")[0].year == 9999
+
+    def test_invalid_values_become_nat(self):
+        values = pd.Series(["0", "20110230", "20231301", "5489", "abc", None, "2011010.5"])
+        assert parse_yyyymmdd(values).isna().all()
+
+    def test_matches_pandas(self):
+        dates = pd.date_range("1999-12-25", periods=800, freq="3D")
+        values = pd.Series(dates.strftime("%Y%m%d"))
+        assert parse_yyyymmdd(values).tolist() == pd.to_datetime(values, format=YYYYMMDD).tolist()
+
+
+class TestInferDateFormat:
+    def test_detects_formats(self):
+        assert infer_date_format(pd.Series(["20101229", "20110105"])) == YYYYMMDD
+        assert infer_date_format(pd.Series(["2024-01-01", "bad"])) == "%Y-%m-%d"
+        assert infer_date_format(pd.Series(["31-12-2024"])) == "%d-%m-%Y"
+
+    def test_format_is_cached_per_column(self, monkeypatch):
+        infer_date_format(pd.Series(["20101229"]), "order_dt")
+        monkeypatch.setattr(date_parser, "DATE_FORMATS", ())
+        assert infer_date_format(pd.Series(["20101230"]), "order_dt") == YYYYMMDD
+
+
+class TestParseDateColumn:
+    def test_memoized_and_direct_paths_agree(self, monkeypatch):
+        values = pd.Series(["20101229", "20110105", "0", None] * 50, dtype="str")
+        memoized = parse_date_column(values, "memo")
+        monkeypatch.setattr(date_parser, "MEMO_MAX_UNIQUE_RATIO", 0.0)
+        direct = parse_date_column(values, "direct")
+        pd.testing.assert_series_equal(memoized, direct)
+        assert memoized.dtype == "datetime64[us]"
+
+    def test_strips_whitespace_and_keeps_parsed_columns(self):
+        assert parse_date_column(pd.Series([" 2024-01-01 "]), "d")[0] == pd.Timestamp("2024-01-01")
+        parsed = pd.Series(pd.to_datetime(["2024-01-01"]))
+        assert parse_date_column(parsed) is parsed
+
+    def test_reinfers_when_cached_format_stops_matching(self):
+        parse_date_column(pd.Series(["20101229"]), "d")
+        result = parse_date_column(pd.Series(["2024-01-01", "2024-02-01"]), "d")
+        assert result.notna().all()
+
+    def test_parse_dates_reports_invalid_counts(self):
+        df = pd.DataFrame({
+            "order_dt": ["20101229", "0", None],
+            "ship_dt": ["2024-01-01", "2024-13-01", "2024-01-03"],
+        })
+        invalid = parse_dates(df, ["order_dt", "ship_dt", "missing"])
+        assert invalid == {"order_dt": 1, "ship_dt": 1}
+        assert pd.api.types.is_datetime64_any_dtype(df["order_dt"])
@@ -0,0 +1,79 @@
+"""
+Deduplication Unit Tests
+-------------------------
+Tests for the hash-based keep-latest primitive in src/silver/dedup.py.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_dedup.py -v
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.silver.dedup import keep_latest
+
+
+class TestKeepLatest:
+    def test_keeps_latest_per_key_in_input_order(self):
+        df = pd.DataFrame({
+            "id": ["2", "1", "1", "2", "3"],
+            "updated": pd.to_datetime(["2024-05-01", "2024-01-01", "2024-06-01", "2024-02-01", "2024-03-01"]),
+        })
+        kept, deleted = keep_latest(df, ["id"], "updated")
+        assert kept.index.tolist() == [0, 2, 4]
+        assert deleted.index.tolist() == [1, 3]
+        assert len(df) == 5  # input untouched
+
+    def test_ties_keep_first_and_missing_recency_loses(self):
+        df = pd.DataFrame({
+            "id": ["1", "1", "2", "2", "3", "3"],
+            "updated": pd.to_datetime([None, "2024-01-01", "2024-01-01", "2024-01-01", None, None]),
+        })
+        kept, _ = keep_latest(df, ["id"], "updated")
+        assert kept.index.tolist() == [1, 2, 4]
+
+    def test_composite_keys_and_numeric_recency(self):
+        df = pd.DataFrame({
+            "ord": ["A", "A", "A", "B"],
+            "prd": ["x", "x", "y", "x"],
+            "version": [1, 3, 2, np.nan],
+        })
+        kept, deleted = keep_latest(df, ["ord", "prd"], "version")
+        assert kept.index.tolist() == [1, 2, 3]
+        assert deleted.index.tolist() == [0]
+
+    def test_missing_keys_form_one_group(self):
+        df = pd.DataFrame({
+            "id": pd.Series([None, None, "1"], dtype="string"),
+            "updated": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-01-01"]),
+        })
+        kept, _ = keep_latest(df, ["id"], "updated")
+        assert kept.index.tolist() == [1, 2]
+
+    def test_far_future_dates(self):
+        df = pd.DataFrame({"id": ["1", "1"], "updated": pd.to_datetime(["2024-01-01", "9999-12-31"])})
+        kept, _ = keep_latest(df, ["id"], "updated")
+        assert kept.index.tolist() == [1]
+
+    def test_matches_sort_based_dedup(self):
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame({
+            "id": rng.integers(0, 50, 1000).astype(str),
+            "updated": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.permutation(1000), unit="h"),
+        })
+        expected = df.sort_values(["id", "updated"], ascending=[True, False]).drop_duplicates("id")
+        kept, deleted = keep_latest(df, ["id"], "updated")
+        assert sorted(kept.index) == sorted(expected.index)
+        assert len(kept) + len(deleted) == len(df)
+
+    def test_empty_frame(self):
+        df = pd.DataFrame(columns=["id", "updated"])
+        kept, deleted = keep_latest(df, ["id"], "updated")
+        assert kept.empty and deleted.empty
@@ -0,0 +1,66 @@
+"""
+String Normalization Unit Tests
+--------------------------------
+Tests for the one-pass null-token kernel used by the silver
+normalize_data functions.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_normalize.py -v
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.silver import normalize
+from src.silver.normalize import DEFAULT_NULL_TOKENS, normalize_strings
+
+
+def _frame():
+    return pd.DataFrame({
+        "name": [" jon yang ", "NULL", None, "eugene  "],
+        "gender": ["M", "", "nan", " F"],
+        "amount": [1.0, 2.0, 3.0, 4.0],
+    }).astype({"name": "string", "gender": "string"})
+
+
+class TestNormalizeStrings:
+    def test_matches_per_column_strip_and_replace(self):
+        df = _frame()
+        expected = _frame()
+        for col in ["name", "gender"]:
+            expected[col] = expected[col].str.strip().replace(list(DEFAULT_NULL_TOKENS), pd.NA)
+
+        normalize_strings(df, tokens=DEFAULT_NULL_TOKENS)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_counts_converted_values_per_column(self):
+        df = _frame()
+        converted = normalize_strings(df, tokens=DEFAULT_NULL_TOKENS)
+        # pre-existing NULLs are not counted
+        assert converted == {"name": 1, "gender": 2}
+
+    def test_title_columns(self):
+        df = _frame()
+        normalize_strings(df, tokens=DEFAULT_NULL_TOKENS, title_columns=["name"])
+        assert df["name"].tolist()[::3] == ["Jon Yang", "Eugene"]
+        assert df["gender"].tolist()[::3] == ["M", "F"]
+
+    def test_tokens_from_config(self, monkeypatch):
+        monkeypatch.setattr(normalize, "load_pipeline_config", lambda: {"silver": {"null_tokens": ["N/A"]}})
+        df = pd.DataFrame({"code": ["N/A", "NULL", " x"]}, dtype="string")
+        assert normalize_strings(df) == {"code": 1}
+        assert df["code"].tolist() == [pd.NA, "NULL", "x"]
+
+    def test_non_string_and_empty_frames_untouched(self):
+        df = _frame()
+        normalize_strings(df, tokens=DEFAULT_NULL_TOKENS)
+        assert df["amount"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+        empty = pd.DataFrame({"name": pd.Series([], dtype="string")})
+        assert normalize_strings(empty) == {"name": 0}
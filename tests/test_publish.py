@@ -0,0 +1,160 @@
+"""
+Shadow Publishing Unit Tests
+-----------------------------
+Tests for shadow-table loads, the atomic swap into the live table and
+keyed upserts through a stage table.
+Uses an in-memory SQLite engine — no MySQL needed.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_publish.py -v
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core import publish
+from src.core.publish import ensure_unique_key, publish_dataframe, shadow_table, upsert_dataframe
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    pd.DataFrame({"id": [1, 2]}).to_sql("customers", engine, index=False)
+    return engine
+
+
+def _ids(engine, table="customers"):
+    return pd.read_sql(f"SELECT id FROM {table} ORDER BY id", engine)["id"].tolist()
+
+
+class TestShadowTable:
+    def test_live_table_serves_old_data_until_swap(self, engine):
+        with shadow_table(engine, "customers") as shadow:
+            assert shadow == "customers__shadow"
+            pd.DataFrame({"id": [7, 8, 9]}).to_sql(shadow, engine, index=False)
+            assert _ids(engine) == [1, 2]
+        assert _ids(engine) == [7, 8, 9]
+        assert inspect(engine).get_table_names() == ["customers"]
+
+    def test_failed_load_keeps_live_table(self, engine):
+        with pytest.raises(RuntimeError):
+            with shadow_table(engine, "customers") as shadow:
+                pd.DataFrame({"id": [7]}).to_sql(shadow, engine, index=False)
+                raise RuntimeError("load failed")
+        assert _ids(engine) == [1, 2]
+        assert inspect(engine).get_table_names() == ["customers"]
+
+    def test_first_publish_creates_table(self):
+        engine = create_engine("sqlite://")
+        with shadow_table(engine, "orders") as shadow:
+            pd.DataFrame({"id": [1]}).to_sql(shadow, engine, index=False)
+        assert _ids(engine, "orders") == [1]
+
+    def test_like_existing_copies_definition(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE orders (ingest_id INTEGER PRIMARY KEY AUTOINCREMENT, id INT NOT NULL)"
+            ))
+        with shadow_table(engine, "orders", like_existing=True) as shadow:
+            pd.DataFrame({"id": [5]}).to_sql(shadow, engine, index=False, if_exists="append")
+        assert inspect(engine).get_pk_constraint("orders")["constrained_columns"] == ["ingest_id"]
+        assert _ids(engine, "orders") == [5]
+
+    def test_nothing_written_leaves_live_table(self, engine):
+        with shadow_table(engine, "customers"):
+            pass
+        assert _ids(engine) == [1, 2]
+
+
+class TestPublishDataframe:
+    def test_shadow_mode(self, engine, monkeypatch):
+        monkeypatch.setattr(publish, "get_publish_mode", lambda: "shadow")
+        stats = publish_dataframe(pd.DataFrame({"id": [3]}), "customers", engine)
+        assert stats["table"] == "customers"
+        assert stats["rows"] == 1
+        assert _ids(engine) == [3]
+
+    def test_direct_mode(self, engine, monkeypatch):
+        monkeypatch.setattr(publish, "get_publish_mode", lambda: "direct")
+        publish_dataframe(pd.DataFrame({"id": [4]}), "customers", engine)
+        assert _ids(engine) == [4]
+
+    def test_unknown_mode_rejected(self, monkeypatch):
+        monkeypatch.setattr(publish, "load_pipeline_config", lambda: {"publish": {"mode": "blue"}})
+        with pytest.raises(ValueError):
+            publish.get_publish_mode()
+
+
+def _sales(orders, prices, loaded_at="2024-01-01"):
+    return pd.DataFrame({
+        "ord": orders,
+        "prd": "P1",
+        "price": prices,
+        "loaded_at": loaded_at,
+    })
+
+
+class TestUpsertDataframe:
+    KEYS = ["ord", "prd"]
+
+    def _rows(self, engine):
+        return pd.read_sql("SELECT ord, price, loaded_at FROM sales ORDER BY ord", engine)
+
+    def test_creates_keyed_table(self):
+        engine = create_engine("sqlite://")
+        stats = upsert_dataframe(_sales(["A", "B"], [1.0, 2.0]), "sales", engine, self.KEYS)
+        assert (stats["inserted"], stats["updated"]) == (2, 0)
+        indexes = inspect(engine).get_indexes("sales")
+        assert [i["column_names"] for i in indexes if i["unique"]] == [self.KEYS]
+
+    def test_inserts_updates_and_skips_unchanged(self):
+        engine = create_engine("sqlite://")
+        upsert_dataframe(_sales(["A", "B", "C"], [1.0, 2.0, None]), "sales", engine, self.KEYS)
+
+        stats = upsert_dataframe(
+            _sales(["A", "B", "C", "D"], [1.0, 5.0, None, 4.0], loaded_at="2024-02-01"),
+            "sales", engine, self.KEYS,
+        )
+        assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (1, 1, 2)
+
+        rows = self._rows(engine)
+        assert rows["price"].tolist()[:2] == [1.0, 5.0]
+        assert rows["price"].isna().tolist() == [False, False, True, False]
+        # unchanged rows keep their original loaded_at
+        assert rows["loaded_at"].tolist() == ["2024-01-01", "2024-02-01", "2024-01-01", "2024-02-01"]
+        assert not inspect(engine).has_table("sales__stage")
+
+    def test_last_row_per_key_wins(self):
+        engine = create_engine("sqlite://")
+        upsert_dataframe(_sales(["A"], [1.0]), "sales", engine, self.KEYS)
+        upsert_dataframe(_sales(["A", "A"], [2.0, 3.0]), "sales", engine, self.KEYS)
+        assert self._rows(engine)["price"].tolist() == [3.0]
+
+    def test_adds_key_to_unkeyed_table(self):
+        engine = create_engine("sqlite://")
+        _sales(["A"], [1.0]).to_sql("sales", engine, index=False)
+        upsert_dataframe(_sales(["A"], [9.0]), "sales", engine, self.KEYS)
+        assert self._rows(engine)["price"].tolist() == [9.0]
+
+    def test_duplicate_live_keys_fall_back_to_merge(self):
+        engine = create_engine("sqlite://")
+        _sales(["A", "A"], [1.0, 2.0]).to_sql("sales", engine, index=False)
+        assert ensure_unique_key(engine, "sales", self.KEYS) is False
+
+        stats = upsert_dataframe(_sales(["A", "B"], [7.0, 8.0]), "sales", engine, self.KEYS)
+        assert stats["updated"] == 2  # both live duplicates were replaced
+        assert self._rows(engine)["price"].tolist() == [7.0, 8.0]
+
+    def test_mysql_uses_on_duplicate_key_update(self):
+        engine = create_engine("mysql+pymysql://user:pw@localhost/silver_db")
+        sql = publish._upsert_sql(engine, "sales", "sales__stage", ["ord", "prd", "price"], self.KEYS)
+        assert sql.endswith("ON DUPLICATE KEY UPDATE price = s.price")
@@ -0,0 +1,170 @@
+"""
+SCD2 Unit Tests
+---------------
+Tests for src/silver/scd2.py: end-date derivation, incremental merging of
+new versions into a stored history, and the incremental products
+pipeline against a full recompute. Uses in-memory SQLite engines — no
+MySQL needed.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_scd2.py -v
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from sqlalchemy import Date, create_engine, text
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core import publish
+from src.silver import bronze_reader, scd2, watermarks
+from src.silver.crm import crm_products
+
+
+def _versions(rows):
+    df = pd.DataFrame(rows, columns=["ver_id", "item", "start_dt", "end_dt"])
+    df["start_dt"] = pd.to_datetime(df["start_dt"]).astype("datetime64[us]")
+    df["end_dt"] = pd.to_datetime(df["end_dt"]).astype("datetime64[us]")
+    return df
+
+
+DTYPE = {"start_dt": Date(), "end_dt": Date()}
+
+
+def _stored(engine):
+    df = pd.read_sql("SELECT ver_id, item, start_dt, end_dt FROM dim ORDER BY ver_id", engine)
+    return [tuple(None if pd.isna(v) else v for v in row) for row in df.itertuples(index=False)]
+
+
+class TestCloseVersions:
+    def test_end_date_is_day_before_next_start(self):
+        df = _versions([
+            (2, "A", "2024-03-01", None),
+            (1, "A", "2024-01-01", None),
+            (3, "B", "2024-02-01", None),
+        ])
+        result = scd2.close_versions(df, ["item"], "start_dt", "end_dt")
+        assert result["ver_id"].tolist() == [1, 2, 3]
+        assert result["end_dt"].tolist()[0] == pd.Timestamp("2024-02-29")
+        assert result["end_dt"].isna().tolist() == [False, True, True]
+
+
+class TestMergeVersions:
+    @pytest.fixture
+    def engine(self):
+        engine = create_engine("sqlite://")
+        history = scd2.close_versions(_versions([
+            (1, "A", "2024-01-01", None),
+            (2, "B", "2024-01-01", None),
+            (3, "A", "2024-02-01", None),
+        ]), ["item"], "start_dt", "end_dt")
+        history.to_sql("dim", engine, index=False, dtype=DTYPE)
+        return engine
+
+    def _merge(self, engine, rows):
+        return scd2.merge_versions(
+            _versions(rows), "dim", engine, ["item"], "start_dt", "end_dt", "ver_id", dtype=DTYPE
+        )
+
+    def test_new_version_closes_only_the_open_record(self, engine):
+        stats = self._merge(engine, [(4, "A", "2024-03-01", None)])
+
+        assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (1, 1, 1)
+        assert _stored(engine) == [
+            (1, "A", "2024-01-01", "2024-01-31"),
+            (2, "B", "2024-01-01", None),
+            (3, "A", "2024-02-01", "2024-02-29"),
+            (4, "A", "2024-03-01", None),
+        ]
+
+    def test_late_version_is_slotted_between_neighbours(self, engine):
+        self._merge(engine, [(4, "A", "2024-01-15", None)])
+
+        assert _stored(engine)[0] == (1, "A", "2024-01-01", "2024-01-14")
+        assert _stored(engine)[3] == (4, "A", "2024-01-15", "2024-01-31")
+        assert _stored(engine)[2] == (3, "A", "2024-02-01", None)
+
+    def test_redelivered_versions_change_nothing(self, engine):
+        before = _stored(engine)
+        stats = self._merge(engine, [(3, "A", "2024-02-01", None), (2, "B", "2024-01-01", None)])
+
+        assert (stats["inserted"], stats["updated"]) == (0, 0)
+        assert _stored(engine) == before
+
+    def test_missing_table_is_created(self):
+        engine = create_engine("sqlite://")
+        stats = scd2.merge_versions(
+            _versions([(1, "A", "2024-01-01", None), (2, "A", "2024-02-01", None)]),
+            "dim", engine, ["item"], "start_dt", "end_dt", "ver_id", dtype=DTYPE,
+        )
+        assert stats["inserted"] == 2
+        assert [row[3] for row in _stored(engine)] == ["2024-01-31", None]
+
+
+def _product_rows(rows, loaded_at):
+    return pd.DataFrame([
+        {"raw_row": "{}", "prd_id": prd_id, "prd_key": key, "prd_name": "bike", "prd_cost": "10",
+         "prd_line": "R", "prd_start_date_raw": start, "prd_end_date_raw": None, "loaded_at": loaded_at}
+        for prd_id, key, start in rows
+    ])
+
+
+class TestIncrementalProductsPipeline:
+    @pytest.fixture
+    def engines(self, monkeypatch):
+        bronze = create_engine("sqlite://")
+        silver = create_engine("sqlite://")
+        with bronze.begin() as conn:
+            conn.execute(text(
+                """
+                CREATE TABLE crm_prd_info (
+                  ingest_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                  raw_row JSON, prd_id TEXT, prd_key TEXT, prd_name TEXT, prd_cost TEXT,
+                  prd_line TEXT, prd_start_date_raw TEXT, prd_end_date_raw TEXT, loaded_at TIMESTAMP
+                )
+                """
+            ))
+        layers = {"bronze": bronze, "silver": silver}
+        monkeypatch.setattr(watermarks, "get_engine", lambda layer: layers[layer])
+        monkeypatch.setattr(bronze_reader, "get_engine", lambda layer: layers[layer])
+        monkeypatch.setattr(watermarks, "is_incremental_enabled", lambda: True)
+        monkeypatch.setattr(publish, "get_publish_mode", lambda: "direct")
+        return bronze, silver
+
+    def _silver(self, silver):
+        return pd.read_sql(
+            "SELECT prd_id, cat_id, prd_key, prd_start_dt, prd_end_dt FROM crm_prd_info "
+            "ORDER BY CAST(prd_id AS INTEGER)", silver
+        )
+
+    def test_delta_matches_full_recompute(self, engines):
+        bronze, silver = engines
+        _product_rows([
+            ("1", "CO-RF-FR-1", "2011-07-01"),
+            ("2", "CO-RF-FR-1", "2012-07-01"),
+            ("3", "BI-RB-BK-2", "2011-07-01"),
+        ], "2024-05-01 10:00:00").to_sql("crm_prd_info", bronze, index=False, if_exists="append")
+        crm_products.run_products_pipeline("crm_prd_info")
+
+        delta = _product_rows([
+            ("4", "CO-RF-FR-1", "2013-07-01"),
+            ("5", "AC-HE-HL-3", "2013-07-01"),
+        ], "2024-05-02 10:00:00")
+        delta.to_sql("crm_prd_info", bronze, index=False, if_exists="append")
+        crm_products.run_products_pipeline("crm_prd_info")
+        incremental = self._silver(silver)
+        assert watermarks.get_watermark(silver, "crm_prd_info")["ingest_id"] == 5
+
+        with silver.begin() as conn:
+            conn.execute(text("DELETE FROM silver_watermarks"))
+        crm_products.run_products_pipeline("crm_prd_info")
+        full = self._silver(silver)
+
+        assert incremental["prd_end_dt"].isna().tolist() == [False, False, True, True, True]
+        assert incremental["prd_end_dt"].str[:10].tolist()[:2] == ["2012-06-30", "2013-06-30"]
+        pd.testing.assert_frame_equal(incremental, full)
@@ -285,6 +285,12 @@ class TestSalesNormalize:
         df = sales_normalize(df)
         assert "raw_row" not in df.columns
 
+    def test_projected_frame_without_raw_row(self):
+        df = _make_sales_df().drop(columns="raw_row")
+        df = sales_enforce_schema(df, schema_sales)
+        df = sales_normalize(df)
+        assert list(df.columns) == list(_make_sales_df().drop(columns="raw_row").columns)
+
 
 class TestDatetimeConversion:
     def test_converts_date_columns(self):
@@ -0,0 +1,111 @@
+"""
+Validation Rule Unit Tests
+--------------------------
+Tests for the declarative validation rules in src/silver/validation.py:
+rule loading, the violation bitmask, per-rule counts, and parity with the
+previous hard-coded crm_sales_details checks.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_validation.py -v
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.silver import validation
+from src.silver.crm.crm_sales import SALES_RULES, validate_data
+
+RULES = [
+    {"name": "negative", "expr": "amount < 0"},
+    {"name": "missing", "expr": "amount.isna()"},
+    {"name": "late", "expr": "start_dt > end_dt"},
+]
+
+
+def _frame():
+    return pd.DataFrame({
+        "amount": [5.0, -1.0, None, -2.0],
+        "start_dt": pd.to_datetime(["2024-01-01", "2024-01-01", "2024-02-01", None]),
+        "end_dt": pd.to_datetime(["2024-01-02", "2023-12-31", "2024-01-01", "2024-01-01"]),
+    })
+
+
+class TestEvaluateRules:
+    def test_bitmask_and_counts(self):
+        mask, counts = validation.evaluate_rules(_frame(), RULES)
+        assert mask.dtype == np.uint8
+        assert mask.tolist() == [0, 0b101, 0b110, 0b001]
+        assert counts == {"negative": 2, "missing": 1, "late": 2}
+        assert validation.describe_violations(mask[2], RULES) == ["missing", "late"]
+
+    def test_mask_dtype_grows_with_rule_count(self):
+        assert validation.mask_dtype(8) is np.uint8
+        assert validation.mask_dtype(9) is np.uint16
+        assert validation.mask_dtype(64) is np.uint64
+        with pytest.raises(ValueError):
+            validation.mask_dtype(65)
+
+    def test_bad_expression_names_the_rule(self):
+        with pytest.raises(ValueError, match="typo"):
+            validation.evaluate_rules(_frame(), [{"name": "typo", "expr": "amout < 0"}])
+
+
+class TestSplitValid:
+    def test_invalid_rows_carry_their_violations(self):
+        valid, invalid, counts = validation.split_valid(_frame(), "t", RULES)
+        assert len(valid) == 1 and "violations" not in valid.columns
+        assert invalid["violations"].tolist() == [0b101, 0b110, 0b001]
+        assert sum(counts.values()) == 5
+
+    def test_valid_rows_are_an_independent_copy(self):
+        df = _frame()
+        valid, _, _ = validation.split_valid(df, "t", RULES)
+        valid["amount"] = 0.0
+        assert df["amount"].iloc[0] == 5.0
+
+    def test_no_rules_keeps_everything(self):
+        valid, invalid, counts = validation.split_valid(_frame(), "t", [])
+        assert (len(valid), len(invalid), counts) == (4, 0, {})
+
+
+class TestGetRules:
+    def test_config_overrides_default(self, monkeypatch):
+        config = {"silver": {"validation_rules": {"t": [{"name": "neg", "expr": "x < 0"}]}}}
+        monkeypatch.setattr(validation, "load_pipeline_config", lambda: config)
+        assert validation.get_rules("t", default=RULES) == [{"name": "neg", "expr": "x < 0"}]
+        assert validation.get_rules("other", default=RULES) == RULES
+
+    def test_rule_without_expr_is_rejected(self, monkeypatch):
+        config = {"silver": {"validation_rules": {"t": [{"name": "neg"}]}}}
+        monkeypatch.setattr(validation, "load_pipeline_config", lambda: config)
+        with pytest.raises(ValueError):
+            validation.get_rules("t")
+
+
+class TestSalesRules:
+    def test_matches_hard_coded_checks(self):
+        rng = np.random.default_rng(7)
+        rows = 1000
+        df = pd.DataFrame({
+            "sales_price": rng.choice([10.0, -5.0, np.nan], rows),
+            "sales_quantity": rng.choice([1.0, -1.0, np.nan], rows),
+            "sales_sales": rng.choice([10.0, -10.0], rows),
+            "sales_order_date_raw": pd.Timestamp("2024-01-10") + pd.to_timedelta(rng.integers(-5, 5, rows), unit="D"),
+            "sales_ship_date_raw": pd.Timestamp("2024-01-10"),
+        })
+        expected = (
+            (df["sales_price"] < 0) | (df["sales_quantity"] < 0) | (df["sales_sales"] < 0)
+            | (df["sales_order_date_raw"] > df["sales_ship_date_raw"])
+            | df["sales_quantity"].isna() | df["sales_price"].isna()
+        )
+        valid, invalid = validate_data(df, SALES_RULES)
+        assert valid.index.tolist() == df.index[~expected].tolist()
+        assert invalid.index.tolist() == df.index[expected].tolist()
@@ -0,0 +1,139 @@
+"""
+Watermark Unit Tests
+---------------------
+Tests for incremental silver processing: extract planning from the
+bronze ingest_id watermark, delta reads and keyed merges into silver.
+Uses in-memory SQLite engines for bronze and silver — no MySQL needed.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_watermarks.py -v
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core import publish
+from src.silver import bronze_reader, watermarks
+from src.silver.crm import crm_sales
+
+
+def _sales_rows(orders, price="10", loaded_at="2024-05-01 10:00:00"):
+    return pd.DataFrame({
+        "raw_row": "{}",
+        "sales_ord_num": orders,
+        "sales_prd_key": "P1",
+        "sales_cust_id": "C1",
+        "sales_order_date_raw": "2024-01-01",
+        "sales_ship_date_raw": "2024-01-10",
+        "sales_due_date_raw": "2024-01-15",
+        "sales_sales": "1",
+        "sales_quantity": "2",
+        "sales_price": price,
+        "loaded_at": loaded_at,
+    })
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    bronze = create_engine("sqlite://")
+    silver = create_engine("sqlite://")
+    with bronze.begin() as conn:
+        conn.execute(text(
+            """
+            CREATE TABLE crm_sales_details (
+              ingest_id INTEGER PRIMARY KEY AUTOINCREMENT,
+              raw_row JSON, sales_ord_num TEXT, sales_prd_key TEXT, sales_cust_id TEXT,
+              sales_order_date_raw TEXT, sales_ship_date_raw TEXT, sales_due_date_raw TEXT,
+              sales_sales TEXT, sales_quantity TEXT, sales_price TEXT, loaded_at TIMESTAMP
+            )
+            """
+        ))
+    layers = {"bronze": bronze, "silver": silver}
+    monkeypatch.setattr(watermarks, "get_engine", lambda layer: layers[layer])
+    monkeypatch.setattr(bronze_reader, "get_engine", lambda layer: layers[layer])
+    monkeypatch.setattr(watermarks, "is_incremental_enabled", lambda: True)
+    monkeypatch.setattr(publish, "get_publish_mode", lambda: "direct")
+    return bronze, silver
+
+
+def _append_bronze(bronze, df):
+    df.to_sql("crm_sales_details", bronze, index=False, if_exists="append")
+
+
+class TestPlanExtract:
+    def test_full_then_none_then_delta(self, engines):
+        bronze, silver = engines
+        _append_bronze(bronze, _sales_rows(["SO1", "SO2"]))
+
+        plan = watermarks.plan_extract("crm_sales_details", "crm_sales_details")
+        assert plan["mode"] == "full"
+        watermarks.save_watermark(silver, "crm_sales_details", "crm_sales_details", plan["high"])
+
+        assert watermarks.plan_extract("crm_sales_details", "crm_sales_details")["mode"] == "none"
+
+        _append_bronze(bronze, _sales_rows(["SO3"], loaded_at="2024-05-02 10:00:00"))
+        plan = watermarks.plan_extract("crm_sales_details", "crm_sales_details")
+        assert (plan["mode"], plan["after"], plan["upto"]) == ("delta", 2, 3)
+        assert watermarks.ingest_range(plan) == (2, 3)
+
+    def test_reloaded_bronze_forces_full(self, engines):
+        bronze, silver = engines
+        _append_bronze(bronze, _sales_rows(["SO1", "SO2"]))
+        plan = watermarks.plan_extract("crm_sales_details", "crm_sales_details")
+        watermarks.save_watermark(silver, "crm_sales_details", "crm_sales_details", plan["high"])
+
+        with bronze.begin() as conn:
+            conn.execute(text("DELETE FROM crm_sales_details"))
+        _append_bronze(bronze, _sales_rows(["SO1", "SO2", "SO3"], loaded_at="2024-06-01 00:00:00"))
+        assert watermarks.plan_extract("crm_sales_details", "crm_sales_details")["mode"] == "full"
+
+    def test_disabled_or_no_ingest_id_is_full(self, engines, monkeypatch):
+        bronze, _ = engines
+        _append_bronze(bronze, _sales_rows(["SO1"]))
+        monkeypatch.setattr(watermarks, "is_incremental_enabled", lambda: False)
+        assert watermarks.plan_extract("crm_sales_details", "crm_sales_details")["high"] is None
+
+        monkeypatch.setattr(watermarks, "is_incremental_enabled", lambda: True)
+        _sales_rows(["SO1"]).to_sql("plain_table", bronze, index=False)
+        plan = watermarks.plan_extract("plain_table", "plain_table")
+        assert (plan["mode"], plan["high"]) == ("full", None)
+
+
+class TestIncrementalSalesPipeline:
+    def _silver(self, silver):
+        return pd.read_sql(
+            "SELECT sales_ord_num, sales_price FROM crm_sales_details ORDER BY sales_ord_num", silver
+        )
+
+    @pytest.mark.parametrize("chunk_size", [0, 2])
+    def test_delta_rows_are_merged(self, engines, chunk_size):
+        bronze, silver = engines
+        _append_bronze(bronze, _sales_rows(["SO1", "SO2", "SO3"]))
+        crm_sales.run_sales_pipeline("crm_sales_details", chunk_size=chunk_size)
+        assert self._silver(silver)["sales_ord_num"].tolist() == ["SO1", "SO2", "SO3"]
+
+        # SO2 is corrected, SO4 is new
+        _append_bronze(bronze, _sales_rows(["SO2", "SO4"], price="20", loaded_at="2024-05-02 10:00:00"))
+        crm_sales.run_sales_pipeline("crm_sales_details", chunk_size=chunk_size)
+
+        result = self._silver(silver)
+        assert result["sales_ord_num"].tolist() == ["SO1", "SO2", "SO3", "SO4"]
+        assert result["sales_price"].tolist() == [10, 20, 10, 20]
+        assert watermarks.get_watermark(silver, "crm_sales_details")["ingest_id"] == 5
+
+    def test_up_to_date_run_writes_nothing(self, engines, monkeypatch):
+        bronze, _ = engines
+        _append_bronze(bronze, _sales_rows(["SO1"]))
+        crm_sales.run_sales_pipeline("crm_sales_details", chunk_size=0)
+
+        monkeypatch.setattr(watermarks, "publish_dataframe", lambda *a, **k: pytest.fail("wrote"))
+        monkeypatch.setattr(watermarks, "upsert_dataframe", lambda *a, **k: pytest.fail("wrote"))
+        crm_sales.run_sales_pipeline("crm_sales_details", chunk_size=0)
@@ -0,0 +1,70 @@
+"""
+Writer Unit Tests
+------------------
+Tests for the shared DataFrame writer (batch sizing and write stats).
+Uses an in-memory SQLite engine — no MySQL needed.
+
+Usage:
+    cd d:\\data_engineering_project
+    python -m pytest tests/test_writer.py -v
+"""
+import logging
+import sys
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.writer import estimate_row_bytes, log_table_throughput, rows_per_batch, write_dataframe
+
+
+class TestRowsPerBatch:
+    def test_fits_packet_budget(self):
+        # 4 MiB packet, half used as budget, 200-byte rows
+        assert rows_per_batch(200, 4 * 1024 * 1024) == (2 * 1024 * 1024) // 200
+
+    def test_wide_rows_get_smaller_batches(self):
+        narrow = rows_per_batch(100, 64 * 1024 * 1024, max_rows=10**9)
+        wide = rows_per_batch(10_000, 64 * 1024 * 1024, max_rows=10**9)
+        assert wide < narrow
+
+    def test_capped_and_never_zero(self):
+        assert rows_per_batch(1, 1024 * 1024 * 1024, max_rows=500) == 500
+        assert rows_per_batch(10**9, 1024) == 1
+
+
+class TestEstimateRowBytes:
+    def test_counts_utf8_bytes_plus_overhead(self):
+        df = pd.DataFrame({"cid": ["ab", "ab"], "cntry": ["é", "é"]})
+        # 2 + 2 bytes of data plus 4 bytes overhead per value
+        assert estimate_row_bytes(df) == 4 + 2 * 4
+
+    def test_empty_frame(self):
+        assert estimate_row_bytes(pd.DataFrame()) == 1
+
+
+class TestWriteDataframe:
+    def test_writes_rows_and_reports_throughput(self):
+        engine = create_engine("sqlite://")
+        df = pd.DataFrame({"cid": [f"AW{i:08d}" for i in range(250)], "n": range(250)})
+        stats = write_dataframe(df, "erp_location_a101", engine)
+        with engine.connect() as conn:
+            count = conn.execute(text("SELECT COUNT(*) FROM erp_location_a101")).scalar()
+        assert count == 250
+        assert stats["rows"] == 250
+        assert stats["batch_rows"] >= 1
+        assert stats["rows_per_sec"] > 0
+
+    def test_chunk_writes_leave_the_summary_to_the_caller(self, caplog):
+        engine = create_engine("sqlite://")
+        df = pd.DataFrame({"cid": ["AW1", "AW2"]})
+        with caplog.at_level(logging.INFO):
+            write_dataframe(df, "t", engine, log=False)
+            write_dataframe(df, "t", engine, if_exists="append", log=False)
+            assert log_table_throughput("t", 4, 0.5, 2) == 8.0
+        lines = [r.getMessage() for r in caplog.records if r.levelno == logging.INFO]
+        assert lines == ["[WRITE] t: 4 rows in 0.50s (8 rows/s, 2 chunks)"]